@@ -20,9 +20,12 @@ from typing import Optional, Dict, List
 from playwright.sync_api import sync_playwright, TimeoutError as PWTimeoutError
 from playwright.sync_api import Page as PWPage
 import re
+from utils import warm_browser
 
 # GLOBAL PYTEST LOCK - Prevent multiple pytest processes from running
-_PYTEST_LOCK_FILE = os.path.join(os.path.dirname(__file__), '.pytest_running.lock')
+# Parallel lanes of the always-on server (PYTEST_LANE=2, 3, ...) each get their own lock files and browser
+_LANE_SUFFIX = f".lane{os.getenv('PYTEST_LANE')}" if os.getenv('PYTEST_LANE', '1') != '1' else ''
+_PYTEST_LOCK_FILE = os.path.join(os.path.dirname(__file__), f'.pytest_running{_LANE_SUFFIX}.lock')
 
 def _check_pytest_lock():
     """Check if another pytest process is running - FAIL if yes."""
@@ -30,6 +33,9 @@ def _check_pytest_lock():
         try:
             with open(_PYTEST_LOCK_FILE, 'r') as f:
                 lock_pid = int(f.read().strip())
+            # Our own lock: the warm pytest worker imports this module again for every session
+            if lock_pid == os.getpid():
+                return
             # Check if process exists
             if sys.platform == 'win32':
                 import subprocess
@@ -429,14 +435,15 @@ def wait(driver):
 _global_playwright = None
 _global_browser = None
 _browser_lock = threading.Lock()  # Lock to prevent concurrent browser creation
-_BROWSER_LOCK_FILE = os.path.join(os.path.dirname(__file__), '.browser_lock')
+_BROWSER_LOCK_FILE = os.path.join(os.path.dirname(__file__), f'.browser_lock{_LANE_SUFFIX}')
 
 @pytest.fixture(scope="session")
 def playwright_instance():
     """Start Playwright - singleton pattern to ensure only one instance"""
     global _global_playwright
     if _global_playwright is None:
-        _global_playwright = sync_playwright().start()
+        # Inside the warm pytest worker, share the Playwright instance it keeps running
+        _global_playwright = warm_browser.playwright() if warm_browser.enabled() else sync_playwright().start()
     yield _global_playwright
     # Don't stop here - let it persist for browser reuse
     # Only stop when browser is closed
@@ -501,6 +508,13 @@ def pw_browser(playwright_instance, request):
     """Launch Chrome browser for Playwright tests - SINGLETON: only one browser instance across ALL processes"""
     global _global_browser, _global_playwright, _browser_lock
     
+    # Inside the warm pytest worker, reuse the browser it keeps open between sessions
+    warm = warm_browser.current()
+    if warm is not None:
+        logger.info("Reusing warm worker browser instance")
+        yield warm
+        return
+    
     # STRICT: Use file-based lock to prevent multiple browsers across processes
     # If we can't acquire lock, FAIL - don't create browser
     if not _acquire_browser_lock(timeout=30):
@@ -524,29 +538,19 @@ def pw_browser(playwright_instance, request):
         
         # Create new browser only if one doesn't exist
         logger.info("Creating new browser instance (only one will be created across all processes)")
-        args = []
-        if MAXIMIZE_BROWSER:
-            args.append("--start-maximized")
-        else:
-            # If size/pos are provided, apply them; otherwise keep a normal window
-            # so Windows Snap (Win+Left/Right) can dock it beside the editor.
-            if PW_WINDOW_SIZE:
-                args.append(f"--window-size={PW_WINDOW_SIZE}")
-            if PW_WINDOW_POS:
-                args.append(f"--window-position={PW_WINDOW_POS}")
-        
-        # Use Chrome channel instead of Chromium for better compatibility
-        # This will use the actual Chrome browser installed on the system
         _global_browser = playwright_instance.chromium.launch(
-            channel="chrome",  # Use Chrome instead of Chromium
-            headless=False,     # Make browser visible
-            args=args
+            **warm_browser.launch_options(MAXIMIZE_BROWSER, PW_WINDOW_SIZE, PW_WINDOW_POS)
         )
         
         # Register finalizer to close browser at end of session
         def close_browser():
             global _global_browser, _global_playwright
             with _browser_lock:
+                if warm_browser.enabled():
+                    # Warm worker: keep the browser (and Playwright) running for the next session
+                    warm_browser.adopt(_global_browser)
+                    _global_browser = None
+                    _global_playwright = None
                 if _global_browser is not None:
                     try:
                         logger.info("Closing browser instance")
@@ -1932,6 +1936,14 @@ def _capture_playwright_artifacts(page: PWPage, test_name: str):
             screenshot_error = e
             logger.warning(f"JavaScript-based screenshot also failed: {e}")
     
+    # Small preview for the dashboard so it doesn't have to load the full-page PNG
+    if screenshot_captured:
+        try:
+            from utils.screenshot_thumbnails import create_thumbnail
+            create_thumbnail(screenshot_path)
+        except Exception as e:
+            logger.debug(f"Could not create screenshot thumbnail: {e}")
+
     # If screenshot still failed, create a placeholder file with error message
     if not screenshot_captured:
         try:
@@ -2465,14 +2477,11 @@ def pytest_sessionfinish(session, exitstatus):
         # This ensures dashboard updates regardless of how tests were run (UI, command line, etc.)
         try:
             logger.info("Generating unified dashboard at session end...")
-            # Minimal wait - just for log flush
-            time.sleep(0.1)  # Reduced from 1 second
+            # Results are already committed by TestLogger (flush + fsync), no wait needed
             dashboard_path = generate_unified_dashboard()
             logger.info(f"✓ Unified dashboard generated successfully: {dashboard_path}")
             html_files.append(dashboard_path)
             
-            # Minimal wait - just for file write
-            time.sleep(0.1)  # Reduced from 0.5 seconds
             logger.info("Dashboard update complete. UI will show latest status on next refresh.")
         except Exception as dashboard_err:
             logger.error(f"ERROR: Could not generate unified dashboard: {dashboard_err}")
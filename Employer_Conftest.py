@@ -1128,14 +1128,11 @@ def pytest_sessionfinish(session, exitstatus):
     # This ensures dashboard updates regardless of how tests were run (UI, command line, etc.)
     try:
         logger.info("Generating unified dashboard at session end (Employer tests)...")
-        # Minimal wait - just for log flush
-        time.sleep(0.1)  # Reduced from 1 second
+        # Results are already committed by TestLogger (flush + fsync), no wait needed
         from utils.unified_log_viewer import generate_unified_dashboard
         dashboard_path = generate_unified_dashboard()
         logger.info(f"✓ Unified dashboard generated successfully: {dashboard_path}")
         
-        # Minimal wait - just for file write
-        time.sleep(0.1)  # Reduced from 0.5 seconds
         logger.info("Dashboard update complete. UI will show latest status on next refresh.")
     except Exception as dashboard_err:
         logger.error(f"ERROR: Could not generate unified dashboard: {dashboard_err}")
@@ -7,18 +7,6 @@ echo.
 cd /d "%~dp0"
 
 echo [1/5] Removing stale lock files...
-if exist ".test_execution.lock" (
-    del ".test_execution.lock"
-    echo   Removed: .test_execution.lock
-) else (
-    echo   No .test_execution.lock found
-)
-if exist ".test_queue.lock" (
-    del ".test_queue.lock"
-    echo   Removed: .test_queue.lock
-) else (
-    echo   No .test_queue.lock found
-)
 if exist ".browser_lock" (
     del ".browser_lock"
     echo   Removed: .browser_lock
@@ -56,10 +44,11 @@ echo.
 echo [3/5] Clearing test queue...
 if exist ".test_queue.json" (
     echo {"queue": [], "last_updated": ""} > ".test_queue.json"
-    echo   Queue cleared
+    echo   Queue file cleared
 ) else (
     echo   No queue file found
 )
+python utils\run_queue.py clear
 echo.
 
 echo [4/5] Checking for running Python processes...
@@ -92,9 +81,9 @@ echo      - Close the server window (Ctrl+C)
 echo      - Run START_ALWAYS_ON_SERVER.bat again
 echo.
 echo   2. The server will now:
-echo      - Automatically remove stale locks on startup
-echo      - Only allow pytest processes to hold test locks
+echo      - Re-queue tests left running by a crashed server once their lease expires
 echo      - Process tests from the queue correctly
+echo      - Show the queue with: python utils\run_queue.py list
 echo.
 echo   3. To verify server is working:
 echo      - Run CHECK_SERVER.bat
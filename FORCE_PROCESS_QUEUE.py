@@ -7,7 +7,15 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.resolve()
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from utils.always_on_server import read_queue, process_queue, remove_lock, is_locked
+from utils import run_queue
+from utils.always_on_server import process_queue
+
+
+def show_queue(label):
+    runs = run_queue.active_runs()
+    print(f"{label}: {[(run['test_name'], run['status']) for run in runs]}")
+    print(f"Queue size: {len(runs)}")
+    return runs
 
 if __name__ == '__main__':
     print("=" * 60)
@@ -15,31 +23,27 @@ if __name__ == '__main__':
     print("=" * 60)
     print()
     
-    # Check if locked
-    if is_locked():
-        print("Queue is locked. Removing lock...")
-        remove_lock()
-        print("Lock removed.")
+    # Pick up anything written to the legacy queue file
+    imported = run_queue.import_queue_file()
+    if imported:
+        print(f"Imported from {run_queue.QUEUE_FILE.name}: {imported}")
         print()
     
     # Read queue
-    queue = read_queue()
-    print(f"Current queue: {queue}")
-    print(f"Queue size: {len(queue)}")
+    runs = show_queue("Current queue")
     print()
     
-    if not queue:
+    if not runs:
         print("Queue is empty. Nothing to process.")
         sys.exit(0)
     
+    # A run held by a dead worker is re-queued automatically once its lease expires
     print("Processing queue...")
     print()
     process_queue()
     
     # Check queue again
-    queue_after = read_queue()
     print()
-    print(f"Queue after processing: {queue_after}")
-    print(f"Remaining: {len(queue_after)}")
+    show_queue("Queue after processing")
     print()
     print("Done!")
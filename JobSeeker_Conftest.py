@@ -538,18 +538,10 @@ def _refresh_dashboard_after_test(test_name: str, outcome: str):
         # Import here to avoid circular imports
         import subprocess
         import sys
-        import time
         from pathlib import Path
         
-        # Minimal delay - just enough for log flush (reduced from 5.0 to 0.5 seconds)
-        time.sleep(0.5)
-        
-        # Force log file flush by importing logging and flushing all handlers
-        import logging
-        root_logger = logging.getLogger()
-        for handler in root_logger.handlers:
-            if hasattr(handler, 'flush'):
-                handler.flush()
+        # No flush delay: TestLogger.log_test_end already flushed + fsynced the
+        # log and published a "result committed" record before we got here.
         
         project_root = Path(__file__).parent
         
@@ -633,6 +625,11 @@ def pytest_runtest_makereport(item, call):
                     if page and not page.is_closed():
                         page.screenshot(path=screenshot_path)
                         logger.info(f"Captured failure screenshot: {screenshot_path}")
+                        try:
+                            from utils.screenshot_thumbnails import create_thumbnail
+                            create_thumbnail(screenshot_path)
+                        except Exception as thumb_e:
+                            logger.debug(f"Could not create screenshot thumbnail: {thumb_e}")
                         
                         # Log HTML link for the dashboard/log viewer
                         # Use relative path for portability in HTML report
@@ -674,14 +671,11 @@ def pytest_sessionfinish(session, exitstatus):
     # This ensures dashboard updates regardless of how tests were run (UI, command line, etc.)
     try:
         logger.info("Generating unified dashboard at session end (Job Seeker tests)...")
-        # Wait a moment to ensure all log files are fully written
-        time.sleep(1)
+        # Results are already committed by TestLogger (flush + fsync), no wait needed
         from utils.unified_log_viewer import generate_unified_dashboard
         dashboard_path = generate_unified_dashboard()
         logger.info(f"✓ Unified dashboard generated successfully: {dashboard_path}")
         
-        # Additional wait to ensure file is written to disk
-        time.sleep(0.5)
         logger.info("Dashboard update complete. UI will show latest status on next refresh.")
     except Exception as dashboard_err:
         logger.error(f"ERROR: Could not generate unified dashboard: {dashboard_err}")
@@ -10,12 +10,13 @@ echo Done.
 
 echo [2/3] Cleaning up lock files...
 cd /d "%~dp0"
-if exist ".test_execution.lock" del ".test_execution.lock"
-if exist ".test_queue.lock" del ".test_queue.lock"
 if exist ".browser_lock" del ".browser_lock"
 if exist ".pytest_running.lock" del ".pytest_running.lock"
 if exist ".always_on_server.pid" del ".always_on_server.pid"
 if exist ".test_queue.json" echo {"queue": [], "last_updated": ""} > ".test_queue.json"
+if exist ".test_queue.db" del ".test_queue.db"
+if exist ".test_queue.db-wal" del ".test_queue.db-wal"
+if exist ".test_queue.db-shm" del ".test_queue.db-shm"
 echo Done.
 
 echo [3/3] Starting Dashboard Server...
@@ -0,0 +1,11 @@
+@echo off
+echo Starting Warm Pytest Worker...
+echo.
+echo This keeps pytest, Playwright and the browser loaded between test runs.
+echo The always-on server sends queued tests here while this window is open.
+echo.
+echo Press Ctrl+C to stop the worker.
+echo.
+cd /d "%~dp0"
+python utils\warm_pytest_worker.py
+pause
@@ -1,67 +1,45 @@
 #!/usr/bin/env python3
 """
-Continuous Test Runner - Runs ALL test suites sequentially
-BenchSale Admin → BenchSale Recruiter → Employer → JobSeeker
+Continuous Test Runner - Runs ALL test suites
+BenchSale Admin → BenchSale Recruiter, alongside Employer → JobSeeker
+
+Suites run as parallel pytest processes where they don't conflict; the
+dependency and conflict graph is SUITES in utils/suite_orchestrator.py.
+
+Usage:
+    python run_all_test_suites_continuous.py                 # parallel
+    python run_all_test_suites_continuous.py --sequential    # one suite at a time, live output
+    python run_all_test_suites_continuous.py --max-parallel 2
 """
-import subprocess
-import sys
-import os
-from pathlib import Path
+import argparse
+import time
 
-def run_test_suite(suite_name, test_path):
-    """Run a test suite and return success status"""
-    print("\n" + "="*80)
-    print(f"Running {suite_name}...")
-    print("="*80 + "\n")
-    
-    cmd = [
-        sys.executable, "-m", "pytest", 
-        test_path, 
-        "-v", 
-        "--tb=short",
-        "--maxfail=0",
-        "--continue-on-collection-errors"
-    ]
-    
-    result = subprocess.run(cmd, cwd=os.path.dirname(os.path.abspath(__file__)))
-    return result.returncode == 0
+from utils import suite_orchestrator
 
 def main():
     """Run all test suites"""
+    parser = argparse.ArgumentParser(description='Run all test suites')
+    parser.add_argument('--sequential', action='store_true', help='Run one suite at a time, in order, with live output')
+    parser.add_argument('--max-parallel', type=int, default=suite_orchestrator.MAX_PARALLEL,
+                        help='Max suites running at once (default: as many as the conflict graph allows)')
+    args = parser.parse_args()
+    max_parallel = 1 if args.sequential else args.max_parallel
+    
     print("\n")
     print("="*80)
     print("  CONTINUOUS TEST RUNNER - ALL TEST SUITES".center(80))
     print("="*80)
-    print("  Running: BenchSale Admin -> BenchSale Recruiter -> Employer -> JobSeeker".center(80))
+    if max_parallel == 1:
+        print("  Running: BenchSale Admin -> BenchSale Recruiter -> Employer -> JobSeeker".center(80))
+    else:
+        print("  Running: BenchSale Admin -> BenchSale Recruiter | Employer -> JobSeeker (in parallel)".center(80))
     print("="*80 + "\n")
     
-    suites = [
-        ("BENCHSALE ADMIN TESTS", "tests/benchsale/test_benchsale_admin_test_cases.py"),
-        ("BENCHSALE RECRUITER TESTS", "tests/benchsale/test_benchsale_recruiter_test_cases.py"),
-        ("EMPLOYER TESTS", "tests/employer/test_employer_test_cases.py"),
-        ("JOBSEEKER TESTS", "tests/jobseeker/"),  # Run all test files in jobseeker directory
-    ]
-    
-    results = {}
-    
-    for suite_name, test_path in suites:
-        print(f"\n\n{'='*80}")
-        print(f"EXECUTING: {suite_name}")
-        print(f"{'='*80}\n")
-        success = run_test_suite(suite_name, test_path)
-        results[suite_name] = "PASSED" if success else "FAILED"
-        
-        # Small pause between suites to allow browser cleanup
-        import time
-        time.sleep(2)
+    started = time.time()
+    results = suite_orchestrator.run_suites(max_parallel=max_parallel)
     
     # Print summary
-    print("\n\n" + "="*80)
-    print("TEST EXECUTION SUMMARY".center(80))
-    print("="*80)
-    for suite_name, status in results.items():
-        print(f"{suite_name:<50} {status}")
-    print("="*80)
+    suite_orchestrator.print_summary(results, time.time() - started)
     
     # Refresh dashboard
     print("\nRefreshing dashboard...")
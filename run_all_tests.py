@@ -2,47 +2,24 @@
 Sequential Test Runner - Runs Admin tests first, then Recruiter tests
 Usage:
     python run_all_tests.py
+
+The Recruiter suite works on the data the Admin suite sets up, so they stay in
+order (see SUITES in utils/suite_orchestrator.py).
 """
 
-import subprocess
 import sys
+import time
 from pathlib import Path
 
+from utils import suite_orchestrator
 
-def run_tests(test_path, test_type):
-    """Run pytest for a specific test file"""
-    print("\n" + "=" * 80)
-    print(f"Running {test_type} Tests...")
-    print("=" * 80)
-    print(f"Test file: {test_path}")
-    print("=" * 80 + "\n")
-    
-    try:
-        # Run pytest with verbose output
-        result = subprocess.run(
-            [sys.executable, "-m", "pytest", str(test_path), "-v", "-s"],
-            cwd=Path(__file__).parent,
-            check=False  # Don't fail if tests fail, just continue
-        )
-        
-        print("\n" + "=" * 80)
-        print(f"{test_type} Tests Completed")
-        print(f"Exit code: {result.returncode}")
-        print("=" * 80 + "\n")
-        
-        return result.returncode
-    except Exception as e:
-        print(f"\n[ERROR] Failed to run {test_type} tests: {e}\n")
-        return 1
+SUITE_KEYS = ['benchsale_admin', 'benchsale_recruiter']
 
 
 def main():
     """Main function to run tests sequentially"""
     project_root = Path(__file__).parent
     
-    admin_test_file = project_root / "tests" / "benchsale" / "test_benchsale_admin_test_cases.py"
-    recruiter_test_file = project_root / "tests" / "benchsale" / "test_benchsale_recruiter_test_cases.py"
-    
     print("\n" + "=" * 80)
     print("BenchSale Sequential Test Runner")
     print("=" * 80)
@@ -52,35 +29,20 @@ def main():
     print("=" * 80 + "\n")
     
     # Verify test files exist
-    if not admin_test_file.exists():
-        print(f"[ERROR] Admin test file not found: {admin_test_file}")
-        sys.exit(1)
+    for key in SUITE_KEYS:
+        test_file = project_root / suite_orchestrator.SUITES[key]['path']
+        if not test_file.exists():
+            print(f"[ERROR] {suite_orchestrator.SUITES[key]['name']} file not found: {test_file}")
+            sys.exit(1)
     
-    if not recruiter_test_file.exists():
-        print(f"[ERROR] Recruiter test file not found: {recruiter_test_file}")
-        sys.exit(1)
-    
-    # Run Admin tests first
-    admin_exit_code = run_tests(admin_test_file, "Admin")
-    
-    # Wait a moment between test runs
-    print("\nWaiting 3 seconds before starting Recruiter tests...\n")
-    import time
-    time.sleep(3)
-    
-    # Run Recruiter tests second
-    recruiter_exit_code = run_tests(recruiter_test_file, "Recruiter")
+    started = time.time()
+    results = suite_orchestrator.run_suites(SUITE_KEYS)
     
     # Final summary
-    print("\n" + "=" * 80)
-    print("Test Execution Summary")
-    print("=" * 80)
-    print(f"Admin Tests:    {'PASSED' if admin_exit_code == 0 else 'FAILED'} (exit code: {admin_exit_code})")
-    print(f"Recruiter Tests: {'PASSED' if recruiter_exit_code == 0 else 'FAILED'} (exit code: {recruiter_exit_code})")
-    print("=" * 80)
+    suite_orchestrator.print_summary(results, time.time() - started)
     
     # Return combined exit code (0 if both passed, 1 if any failed)
-    final_exit_code = 0 if (admin_exit_code == 0 and recruiter_exit_code == 0) else 1
+    final_exit_code = 0 if all(result['status'] == 'PASSED' for result in results.values()) else 1
     print(f"\nOverall Status: {'ALL TESTS PASSED' if final_exit_code == 0 else 'SOME TESTS FAILED'}")
     print("=" * 80 + "\n")
     
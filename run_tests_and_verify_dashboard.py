@@ -12,8 +12,10 @@ from datetime import datetime
 from typing import Tuple, Dict
 import re
 
+from utils import test_discovery
+
 PROJECT_ROOT = Path(__file__).parent
-DASHBOARD_PATH = PROJECT_ROOT / 'logs' / 'index.html'
+DASHBOARD_PATH = PROJECT_ROOT / 'logs' / 'dashboard-data.json'
 
 # Test cases to run (one from each category first)
 TEST_CASES = {
@@ -43,7 +45,7 @@ def run_test(test_name: str) -> Tuple[bool, str]:
     cmd = [
         sys.executable,
         '-m', 'pytest',
-        '-k', test_name,
+        *test_discovery.pytest_selection(test_name),
         '-v',
         '--tb=short',
     ]
@@ -146,12 +148,10 @@ def check_test_status_in_dashboard(test_name: str) -> Dict:
                     status = 'SKIP'
                 break
         
-        # Also check for test in JSON data if present
-        json_match = re.search(r'var\s+testData\s*=\s*(\[.*?\]);', content, re.DOTALL)
-        if json_match and not found:
+        # Also check the structured test entries (dashboard-data.json)
+        if not found:
             try:
-                json_str = json_match.group(1)
-                test_data = json.loads(json_str)
+                test_data = [entry.get('info', {}) for entry in json.loads(content).get('tests', [])]
                 for test in test_data:
                     if test_name.lower() in str(test).lower() or display_name.lower() in str(test).lower():
                         found = True
@@ -0,0 +1,363 @@
+"""
+Log Parser Benchmark
+====================
+Compares the streaming parse_test_results_from_log against the previous
+look-ahead implementation on a synthetic TestLogger-style log.
+
+Usage:
+    python scripts/benchmark_log_parser.py                  # 100 MB log
+    python scripts/benchmark_log_parser.py --size-mb 10
+    python scripts/benchmark_log_parser.py --legacy-size-mb 0   # skip the legacy run
+    python scripts/benchmark_log_parser.py --memory             # also report peak memory (slower)
+
+The legacy parser is quadratic on logs with many db_solr_sync runs, so it is
+timed on a smaller log (--legacy-size-mb) and both parsers are run on it to
+check that non-sync results are identical.
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path so imports work regardless of where script is run from
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from utils.unified_log_viewer import parse_test_results_from_log, _is_false_positive_failure
+
+PROJECT_ROOT = project_root
+
+TEST_NAMES = [f"test_t1_{i:02d}_home_page_check_{i}" for i in range(1, 30)] + [
+    "test_t1_09_db_solr_sync_verification",
+]
+
+
+def write_synthetic_log(path: Path, size_mb: float, seed: int = 7) -> int:
+    """Write a TestLogger-style log of roughly `size_mb` MB. Returns the number of test results."""
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    written = 0
+    results = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        while written < target:
+            name = rng.choice(TEST_NAMES)
+            status = rng.choice(['PASS', 'PASS', 'PASS', 'FAIL', 'SKIP'])
+            stamp = f"2026-10-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00,000"
+            lines = [
+                f"{stamp} - INFO - " + "=" * 100,
+                f"{stamp} - INFO - TEST {name}",
+                f"{stamp} - INFO - Start: 20261018 10:00:00.000",
+            ]
+            for step in range(rng.randint(20, 200)):
+                lines.append(f"{stamp} - INFO - 00:00:01.{step:03d}KEYWORD Click //div[@id='item-{step}']")
+            if 'db_solr_sync' in name:
+                lines.append(f"{stamp} - INFO - Total Jobs Available in DB (last 12h): {rng.randint(100, 900)}")
+                lines.append(f"{stamp} - ERROR - Total Failures: {rng.randint(0, 50)}")
+            lines.append(f"{stamp} - INFO - Full Name: {name}")
+            lines.append(f"{stamp} - INFO - Start / End / Elapsed: 20261018 10:00:00.000 / 20261018 10:01:00.000 / 00:01:{rng.randint(0, 59):02d}.000")
+            lines.append(f"{stamp} - INFO - TEST {name}: {status}")
+            lines.append(f"{stamp} - INFO - Status: {status}")
+            if status == 'FAIL':
+                lines.append(f"{stamp} - INFO - Message: AssertionError: element not visible")
+                lines.append(f"{stamp} - INFO - Locator/XPath hint: //button[@id='submit']")
+                lines.append("tests/jobseeker/test_jobseeker_test_cases.py:120: in test_case")
+            chunk = "\n".join(lines) + "\n"
+            f.write(chunk)
+            written += len(chunk)
+            results += 1
+    return results
+
+
+def time_parser(parser, path: Path, track_memory: bool = False):
+    """Run `parser` on `path`. Returns (results, seconds, peak_bytes or None)."""
+    if track_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    results = parser(str(path))
+    elapsed = time.perf_counter() - start
+    peak = None
+    if track_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return results, elapsed, peak
+
+
+def format_peak(peak) -> str:
+    return f"  peak {peak / 1024 / 1024:8.1f} MB" if peak is not None else ""
+
+
+def legacy_parse_test_results_from_log(log_file_path: str):
+    """Previous implementation (whole file in memory + per-test look-ahead), kept for comparison."""
+    # Get project root for resolving JSON file paths
+    project_root = PROJECT_ROOT
+    
+    tests = []
+    current_test = None
+    
+    # Match patterns like:
+    # "TEST test_name: PASS" or "TEST test_name: FAIL" or "TEST test_name: SKIP"
+    # Also match "Status: PASS", "Status: FAIL", "Status: SKIP" on separate lines
+    test_pattern = re.compile(r'TEST\s+([^:]+):\s*(PASS|FAIL|SKIP)', re.IGNORECASE)
+    status_pattern = re.compile(r'^Status:\s*(PASS|FAIL|SKIP)', re.IGNORECASE)
+    elapsed_pattern = re.compile(
+        r"Start\s*/\s*End\s*/\s*Elapsed:\s*[^/]+/\s*[^/]+/\s*([0-9:.]+)",
+        re.IGNORECASE
+    )
+    runtime_seconds_pattern = re.compile(r"Runtime for .*?:\s*([0-9.]+)\s+seconds", re.IGNORECASE)
+    
+    # Also check for test statistics table format (fallback for collected but not executed tests)
+    stats_pattern = re.compile(r'(\d+)\s+tests?\s+total,\s+(\d+)\s+passed,\s+(\d+)\s+failed,\s+(\d+)\s+skipped', re.IGNORECASE)
+    total_tests_collected = None
+    actual_test_results_found = 0  # Count of actual "TEST <name>: PASS/FAIL/SKIP" entries
+    stats_tests_executed = 0
+    
+    try:
+        with open(log_file_path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+            for line_no, line in enumerate(lines, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                
+                # Match test result lines like "TEST T1.01 Home Page: PASS" or "TEST test_t1_01_home_page: PASS"
+                # Also handle format where TEST and status are on separate lines
+                match = test_pattern.search(line)
+                if match:
+                    test_name = match.group(1).strip()
+                    status = match.group(2).upper()
+                    
+                    # Also check if there's a "Status: FAIL" line right after (within next 5 lines)
+                    # This handles cases where status is on a separate line
+                    if line_no < len(lines):
+                        for next_idx in range(line_no, min(line_no + 5, len(lines))):
+                            if next_idx < len(lines):
+                                next_line = lines[next_idx].strip()
+                                status_match = status_pattern.search(next_line)
+                                if status_match:
+                                    status = status_match.group(1).upper()
+                                    break
+                    
+                    # Skip invalid Employer tests (not in JnP_final.robot)
+                    # Filter out test_e1_01_employer1_dashboard_verification and similar invalid tests
+                    test_name_lower = test_name.lower()
+                    invalid_patterns = ['test_e1_01', 'test_e2_01', 'e1_01', 'e2_01', 
+                                       'employer1_dashboard_verification', 'employer2_dashboard_verification']
+                    if any(pattern in test_name_lower for pattern in invalid_patterns):
+                        continue  # Skip this invalid test
+                    
+                    actual_test_results_found += 1
+                    
+                    # Try to extract additional information from surrounding lines
+                    running_time = 'N/A'
+                    failure_message = ''
+                    failure_location = ''
+                    xpath = ''
+                    total_jobs = 0
+                    error_jobs_count = 0
+                    
+                    # For db_solr_sync test, search entire log file for job report data (it's logged much later)
+                    search_range = len(lines) if 'db_solr_sync' in test_name.lower() else min(line_no + 120, len(lines))
+                    
+                    # Look ahead for elapsed/runtime + failure details + xpath hint + job report data
+                    # This is used for BOTH PASS and FAIL so runtime always shows in the right panel.
+                    for i in range(line_no, search_range):
+                        if i < len(lines):
+                            next_line = lines[i].strip()
+                            # Stop if another test starts (but continue for db_solr_sync to find job report data)
+                            if i != line_no and test_pattern.search(next_line) and 'db_solr_sync' not in test_name.lower():
+                                break
+                            # Prefer the elapsed format from test_logger
+                            m_elapsed = elapsed_pattern.search(next_line)
+                            if m_elapsed and running_time == 'N/A':
+                                running_time = m_elapsed.group(1).strip()
+                            # Fallback: runtime seconds line from runtime measurement
+                            if running_time == 'N/A':
+                                m_rt = runtime_seconds_pattern.search(next_line)
+                                if m_rt:
+                                    running_time = f"{m_rt.group(1).strip()} seconds"
+                            
+                            # Extract 12hrs job report data for db_solr_sync test
+                            if 'db_solr_sync' in test_name.lower():
+                                # Look for "Total Jobs Available in DB (last 12h): X" or "Jobs Actually Checked: X"
+                                if 'Total Jobs Available in DB' in next_line or 'Jobs Actually Checked:' in next_line:
+                                    jobs_match = re.search(r'(?:Total Jobs Available in DB \(last 12h\):|Jobs Actually Checked:)\s*(\d+)', next_line, re.IGNORECASE)
+                                    if jobs_match and total_jobs == 0:
+                                        total_jobs = int(jobs_match.group(1))
+                                # Look for "Total Failures: X" (fallback - will be overridden by JSON if available)
+                                if 'Total Failures:' in next_line:
+                                    failures_match = re.search(r'Total Failures:\s*(\d+)', next_line, re.IGNORECASE)
+                                    if failures_match:
+                                        error_jobs_count = int(failures_match.group(1))
+
+                    if status == 'FAIL':
+                        # Prefer the "Message:" block written by the test logger / conftest hook.
+                        capture = []
+                        capture_started = False
+                        for i in range(line_no, min(line_no + 120, len(lines))):
+                            if i < len(lines):
+                                next_line = lines[i].strip()
+                                # Stop if another test starts
+                                if test_pattern.search(next_line):
+                                    break
+
+                                # Capture from "Message:" or "Error details:" onwards
+                                if ("Message:" in next_line) or ("Error details:" in next_line) or ("E   " in next_line) or ("Traceback" in next_line):
+                                    capture_started = True
+                                if capture_started:
+                                    # Strip noisy timestamp prefixes if present
+                                    cleaned = re.sub(r"^\d{4}-\d{2}-\d{2}.*?:\s*", "", next_line)
+                                    capture.append(cleaned)
+
+                                # Extract locator hint if available (we add this in BenchSale_Conftest)
+                                if not xpath:
+                                    m_hint = re.search(r"Locator/XPath hint:\s*(.+)$", next_line, re.IGNORECASE)
+                                    if m_hint:
+                                        xpath = m_hint.group(1).strip()
+                                if not xpath:
+                                    xpath_match = re.search(r"(xpath=[^\s]+)", next_line, re.IGNORECASE)
+                                    if xpath_match:
+                                        xpath = xpath_match.group(1).strip()
+
+                                # Extract failure location (first "file.py:line:" frame)
+                                if not failure_location:
+                                    loc_match = re.search(r"([A-Za-z0-9_\\./-]+\.py:\d+:\s+in\s+.+)$", next_line)
+                                    if loc_match:
+                                        failure_location = loc_match.group(1).strip()
+
+                        if capture:
+                            # Keep a readable multi-line failure message
+                            # Remove leading "Message:" label if present in first line
+                            if capture[0].lower().startswith("message:"):
+                                capture[0] = capture[0][len("message:"):].strip()
+                            failure_message = "\n".join(capture).strip()
+
+                    # Backward fallback (sometimes elapsed line appears just before TEST ...: PASS/FAIL)
+                    if running_time == 'N/A':
+                        for back in range(max(0, line_no - 50), line_no):
+                            prev = lines[back].strip()
+                            m_elapsed = elapsed_pattern.search(prev)
+                            if m_elapsed:
+                                running_time = m_elapsed.group(1).strip()
+                                break
+                            m_rt = runtime_seconds_pattern.search(prev)
+                            if m_rt:
+                                running_time = f"{m_rt.group(1).strip()} seconds"
+                                break
+                    
+                    test_entry = {
+                        'name': test_name,
+                        'status': status,
+                        'line': line_no,
+                        'raw_line': line,
+                        'running_time': running_time,
+                        'failure_message': failure_message,
+                        'failure_location': failure_location,
+                        'xpath': xpath
+                    }
+                    
+                    # For db_solr_sync test, read filtered count from JSON file (same as log_history_api.py)
+                    json_read_success = False
+                    if 'db_solr_sync' in test_name.lower():
+                        json_failure_path = project_root / 'reports' / 'db_solr_sync_failures.json'
+                        if json_failure_path.exists():
+                            try:
+                                with open(json_failure_path, 'r', encoding='utf-8') as f:
+                                    json_data = json.load(f)
+                                # Get total jobs from JSON
+                                json_total_jobs = json_data.get('total_jobs_checked', json_data.get('total_jobs_available', 0))
+                                if json_total_jobs > 0:
+                                    total_jobs = json_total_jobs
+                                
+                                # Filter failures using same logic as log_history_api.py
+                                failures_list = json_data.get('failures', [])
+                                filtered_failures = []
+                                for f in failures_list:
+                                    if not _is_false_positive_failure(f):
+                                        filtered_failures.append(f)
+                                
+                                # Use filtered count instead of unfiltered count from log
+                                filtered_error_count = len(filtered_failures)
+                                # Always use filtered count (even if 0) to override log file count
+                                error_jobs_count = filtered_error_count
+                                json_read_success = True
+                            except Exception as e:
+                                # If JSON read fails, fall back to log file count
+                                print(f"Warning: Could not read JSON file for {test_name}: {e}")
+                    
+                    # Add 12hrs job report data for db_solr_sync test
+                    if total_jobs > 0:
+                        test_entry['total_jobs'] = total_jobs
+                    # For db_solr_sync test, always include error_jobs_count if JSON was read (even if 0)
+                    # For other tests, only include if > 0
+                    if 'db_solr_sync' in test_name.lower() and json_read_success:
+                        test_entry['error_jobs_count'] = error_jobs_count
+                    elif error_jobs_count > 0:
+                        test_entry['error_jobs_count'] = error_jobs_count
+                    
+                    tests.append(test_entry)
+                
+                # Check for test statistics to detect if tests were collected but not executed
+                stats_match = stats_pattern.search(line)
+                if stats_match:
+                    total_tests_collected = int(stats_match.group(1))
+                    passed = int(stats_match.group(2))
+                    failed = int(stats_match.group(3))
+                    skipped = int(stats_match.group(4))
+                    stats_tests_executed = passed + failed + skipped
+        
+        # Only show warning if NO actual test results were found AND statistics show 0 executed
+        # This prevents false warnings when tests were actually executed
+        if actual_test_results_found == 0 and total_tests_collected and total_tests_collected > 0:
+            # Check the last statistics line to see if tests were executed
+            if stats_tests_executed == 0:
+                tests.append({
+                    'name': f'⚠️ {total_tests_collected} tests collected but not executed. Please run the tests to see results.',
+                    'status': 'SKIP',
+                    'line': 0,
+                    'raw_line': f'Status: {total_tests_collected} tests total, 0 passed, 0 failed, 0 skipped'
+                })
+            
+    except Exception as e:
+        print(f"Error parsing log file {log_file_path}: {e}")
+    
+    return tests
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parse_test_results_from_log")
+    parser.add_argument('--size-mb', type=float, default=100, help="Size of the synthetic log for the streaming parser")
+    parser.add_argument('--legacy-size-mb', type=float, default=5, help="Size of the log used to time the legacy parser (0 to skip)")
+    parser.add_argument('--memory', action='store_true', help="Report peak Python memory (tracemalloc slows parsing down)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+
+        if args.legacy_size_mb > 0:
+            small_log = tmp_dir / 'small.log'
+            count = write_synthetic_log(small_log, args.legacy_size_mb)
+            new_results, new_time, new_peak = time_parser(parse_test_results_from_log, small_log, args.memory)
+            old_results, old_time, old_peak = time_parser(legacy_parse_test_results_from_log, small_log, args.memory)
+            non_sync = lambda rows: [r for r in rows if 'db_solr_sync' not in r['name']]
+            same = non_sync(new_results) == non_sync(old_results)
+            print(f"{args.legacy_size_mb:g} MB log, {count} results")
+            print(f"  legacy    : {old_time:8.2f}s{format_peak(old_peak)}")
+            print(f"  streaming : {new_time:8.2f}s{format_peak(new_peak)}")
+            print(f"  non-sync results identical: {same}")
+
+        big_log = tmp_dir / 'big.log'
+        count = write_synthetic_log(big_log, args.size_mb)
+        results, elapsed, peak = time_parser(parse_test_results_from_log, big_log, args.memory)
+        print(f"{args.size_mb:g} MB log, {count} results")
+        print(f"  streaming : {elapsed:8.2f}s{format_peak(peak)}  ({len(results)} parsed)")
+
+
+if __name__ == '__main__':
+    main()
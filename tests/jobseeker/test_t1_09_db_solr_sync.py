@@ -4,6 +4,7 @@ import mysql.connector
 import pysolr
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from utils.connections import connections
+from utils import skills_similarity
 from pathlib import Path
 import json
 import logging
@@ -57,6 +58,10 @@ def get_db_data():
         pytest.fail(f"Database error: {err}")
         return [], None
 
+# Fields where an empty DB value is not a real sync failure
+EMPTY_DB_FALSE_POSITIVE_FIELDS = ('statename', 'cityname')
+
+
 def check_solr_job(job_db_data, solr_instance):
     """
     Verifies a single job in Solr. 
@@ -234,6 +239,20 @@ def check_solr_job(job_db_data, solr_instance):
         if len(results) > 0:
             doc = results.docs[0]
             mismatches = []
+            # Structured verdict per mismatch so report consumers don't re-parse messages
+            mismatch_details = []
+
+            def _add_mismatch(msg, field, db_value, solr_value, category,
+                              similarity=None, is_false_positive=False):
+                mismatches.append(msg)
+                mismatch_details.append({
+                    "field": field,
+                    "db_value": db_value,
+                    "solr_value": solr_value,
+                    "similarity": round(similarity, 2) if similarity is not None else None,
+                    "is_false_positive": is_false_positive,
+                    "category": category,
+                })
             
             # 1. Title Check (handle list in Solr) - CASE INSENSITIVE
             solr_title = doc.get('title')
@@ -255,7 +274,10 @@ def check_solr_job(job_db_data, solr_instance):
             
             # If Solr title is missing (N/A), that's a clear mismatch
             if solr_title_is_missing:
-                mismatches.append(f"title: DB='{db_title_original[:100]}' != Solr='N/A' (Title missing in Solr)")
+                _add_mismatch(
+                    f"title: DB='{db_title_original[:100]}' != Solr='N/A' (Title missing in Solr)",
+                    'title', db_title_original, None, 'missing_in_solr'
+                )
             else:
                 # Clean title - replace ALL types of spaces (normal U+0020, non-breaking U+00A0, etc.) with normal space
                 # This handles: normal space ' ' (U+0020), non-breaking space ' ' (U+00A0), thin space (U+2009), etc.
@@ -325,7 +347,7 @@ def check_solr_job(job_db_data, solr_instance):
                                 error_msg += f" | First diff at pos {pos}: DB='{db_normalized[pos:pos+20]}' vs Solr='{solr_normalized[pos:pos+20]}'"
                                 break
                         
-                        mismatches.append(error_msg)
+                        _add_mismatch(error_msg, 'title', db_title_original, solr_title_original, 'value_mismatch')
 
             # 2. Check other fields
             for db_col, solr_field in fields_to_check.items():
@@ -410,8 +432,9 @@ def check_solr_job(job_db_data, solr_instance):
                     # If DB is empty but Solr has values, it's a mismatch
                     if db_val_normalized is None:
                         if remote_normalized is not None:
-                            mismatches.append(
-                                "Work Mode: DB is empty but Solr has value"
+                            _add_mismatch(
+                                "Work Mode: DB is empty but Solr has value",
+                                db_col, None, remote_normalized, 'db_empty'
                             )
                         continue
 
@@ -426,7 +449,10 @@ def check_solr_job(job_db_data, solr_instance):
                     db_display = db_mode_map.get(db_val_normalized, f'Unknown({db_val})')
 
                     solr_display = db_mode_map.get(remote_normalized, f'Unknown({solr_remote_val})')
-                    mismatches.append(f"Work Mode: DB={db_display}, Solr={solr_display} (from Solr field: remote)")
+                    _add_mismatch(
+                        f"Work Mode: DB={db_display}, Solr={solr_display} (from Solr field: remote)",
+                        db_col, db_val_normalized, remote_normalized, 'value_mismatch'
+                    )
 
                     continue
                 
@@ -461,7 +487,17 @@ def check_solr_job(job_db_data, solr_instance):
                     continue
                 if db_str == '' or solr_str == '':
                     field_name = db_col.replace('_', ' ').title()
-                    mismatches.append(f"{field_name}: DB='{db_str or 'N/A'}' != Solr='{solr_display}'")
+                    if db_str == '':
+                        _add_mismatch(
+                            f"{field_name}: DB='N/A' != Solr='{solr_display}'",
+                            db_col, None, solr_str, 'db_empty',
+                            is_false_positive=db_col in EMPTY_DB_FALSE_POSITIVE_FIELDS
+                        )
+                    else:
+                        _add_mismatch(
+                            f"{field_name}: DB='{db_str}' != Solr='N/A'",
+                            db_col, db_str, None, 'missing_in_solr'
+                        )
                     continue
                 
                 # Special handling for ai_skills - allow 70% DB coverage (aligned with UI filtering)
@@ -502,9 +538,17 @@ def check_solr_job(job_db_data, solr_instance):
                             logger.debug(f"    Missing in Solr: {sorted(db_set_debug - solr_set_debug)}")
                             logger.debug(f"    Extra in Solr: {sorted(solr_set_debug - db_set_debug)}")
                     
-                    db_skills_display = db_str[:100] + '...' if len(db_str) > 100 else db_str
-                    solr_skills_display = solr_str[:100] + '...' if len(solr_str) > 100 else solr_str
-                    mismatches.append(f"{db_col}: '{db_skills_display}' != '{solr_skills_display}'")
+                    db_skills_display = skills_similarity.display(db_str)
+                    solr_skills_display = skills_similarity.display(solr_str)
+                    # Judged on the strings in the message, like the dashboards' fallback for older reports
+                    similarity = skills_similarity.skills_similarity(db_skills_display, solr_skills_display)
+                    is_similar = similarity >= skills_similarity.FALSE_POSITIVE_SIMILARITY
+                    _add_mismatch(
+                        f"{db_col}: '{db_skills_display}' != '{solr_skills_display}'",
+                        db_col, db_str, solr_str,
+                        'skills_similar' if is_similar else 'skills_mismatch',
+                        similarity=similarity, is_false_positive=is_similar
+                    )
                     continue
 
                 # Case-insensitive comparison for location fields (avoid false positives)
@@ -526,25 +570,42 @@ def check_solr_job(job_db_data, solr_instance):
                         
                         # Only report mismatch if domains don't match
                         if db_domain != solr_domain:
-                            mismatches.append(f"Job Link Domain Mismatch: DB={db_domain}, Solr={solr_domain}")
+                            _add_mismatch(
+                                f"Job Link Domain Mismatch: DB={db_domain}, Solr={solr_domain}",
+                                db_col, db_domain, solr_domain, 'link_domain_mismatch'
+                            )
                         # If domains match, no mismatch - skip adding to mismatches
                     else:
                         field_name = db_col.replace('_', ' ').title()
                         db_display_formatted = db_str[:40] + '...' if len(db_str) > 40 else db_str
                         solr_display_formatted = solr_display[:40] + '...' if len(solr_display) > 40 else solr_display
-                        mismatches.append(f"{field_name}: DB='{db_display_formatted}' != Solr='{solr_display_formatted}'")
+                        _add_mismatch(
+                            f"{field_name}: DB='{db_display_formatted}' != Solr='{solr_display_formatted}'",
+                            db_col, db_str, solr_str, 'value_mismatch'
+                        )
 
             if not mismatches:
                 return {"id": job_db_data['id'], "status": "PASS", "msg": "Match"}
             else:
                 # Format error message clearly - use separator for readability
                 formatted_msg = " | ".join(mismatches)
+                # A failure is a false positive if any of its mismatches is one
+                # (same rule the dashboard applied when parsing the message)
+                false_positives = [d for d in mismatch_details if d['is_false_positive']]
+                primary = false_positives[0] if false_positives else mismatch_details[0]
                 return {
                     "id": job_db_data['id'], 
                     "status": "FAIL", 
                     "msg": formatted_msg,
                     "db_title": job_db_data['title'],
-                    "mismatches": mismatches
+                    "mismatches": mismatches,
+                    "mismatch_details": mismatch_details,
+                    "field": primary['field'],
+                    "db_value": primary['db_value'],
+                    "solr_value": primary['solr_value'],
+                    "similarity": primary['similarity'],
+                    "is_false_positive": bool(false_positives),
+                    "category": primary['category'],
                 }
         else:
             # Job not found in Solr - SKIP this job (not an error, just not synced yet)
@@ -563,7 +624,9 @@ def check_solr_job(job_db_data, solr_instance):
             "id": job_db_data['id'], 
             "status": "ERROR", 
             "msg": error_msg,
-            "db_title": job_db_data.get('title', 'N/A')
+            "db_title": job_db_data.get('title', 'N/A'),
+            "is_false_positive": False,
+            "category": "solr_error"
         }
 
 @pytest.mark.async_solr_check
@@ -675,6 +738,7 @@ def test_t1_09_db_solr_sync_verification():
             "total_jobs_available": total_jobs,
             "total_jobs_checked": len(jobs_to_check),
             "total_failures": len(failures),
+            "false_positive_count": sum(1 for f in failures if f.get('is_false_positive')),
             "failures": failures,  # Always write current failures list (may be empty)
         }
         # Use "w" mode to completely replace file (not append)
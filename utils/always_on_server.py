@@ -1,6 +1,6 @@
 """
 Always-On Test Server - Runs in background and automatically processes test requests.
-This server should be started once and kept running. It watches the queue file and runs tests automatically.
+This server should be started once and kept running. It claims tests from the run queue (utils/run_queue.py) and runs them automatically.
 
 Usage:
     python utils/always_on_server.py
@@ -20,15 +20,32 @@ from http.server import HTTPServer, BaseHTTPRequestHandler
 from socketserver import ThreadingMixIn
 import threading
 import signal
+import tempfile
+import re
+import xml.etree.ElementTree as ET
+from urllib.parse import urlparse, parse_qs
 
 PROJECT_ROOT = Path(__file__).parent.parent.resolve()
-QUEUE_FILE = PROJECT_ROOT / '.test_queue.json'
-LOCK_FILE = PROJECT_ROOT / '.test_queue.lock'
 SERVER_PID_FILE = PROJECT_ROOT / '.always_on_server.pid'  # PID file to prevent multiple instances
-TEST_EXECUTION_LOCK = PROJECT_ROOT / '.test_execution.lock'  # Lock to prevent multiple tests running simultaneously
-
-# Create a thread lock for queue processing to prevent race conditions within the same process
-_QUEUE_PROCESSING_LOCK = threading.Lock()
+BATCH_MAX_TESTS = int(os.getenv('RUN_BATCH_MAX_TESTS', '20'))  # Queued tests from one module share a pytest session (1 = no batching)
+# Parallel execution lanes: pytest sessions that may run at once (tests that share a resource never overlap)
+RUN_LANES = int(os.getenv('RUN_LANES', str(max(1, min(4, (os.cpu_count() or 2) // 2)))))
+
+sys.path.insert(0, str(PROJECT_ROOT))
+from utils import run_estimates, run_output, run_queue, run_status, test_discovery, test_resources, warm_pytest_worker
+from utils.test_logger import read_result_commit
+
+# Tests are queued in run_queue's SQLite database; the JSON file is still read as an inbox
+QUEUE_FILE = run_queue.QUEUE_FILE
+WORKER_ID = run_queue.worker_id('always-on')
+# Which queued test may start next to the running ones (see utils/test_resources.py)
+ADMIT = test_resources.admission(RUN_LANES)
+# /status is answered from this in-memory snapshot (see utils/run_status.py)
+STATUS = run_status.StatusMonitor(lanes=RUN_LANES)
+# Dashboard regeneration is not safe to run twice at once
+_DASHBOARD_REFRESH_LOCK = threading.Lock()
+# lane -> its running pytest child, so stop_lane_session() can end it
+_LANE_SESSIONS = {}
 
 def log_debug(msg):
     """Log debug message to file."""
@@ -45,58 +62,6 @@ def print_and_log(msg):
 
 
 
-def read_queue():
-    """Read test queue from file."""
-    if not QUEUE_FILE.exists():
-        return []
-    try:
-        with open(QUEUE_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data.get('queue', [])
-    except (json.JSONDecodeError, IOError):
-        return []
-
-
-def write_queue(queue):
-    """Write test queue to file."""
-    try:
-        with open(QUEUE_FILE, 'w', encoding='utf-8') as f:
-            json.dump({'queue': queue, 'last_updated': datetime.now().isoformat()}, f, indent=2)
-    except IOError:
-        pass
-
-
-def is_locked():
-    """Check if queue is currently being processed."""
-    if not LOCK_FILE.exists():
-        return False
-    try:
-        lock_age = time.time() - LOCK_FILE.stat().st_mtime
-        if lock_age > 60:  # 1 minute - stale lock (reduced for faster recovery)
-            LOCK_FILE.unlink()
-            return False
-        return True
-    except OSError:
-        return False
-
-
-def set_lock():
-    """Set lock file."""
-    try:
-        LOCK_FILE.touch()
-    except OSError:
-        pass
-
-
-def remove_lock():
-    """Remove lock file."""
-    try:
-        if LOCK_FILE.exists():
-            LOCK_FILE.unlink()
-    except OSError:
-        pass
-
-
 def check_server_running():
     """Check if server is already running by checking PID file and port."""
     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Checking if server is already running...")
@@ -189,258 +154,234 @@ def remove_pid_file():
         pass
 
 
-def acquire_test_lock():
-    """Acquire lock to prevent multiple tests running simultaneously - STRICT MODE."""
-    import time
-    start_time = time.time()
-    timeout = 10  # Wait max 10 seconds
-    server_pid = os.getpid()  # Server's own PID - don't treat server as test execution
-    
-    while time.time() - start_time < timeout:
-        try:
-            if not TEST_EXECUTION_LOCK.exists():
-                # SERVER NOW CREATES LOCK: To prevent race conditions between server starting 
-                # a test and pytest creating its own lock, the server itself will 
-                # now create the lock file with its own PID first.
-                try:
-                    TEST_EXECUTION_LOCK.write_text(str(server_pid))
-                    print(f"OK: Server acquired test execution lock (PID: {server_pid})")
-                    return True
-                except Exception as e:
-                    print(f"ERROR: Server could not write lock file: {e}")
-                    return False
-            else:
-                # Check if lock is stale
-                try:
-                    lock_pid = TEST_EXECUTION_LOCK.read_text().strip()
-                    file_age = time.time() - TEST_EXECUTION_LOCK.stat().st_mtime
-                    
-                    # IMPORTANT: If lock PID is the server's own PID, it's a stale lock from server startup
-                    # The server should never hold a test execution lock - only pytest processes should
-                    if lock_pid == str(server_pid):
-                        print(f"WARNING: Removing stale test lock (lock PID {lock_pid} is server PID - this is invalid)")
-                        TEST_EXECUTION_LOCK.unlink()
-                        continue
-                    
-                    # Check if process is still running
-                    if sys.platform == 'win32':
-                        import subprocess
-                        result = subprocess.run(
-                            ['tasklist', '/FI', f'PID eq {lock_pid}'],
-                            capture_output=True,
-                            text=True,
-                            timeout=5
-                        )
-                        if str(lock_pid) not in result.stdout:
-                            # Process is dead, remove stale lock
-                            print(f"WARNING: Removing stale test lock (PID {lock_pid} not running)")
-                            TEST_EXECUTION_LOCK.unlink()
-                            continue
-                        else:
-                            # Check if it's a pytest process (not just any Python process)
-                            # If it's not pytest, it might be stale
-                            cmdline_result = subprocess.run(
-                                ['wmic', 'process', 'where', f'ProcessId={lock_pid}', 'get', 'CommandLine'],
-                                capture_output=True,
-                                text=True,
-                                timeout=5
-                            )
-                            # Check if lock PID is the server's own PID (invalid - server shouldn't hold test lock)
-                            if lock_pid == str(server_pid):
-                                print(f"WARNING: Removing invalid test lock (lock PID {lock_pid} is server PID - server should not hold test lock)")
-                                TEST_EXECUTION_LOCK.unlink()
-                                continue
-                            
-                            if 'pytest' not in cmdline_result.stdout.lower():
-                                # Not a pytest process, might be stale
-                                if file_age > 300:  # Older than 5 minutes
-                                    print(f"WARNING: Removing stale test lock (PID {lock_pid} is not pytest, age: {file_age:.0f}s)")
-                                    TEST_EXECUTION_LOCK.unlink()
-                                    continue
-                            
-                            # Process is running and might be pytest, wait
-                            print(f"WAITING: Another test is running (PID: {lock_pid}), waiting...")
-                            time.sleep(1)
-                            continue
-                    else:
-                        # Unix: check if process exists
-                        try:
-                            # Don't treat server PID as test execution
-                            if lock_pid == str(server_pid):
-                                print(f"WARNING: Removing invalid test lock (lock PID {lock_pid} is server PID)")
-                                TEST_EXECUTION_LOCK.unlink()
-                                continue
-                            os.kill(int(lock_pid), 0)
-                            # Process exists, wait
-                            time.sleep(1)
-                            continue
-                        except OSError:
-                            # Process dead, remove lock
-                            TEST_EXECUTION_LOCK.unlink()
-                            continue
-                    
-                    if file_age > 600:  # 10 minutes - definitely stale
-                        print(f"WARNING: Removing very old test lock (age: {file_age:.0f}s)")
-                        TEST_EXECUTION_LOCK.unlink()
-                        continue
-                except Exception as e:
-                    print(f"WARNING: Error checking lock: {e}")
-                    try:
-                        TEST_EXECUTION_LOCK.unlink()
-                    except:
-                        pass
-                    continue
-        except Exception as e:
-            print(f"WARNING: Error acquiring lock: {e}")
-            time.sleep(0.5)
-    
-    print(f"ERROR: Could not acquire test execution lock within {timeout} seconds!")
-    return False
+def lane_worker_id(lane):
+    """run_queue worker ID for an execution lane (lane 1 keeps the original ID)."""
+    return WORKER_ID if lane == 1 else run_queue.worker_id(f'always-on-lane{lane}')
 
 
-def release_test_lock():
-    """Release test execution lock."""
+def lane_lock_files(lane):
+    """The .pytest_running.lock and .browser_lock BenchSale_Conftest.py uses in this lane."""
+    suffix = '' if lane == 1 else f'.lane{lane}'
+    return PROJECT_ROOT / f'.pytest_running{suffix}.lock', PROJECT_ROOT / f'.browser_lock{suffix}'
+
+
+def queued_test_module(test_name):
+    """Test file a queued test lives in, or None if it can't be resolved to exactly one test."""
+    node_ids = test_discovery.find_node_ids(test_name)
+    return node_ids[0].split('::', 1)[0] if len(node_ids) == 1 else None
+
+
+def same_module(first_test, other_test):
+    """Batching rule for run_queue.claim_batch: tests in the same file share a session."""
+    module = queued_test_module(first_test)
+    return module is not None and module == queued_test_module(other_test)
+
+
+def read_junit_outcomes(report_file, test_names):
+    """Per-test outcome ('passed' / 'failed' / 'skipped') from a pytest JUnit XML report."""
+    rank = {'skipped': 0, 'passed': 1, 'failed': 2}
+    outcomes = {}
     try:
-        if TEST_EXECUTION_LOCK.exists():
-            lock_pid = TEST_EXECUTION_LOCK.read_text().strip()
-            # Only release if we own it (but server should never own it)
-            if lock_pid == str(os.getpid()):
-                print(f"WARNING: Server process releasing test lock - this should not happen!")
-                TEST_EXECUTION_LOCK.unlink()
-            # Also check if lock is stale (older than 10 minutes)
-            elif (time.time() - TEST_EXECUTION_LOCK.stat().st_mtime) > 600:
-                print(f"WARNING: Removing stale test execution lock (age > 10 minutes)")
-                TEST_EXECUTION_LOCK.unlink()
-    except Exception:
-        pass
+        tree = ET.parse(report_file)
+    except (OSError, ET.ParseError):
+        return outcomes
+    for case in tree.iter('testcase'):
+        # Parametrized cases are reported as name[param]; any failing case fails the test
+        name = case.get('name', '').split('[', 1)[0]
+        if name not in test_names:
+            continue
+        if case.find('failure') is not None or case.find('error') is not None:
+            outcome = 'failed'
+        elif case.find('skipped') is not None:
+            outcome = 'skipped'
+        else:
+            outcome = 'passed'
+        if rank[outcome] >= rank.get(outcomes.get(name), -1):
+            outcomes[name] = outcome
+    return outcomes
 
 
 def run_test_command(test_name):
-    """Run a pytest test command - only one test at a time."""
-    # CRITICAL: Create test execution lock IMMEDIATELY to prevent queue watcher from starting another test
-    # The lock will be updated by pytest subprocess with its own PID once it starts
-    
-    print_and_log(f"Attempting to run test: {test_name}")
+    """Run a single pytest test. Returns True if the test passed."""
+    return run_test_batch([test_name]).get(test_name) == 'passed'
+
+
+def stop_lane_session(lane):
+    """Kill a lane's pytest child and its browser (the lane lost the lease on its runs).
+
+    A warm-worker session can only be ended with the worker, so that is killed;
+    later sessions run in subprocesses until it is started again.
+    """
+    process = _LANE_SESSIONS.get(lane)
+    if process is None or process.poll() is not None:
+        return
+    print_and_log(f"[lane {lane}] Lease lost - stopping pytest (PID {process.pid}) so its tests don't run twice")
+    if not run_status.kill_process_tree(process.pid):
+        print_and_log(f"[WARNING] [lane {lane}] pytest (PID {process.pid}) or its children are still running")
+
+
+def run_pytest_subprocess(selection, test_names, label, lane=1, output=None, stop=None):
+    """Run a pytest session in a new process. Returns (exit_code, {test_name: outcome}).
+
+    Its HTML/JSON reports and pytest log go to reports/lanes/lane<N>/.
+    With an output (utils/run_output.py), the child's stdout/stderr are piped into
+    it (and echoed to this console) so /runs/<id>/tail can serve them live.
+    Setting stop (a threading.Event) and calling stop_lane_session() ends the session.
+    """
+    report_fd, report_file = tempfile.mkstemp(prefix='queue_run_', suffix='.xml')
+    os.close(report_fd)
+    lane_reports = PROJECT_ROOT / 'reports' / 'lanes' / f'lane{lane}'
+    lane_reports.mkdir(parents=True, exist_ok=True)
+    cmd = [
+        sys.executable,
+        '-m', 'pytest',
+        *selection,
+        '-s', '-vv',
+        '--tb=short',  # Shorter traceback
+        f'--junitxml={report_file}',  # Per-test outcomes for the queue
+        # Per-lane reports, so parallel lanes don't overwrite pytest.ini's shared ones
+        f"--html={lane_reports / 'report.html'}",
+        f"--json-report-file={lane_reports / 'report.json'}",
+        f"--log-file={lane_reports / 'pytest.log'}",
+    ]
+    if len(test_names) == 1:
+        cmd += ['--maxfail=1', '-x']  # Stop after first failure; a batch runs every test
+    
+    print(f"\n{'='*60}")
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Running {len(test_names)} test(s) in one session: {label}")
+    print(f"Command: {' '.join(cmd)}")
+    print(f"{'='*60}\n")
+    
+    # Prepare environment to ensure browser can open
+    env = os.environ.copy()
+    # Ensure browser is not headless - explicitly set to visible
+    env['HEADLESS'] = '0'
+    env['PLAYWRIGHT_BROWSERS_PATH'] = ''  # Use system browsers
+    # Ensure MAXIMIZE_BROWSER is set if it was in parent environment
+    if 'MAXIMIZE_BROWSER' not in env:
+        env['MAXIMIZE_BROWSER'] = '1'
+    # Lane-specific lock files, so sessions in other lanes don't block this one
+    env['PYTEST_LANE'] = str(lane)
+    if output is not None:
+        env['PYTHONUNBUFFERED'] = '1'  # Stream output as it is printed, not when a buffer fills
+        output.write(f"Command: {' '.join(cmd)}\n\n")
+    pipe = {'stdout': subprocess.PIPE, 'stderr': subprocess.STDOUT} if output is not None else {}
+    
+    # On Windows, ensure subprocess can show GUI windows
+    # Use CREATE_NO_WINDOW (0x08000000) to prevent console window, but allow GUI
+    # Or use 0 to inherit parent console and allow GUI windows
+    if sys.platform == 'win32':
+        # IMPORTANT: Use 0 (default) to allow GUI windows to show
+        # CREATE_NO_WINDOW would prevent console but might also prevent browser
+        # DETACHED_PROCESS would detach but might hide windows
+        # Default (0) is best - inherits console and allows GUI
+        creation_flags = 0
+    else:
+        creation_flags = 0
+    
+    print(f"[DEBUG] Environment: HEADLESS={env.get('HEADLESS')}, MAXIMIZE_BROWSER={env.get('MAXIMIZE_BROWSER')}")
+    print(f"[DEBUG] Platform: {sys.platform}")
+    print(f"[DEBUG] Starting test execution - browser should open in visible mode...")
+    print(f"[DEBUG] Command: {' '.join(cmd)}")
+    print(f"[DEBUG] Working directory: {PROJECT_ROOT}")
+    
+    # CRITICAL: Use shell=False but ensure GUI windows can show
+    # On Windows, subprocess.run with shell=False should allow GUI windows
+    # Use CREATE_NEW_CONSOLE to spawn a separate visible terminal for the test
+    # Subprocess already imported globally
+    
+    print_and_log(f"[DEBUG] Launching test(s) '{label}'" + (" (output streamed to this console)" if output is not None else " in new console window..."))
+    
+    if sys.platform == 'win32' and output is None:
+         # 0x10 is CREATE_NEW_CONSOLE
+         creation_flags = 0x10 
+    
+         # Start subprocess (output is not captured: it must show in the new window)
+         result = subprocess.Popen(
+            cmd,
+            cwd=PROJECT_ROOT,
+            env=env,
+            creationflags=creation_flags,
+            shell=False
+        )
+    else:
+        # Output goes through the pipe, so no separate console window is needed
+        result = subprocess.Popen(
+            cmd,
+            cwd=PROJECT_ROOT,
+            env=env,
+            shell=False,
+            **pipe
+        )
+    # Windows: the session (and its browser) ends with this server, even if it is killed
+    run_status.kill_with_this_process(result)
+    reader = None
+    if output is not None:
+        console = getattr(sys.stdout, 'buffer', None)  # None under pythonw
+        reader = threading.Thread(target=run_output.pump, args=(result.stdout, output, console),
+                                  name=f'output-lane{lane}', daemon=True)
+        reader.start()
+    
+    # The status monitor reports the child's PID and liveness from this handle
+    STATUS.track(lane, result, test_names)
+    _LANE_SESSIONS[lane] = result
+    try:
+        if stop is not None and stop.is_set():
+            stop_lane_session(lane)  # Lease lost while the child was starting
+        result.wait()
+        if reader is not None:
+            reader.join(timeout=5)  # Grandchildren may keep the pipe open
+    finally:
+        _LANE_SESSIONS.pop(lane, None)
+        STATUS.untrack(lane)
     
-    # Create lock immediately with server PID (pytest will update it later)
-    server_pid = os.getpid()
     try:
-        TEST_EXECUTION_LOCK.write_text(str(server_pid))
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Created test execution lock (server PID: {server_pid}) - prevents duplicate runs")
-        time.sleep(0.3)  # Small delay to ensure lock file is written to disk
-    except Exception as e:
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] WARNING: Could not create test execution lock: {e}")
-
-    # Check if another test is running (but don't create lock as server)
-    if TEST_EXECUTION_LOCK.exists():
-        try:
-            lock_pid = TEST_EXECUTION_LOCK.read_text().strip()
-            server_pid = os.getpid()
-            file_age = time.time() - TEST_EXECUTION_LOCK.stat().st_mtime
-            
-            # If lock is server's PID, it's invalid - remove it
-            if lock_pid == str(server_pid):
-                print(f"WARNING: Removing invalid test lock (server PID {lock_pid} should not hold test lock)")
-                TEST_EXECUTION_LOCK.unlink()
-            # If lock is old (>5 min), might be stale
-            elif file_age > 300:
-                # Check if process exists
-                # Check if process exists
-                if sys.platform == 'win32':
-                    result = subprocess.run(
-                        ['tasklist', '/FI', f'PID eq {lock_pid}'],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-                    if str(lock_pid) not in result.stdout:
-                        print(f"WARNING: Removing stale test lock (PID {lock_pid} not running, age: {file_age:.0f}s)")
-                        TEST_EXECUTION_LOCK.unlink()
-                    else:
-                        # Check if it's actually pytest
-                        cmdline_result = subprocess.run(
-                            ['wmic', 'process', 'where', f'ProcessId={lock_pid}', 'get', 'CommandLine'],
-                            capture_output=True,
-                            text=True,
-                            timeout=5
-                        )
-                        if 'pytest' not in cmdline_result.stdout.lower():
-                            print(f"WARNING: Removing stale test lock (PID {lock_pid} is not pytest)")
-                            TEST_EXECUTION_LOCK.unlink()
-                        else:
-                            print(f"WARNING: Another test is running (PID: {lock_pid}). Skipping '{test_name}'")
-                            return False
-                else:
-                    try:
-                        os.kill(int(lock_pid), 0)
-                        print(f"WARNING: Another test is running (PID: {lock_pid}). Skipping '{test_name}'")
-                        return False
-                    except OSError:
-                        print(f"WARNING: Removing stale test lock (PID {lock_pid} not running)")
-                        TEST_EXECUTION_LOCK.unlink()
-            else:
-                # Lock exists and is fresh - check if it's a real pytest process
-                # Lock exists and is fresh - check if it's a real pytest process
-                if sys.platform == 'win32':
-                    result = subprocess.run(
-                        ['tasklist', '/FI', f'PID eq {lock_pid}'],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-                    if str(lock_pid) in result.stdout:
-                        # Check if it's pytest
-                        cmdline_result = subprocess.run(
-                            ['wmic', 'process', 'where', f'ProcessId={lock_pid}', 'get', 'CommandLine'],
-                            capture_output=True,
-                            text=True,
-                            timeout=5
-                        )
-                        if 'pytest' in cmdline_result.stdout.lower():
-                            print(f"WARNING: Another test is currently running (PID: {lock_pid}). Skipping '{test_name}'")
-                            return False
-                        else:
-                            # Not pytest, remove invalid lock
-                            print(f"WARNING: Removing invalid test lock (PID {lock_pid} is not pytest)")
-                            TEST_EXECUTION_LOCK.unlink()
-                    else:
-                        # Process not running, remove stale lock
-                        print(f"WARNING: Removing stale test lock (PID {lock_pid} not running)")
-                        TEST_EXECUTION_LOCK.unlink()
-                else:
-                    try:
-                        os.kill(int(lock_pid), 0)
-                        print(f"WARNING: Another test is running (PID: {lock_pid}). Skipping '{test_name}'")
-                        return False
-                    except OSError:
-                        print(f"WARNING: Removing stale test lock (PID {lock_pid} not running)")
-                        TEST_EXECUTION_LOCK.unlink()
-        except Exception as e:
-            print(f"WARNING: Error checking test lock: {e}")
-            # If we can't check, try to remove it
-            try:
-                TEST_EXECUTION_LOCK.unlink()
-            except:
-                pass
+        print_and_log(f"[DEBUG] Test execution completed. Exit code: {result.returncode}")
+    except Exception as log_err:
+        print(f"[WARNING] Could not log result: {log_err}")
+    
+    print(f"\n{'='*60}")
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test(s) '{label}' completed with exit code: {result.returncode}")
+    print(f"{'='*60}\n")
     
-    # No valid lock exists - test can proceed
-    # The pytest process will create its own lock when it starts
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] OK: No test execution lock - proceeding with test '{test_name}'")
+    outcomes = read_junit_outcomes(report_file, test_names)
+    try:
+        os.unlink(report_file)
+    except OSError:
+        pass
+    if not outcomes and len(test_names) == 1:
+        # No report (e.g. pytest crashed before writing it): go by the exit code
+        outcomes = {test_names[0]: 'passed' if result.returncode == 0 else 'failed'}
+    return result.returncode, outcomes
+
+
+def run_test_batch(test_names, lane=1, run_ids=None, stop=None):
+    """Run queued tests in one pytest session. Returns {test_name: 'passed' | 'failed' | 'skipped'}.
+
+    Tests are selected by exact node ID, so one interpreter start, conftest import,
+    browser launch and login serve the whole batch. Only called for runs claimed
+    from run_queue, so at most one session runs per lane, each with its own lock
+    files and browser. With run_ids the session's output is kept for
+    /runs/<id>/tail (see utils/run_output.py). stop (a threading.Event) is set
+    when the runs' lease is lost: the session is then not started, or killed.
+    """
+    label = ', '.join(test_names)
+    output = run_output.start(run_ids) if run_ids else None
+    print_and_log(f"[lane {lane}] Attempting to run test(s): {label}")
     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test execution will start now...")
     
     # Force clean .pytest_running.lock to prevent "Another pytest process is running" error
     # This lock is created by BenchSale_Conftest.py
-    pytest_lock_file = PROJECT_ROOT / '.pytest_running.lock'
+    pytest_lock_file, browser_lock_file = lane_lock_files(lane)
     if pytest_lock_file.exists():
         try:
-            print_and_log(f"[DEBUG] Removing stale .pytest_running.lock before starting test")
+            print_and_log(f"[DEBUG] Removing stale {pytest_lock_file.name} before starting test")
             pytest_lock_file.unlink()
         except Exception as e:
-            print_and_log(f"[WARNING] Could not remove .pytest_running.lock: {e}")
+            print_and_log(f"[WARNING] Could not remove {pytest_lock_file.name}: {e}")
 
     try:
         # Clean up any stale browser lock files before running test
-        browser_lock_file = PROJECT_ROOT / '.browser_lock'
         if browser_lock_file.exists():
             try:
                 # Check if lock is stale (older than 5 minutes)
@@ -452,15 +393,9 @@ def run_test_command(test_name):
                     # Check if process in lock file is still running
                     try:
                         lock_pid = int(browser_lock_file.read_text().strip())
-                        if sys.platform == 'win32':
-                            result = subprocess.run(
-                                ['tasklist', '/FI', f'PID eq {lock_pid}'],
-                                capture_output=True,
-                                text=True
-                            )
-                            if str(lock_pid) not in result.stdout:
-                                print(f"[DEBUG] Removing stale browser lock (PID {lock_pid} not running)")
-                                browser_lock_file.unlink()
+                        if not run_status.pid_alive(lock_pid):
+                            print(f"[DEBUG] Removing stale browser lock (PID {lock_pid} not running)")
+                            browser_lock_file.unlink()
                     except (ValueError, OSError):
                         # Invalid lock file, remove it
                         browser_lock_file.unlink()
@@ -468,463 +403,155 @@ def run_test_command(test_name):
                 print(f"[DEBUG] Could not check browser lock: {e}")
         
         os.chdir(PROJECT_ROOT)
-        # Use -k to match test name - ensure only ONE test runs
-        cmd = [
-            sys.executable,
-            '-m', 'pytest',
-            '-k', test_name,
-            '-s', '-vv',
-            '--maxfail=1',  # Stop after first failure
-            '-x',  # Exit on first failure
-            '--tb=short',  # Shorter traceback
-        ]
+        # Select by exact node ID; falls back to -k only for names not found in tests/
+        selection = test_discovery.pytest_selection(test_names)
+        exact = selection[0] != '-k'
         
-        print(f"\n{'='*60}")
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Running test: {test_name}")
-        print(f"Command: {' '.join(cmd)}")
-        print(f"{'='*60}\n")
+        # Remember the lane's last committed result so we can tell below whether this run logged one
+        commit_seq = read_result_commit(lane)['seq']
         
-        # Prepare environment to ensure browser can open
-        env = os.environ.copy()
-        # Ensure browser is not headless - explicitly set to visible
-        env['HEADLESS'] = '0'
-        env['PLAYWRIGHT_BROWSERS_PATH'] = ''  # Use system browsers
-        # Ensure MAXIMIZE_BROWSER is set if it was in parent environment
-        if 'MAXIMIZE_BROWSER' not in env:
-            env['MAXIMIZE_BROWSER'] = '1'
+        if stop is not None and stop.is_set():
+            print_and_log(f"[lane {lane}] Lease lost before test(s) '{label}' started - not running them")
+            return {}
         
-        # On Windows, ensure subprocess can show GUI windows
-        # Use CREATE_NO_WINDOW (0x08000000) to prevent console window, but allow GUI
-        # Or use 0 to inherit parent console and allow GUI windows
-        if sys.platform == 'win32':
-            # IMPORTANT: Use 0 (default) to allow GUI windows to show
-            # CREATE_NO_WINDOW would prevent console but might also prevent browser
-            # DETACHED_PROCESS would detach but might hide windows
-            # Default (0) is best - inherits console and allows GUI
-            creation_flags = 0
+        # Use the warm pytest worker when it is running: no process start, imports or browser launch
+        # (there is one worker, so only lane 1 uses it)
+        warm = None
+        if exact and lane == 1:
+            warm = warm_pytest_worker.start_session(selection)
+        if warm is not None:
+            print_and_log(f"[DEBUG] Sent test(s) '{label}' to the warm pytest worker (PID {warm.pid}, port {warm_pytest_worker.WORKER_PORT})")
+            def on_event(event):
+                # The worker's own console has the full output; runs get the results
+                line = f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}]   {event.get('test')}: {event.get('outcome')} ({event.get('when')}, {event.get('duration')}s)"
+                print(line)
+                if output is not None:
+                    output.write(line + '\n')
+            # Tracked and stopped (on lease loss) like a pytest child
+            STATUS.track(lane, warm, test_names)
+            _LANE_SESSIONS[lane] = warm
+            try:
+                if stop is not None and stop.is_set():
+                    stop_lane_session(lane)
+                result = warm.wait(on_event)
+            finally:
+                _LANE_SESSIONS.pop(lane, None)
+                STATUS.untrack(lane)
+            returncode = result['exit_code']
+            outcomes = {name: result['outcomes'][name] for name in test_names if name in result['outcomes']}
+            if result.get('error'):
+                # The tests may have run: don't run them again, tests without a result count as failed
+                print_and_log(f"[WARNING] Lost the warm worker during test(s) '{label}' ({result['error']}) - not running them again")
+            else:
+                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test(s) '{label}' completed in the warm worker with exit code: {returncode}")
         else:
-            creation_flags = 0
-        
-        print(f"[DEBUG] Environment: HEADLESS={env.get('HEADLESS')}, MAXIMIZE_BROWSER={env.get('MAXIMIZE_BROWSER')}")
-        print(f"[DEBUG] Platform: {sys.platform}")
-        print(f"[DEBUG] Starting test execution - browser should open in visible mode...")
-        print(f"[DEBUG] Command: {' '.join(cmd)}")
-        print(f"[DEBUG] Working directory: {PROJECT_ROOT}")
-        
-        # CRITICAL: Use shell=False but ensure GUI windows can show
-        # On Windows, subprocess.run with shell=False should allow GUI windows
-        # Use CREATE_NEW_CONSOLE to spawn a separate visible terminal for the test
-        # Subprocess already imported globally
+            returncode, outcomes = run_pytest_subprocess(selection, test_names, label, lane, output, stop)
+        for name in test_names:
+            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}]   {name}: {outcomes.get(name, 'no result')}")
         
-        # CRITICAL: Create test execution lock IMMEDIATELY before starting subprocess
-        # This prevents queue watcher from starting another test while this one is launching
-        server_pid = os.getpid()
-        try:
-            TEST_EXECUTION_LOCK.write_text(str(server_pid))
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Created test execution lock (server PID: {server_pid})")
-            # Small delay to ensure lock file is written to disk
-            time.sleep(0.2)
-        except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] WARNING: Could not create test execution lock: {e}")
-        
-        print_and_log(f"[DEBUG] Launching test '{test_name}' in new console window...")
-        
-        if sys.platform == 'win32':
-             # 0x10 is CREATE_NEW_CONSOLE
-             creation_flags = 0x10 
-             
-             # Start subprocess (pytest will update the lock with its own PID)
-             result = subprocess.run(
-                cmd,
-                cwd=PROJECT_ROOT,
-                capture_output=False, # Must be False to show text in the new window
-                text=True,
-                env=env,
-                creationflags=creation_flags,
-                shell=False
-            )
+        # The session has ended, so TestLogger's "result committed" record (log flushed +
+        # fsynced) is already there or will never come (collection error, nothing selected):
+        # check once instead of waiting.
+        commit = read_result_commit(lane)
+        if commit['seq'] > commit_seq:
+            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Result committed: {commit.get('test')} ({commit.get('status')})")
         else:
-            # Fallback for non-Windows (though user is on Windows)
-            result = subprocess.run(
-                cmd,
-                cwd=PROJECT_ROOT,
-                capture_output=False,
-                text=True,
-                env=env,
-                shell=False
-            )
-        
-        try:
-            # Just log the exit code since we aren't capturing output anymore (it's in the popped window)
-            print_and_log(f"[DEBUG] Test execution completed. Exit code: {result.returncode}")
-        except Exception as log_err:
-            print(f"[WARNING] Could not log result: {log_err}")
-        
-        print(f"\n{'='*60}")
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test '{test_name}' completed with exit code: {result.returncode}")
-        print(f"{'='*60}\n")
-        
-        # CRITICAL: Immediately clean up test execution lock after test completes
-        # The pytest process should have cleaned it up, but ensure it's gone
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Cleaning up test execution lock...")
-        if TEST_EXECUTION_LOCK.exists():
-            try:
-                lock_pid = TEST_EXECUTION_LOCK.read_text().strip()
-                server_pid = os.getpid()
-                # If lock PID is server's PID, remove it (invalid)
-                if lock_pid == str(server_pid):
-                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Removing invalid test lock (server PID)")
-                    TEST_EXECUTION_LOCK.unlink()
-                else:
-                    # Check if process is still running
-                    if sys.platform == 'win32':
-                        check_result = subprocess.run(
-                            ['tasklist', '/FI', f'PID eq {lock_pid}'],
-                            capture_output=True,
-                            text=True,
-                            timeout=2
-                        )
-                        if str(lock_pid) not in check_result.stdout:
-                            # Process is dead, remove stale lock
-                            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Removing stale test lock (PID {lock_pid} not running)")
-                            TEST_EXECUTION_LOCK.unlink()
-                        else:
-                            # Process still running, but test subprocess should be done
-                            # Wait a bit more and check again
-                            time.sleep(2)
-                            check_result2 = subprocess.run(
-                                ['tasklist', '/FI', f'PID eq {lock_pid}'],
-                                capture_output=True,
-                                text=True,
-                                timeout=2
-                            )
-                            if str(lock_pid) not in check_result2.stdout:
-                                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Removing stale test lock after wait")
-                                TEST_EXECUTION_LOCK.unlink()
-                            else:
-                                # Still running - might be a different process, remove lock anyway
-                                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Force removing test lock (test subprocess should be done)")
-                                TEST_EXECUTION_LOCK.unlink()
-                    else:
-                        try:
-                            os.kill(int(lock_pid), 0)
-                            # Process exists, wait a bit
-                            time.sleep(2)
-                            try:
-                                os.kill(int(lock_pid), 0)
-                                # Still exists, force remove
-                                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Force removing test lock")
-                                TEST_EXECUTION_LOCK.unlink()
-                            except OSError:
-                                # Process dead now, remove lock
-                                TEST_EXECUTION_LOCK.unlink()
-                        except (OSError, ValueError):
-                            # Process dead, remove lock
-                            TEST_EXECUTION_LOCK.unlink()
-            except Exception as e:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Error cleaning up lock: {e}, force removing")
-                try:
-                    TEST_EXECUTION_LOCK.unlink()
-                except:
-                    pass
-        
-        # CRITICAL: Wait for log files to be fully written before regenerating dashboard
-        # This ensures the latest test status (PASS/FAIL) is captured
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Waiting for log files to be fully written...")
-        time.sleep(3)  # Reduced to 3 seconds since we already waited for subprocess
+            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] No result committed by the session - refreshing anyway")
         
         # Regenerate dashboard to reflect new results
         print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Regenerating dashboard with test results...")
         refresh_script = PROJECT_ROOT / 'refresh_dashboard.py'
         try:
-            result = subprocess.run(
-                [sys.executable, str(refresh_script)],
-                cwd=PROJECT_ROOT,
-                capture_output=True,
-                text=True,
-                timeout=60  # 60 second timeout for dashboard generation
-            )
-            if result.returncode == 0:
+            with _DASHBOARD_REFRESH_LOCK:
+                refresh = subprocess.run(
+                    [sys.executable, str(refresh_script)],
+                    cwd=PROJECT_ROOT,
+                    capture_output=True,
+                    text=True,
+                    timeout=60  # 60 second timeout for dashboard generation
+                )
+            if refresh.returncode == 0:
                 print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Dashboard updated successfully with test results and screenshots.")
                 # Verify dashboard was actually updated
-                dashboard_file = PROJECT_ROOT / 'logs' / 'index.html'
+                dashboard_file = PROJECT_ROOT / 'logs' / 'dashboard-data.json'
                 if dashboard_file.exists():
                     file_mtime = dashboard_file.stat().st_mtime
                     current_time = time.time()
                     age_seconds = current_time - file_mtime
                     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Dashboard file age: {age_seconds:.2f} seconds (fresh)")
-                # Give a moment for file system to sync
-                time.sleep(1)  # Reduced since we're forcing sync in refresh script
             else:
-                print(f"[WARNING] Dashboard refresh returned code {result.returncode}: {result.stderr}")
-                if result.stdout:
-                    print(f"[DEBUG] Dashboard refresh stdout: {result.stdout}")
+                print(f"[WARNING] Dashboard refresh returned code {refresh.returncode}: {refresh.stderr}")
+                if refresh.stdout:
+                    print(f"[DEBUG] Dashboard refresh stdout: {refresh.stdout}")
         except subprocess.TimeoutExpired:
             print(f"[WARNING] Dashboard refresh timed out after 60 seconds")
         except Exception as e:
             print(f"[WARNING] Error refreshing dashboard: {e}")
         
-        # Additional wait to ensure dashboard file is fully written to disk
-        # This is critical for UI to see updated status and screenshots
-        time.sleep(3)  # Increased to 3 seconds to ensure file system sync and latest status is written
-        
-        # Verify dashboard file exists and was recently updated
-        dashboard_file = PROJECT_ROOT / 'logs' / 'index.html'
-        if dashboard_file.exists():
-            file_mtime = dashboard_file.stat().st_mtime
-            current_time = time.time()
-            age_seconds = current_time - file_mtime
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Dashboard file age: {age_seconds:.2f} seconds (should be < 5 seconds)")
-            
-            # Force file system sync to ensure latest status is written
-            try:
-                dashboard_file.touch()  # Update file timestamp to ensure it's fresh
-                # Force a write to ensure file is synced
-                with open(dashboard_file, 'r+b') as f:
-                    f.seek(0, 2)  # Seek to end
-                    f.write(b'\n')  # Add newline
-                    f.flush()
-                    os.fsync(f.fileno())  # Force sync to disk
-            except Exception as e:
-                print(f"[WARNING] Could not touch dashboard file: {e}")
-        
-        return result.returncode == 0
+        return outcomes
     except Exception as e:
-        print_and_log(f"ERROR running test '{test_name}': {e}")
+        print_and_log(f"ERROR running test(s) '{label}': {e}")
         import traceback
         try:
             with open(PROJECT_ROOT / 'server_debug.log', 'a', encoding='utf-8') as f:
                 traceback.print_exc(file=f)
         except:
             pass
-        return False
+        return {}
     finally:
-        # CRITICAL: Force cleanup of test execution lock after test completes
-        # This ensures the server status endpoint correctly reports "not busy"
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Final cleanup: Ensuring test execution lock is removed...")
-        max_cleanup_attempts = 5
-        for attempt in range(max_cleanup_attempts):
-            try:
-                if not TEST_EXECUTION_LOCK.exists():
-                    break  # Lock already gone, good
-                
-                lock_pid = TEST_EXECUTION_LOCK.read_text().strip()
-                server_pid = os.getpid()
-                lock_age = time.time() - TEST_EXECUTION_LOCK.stat().st_mtime
-                
-                # If lock is server's PID, remove it (invalid)
-                if lock_pid == str(server_pid):
-                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Removing invalid test lock (server PID)")
-                    TEST_EXECUTION_LOCK.unlink()
-                    break
-                
-                # If lock is old (>2 min), definitely remove it
-                if lock_age > 120:
-                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Removing stale test lock (age: {lock_age:.0f}s)")
-                    TEST_EXECUTION_LOCK.unlink()
-                    break
-                
-                # Check if process is still running
-                if sys.platform == 'win32':
-                    check_result = subprocess.run(
-                        ['tasklist', '/FI', f'PID eq {lock_pid}'],
-                        capture_output=True,
-                        text=True,
-                        timeout=2
-                    )
-                    if str(lock_pid) not in check_result.stdout:
-                        # Process dead, remove lock
-                        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Removing test lock (PID {lock_pid} not running)")
-                        TEST_EXECUTION_LOCK.unlink()
-                        break
-                    else:
-                        # Check if it's pytest
-                        cmdline_result = subprocess.run(
-                            ['wmic', 'process', 'where', f'ProcessId={lock_pid}', 'get', 'CommandLine'],
-                            capture_output=True,
-                            text=True,
-                            timeout=2
-                        )
-                        if 'pytest' not in cmdline_result.stdout.lower():
-                            # Not pytest, remove lock
-                            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Removing test lock (PID {lock_pid} is not pytest)")
-                            TEST_EXECUTION_LOCK.unlink()
-                            break
-                        # It's pytest and still running - wait a bit
-                        if attempt < max_cleanup_attempts - 1:
-                            time.sleep(1)
-                            continue
-                        else:
-                            # Last attempt - force remove if test subprocess should be done
-                            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Force removing test lock (test should be done)")
-                            TEST_EXECUTION_LOCK.unlink()
-                            break
-                else:
-                    try:
-                        os.kill(int(lock_pid), 0)
-                        # Process exists, wait a bit
-                        if attempt < max_cleanup_attempts - 1:
-                            time.sleep(1)
-                            continue
-                        else:
-                            # Last attempt - force remove
-                            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Force removing test lock")
-                            TEST_EXECUTION_LOCK.unlink()
-                            break
-                    except (OSError, ValueError):
-                        # Process dead, remove lock
-                        TEST_EXECUTION_LOCK.unlink()
-                        break
-            except Exception as e:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Error in cleanup attempt {attempt + 1}: {e}")
-                if attempt == max_cleanup_attempts - 1:
-                    # Last attempt - force remove
-                    try:
-                        TEST_EXECUTION_LOCK.unlink()
-                    except:
-                        pass
-                else:
-                    time.sleep(0.5)
-        
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Cleanup complete. Test execution lock removed.")
-
-
-def process_queue():
-    """Process test queue from file with thread safety."""
-    # 1. First, acquire the thread-level lock for this process
-    if not _QUEUE_PROCESSING_LOCK.acquire(blocking=False):
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Another thread is already processing the queue in this process, skipping")
-        return
-    
-    try:
-        # 2. Then check the file-based lock (across processes)
-        if is_locked():
-            # Check if lock is stale (older than 1 minute)
-            try:
-                lock_age = time.time() - LOCK_FILE.stat().st_mtime
-                if lock_age > 60:  # Older than 1 minute, consider stale
-                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Removing stale queue lock (age: {lock_age:.0f}s)")
-                    remove_lock()
-                else:
-                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Queue is locked, skipping processing")
-                    return
-            except Exception as e:
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Error checking lock age: {e}, removing lock")
-                remove_lock()
-    
-        queue = read_queue()
-        if not queue:
-            return
-        
-        print_and_log(f"\nProcessing queue with {len(queue)} test(s): {queue}")
+        if output is not None:
+            run_output.finish(output)
+
+
+def process_queue(lane=1):
+    """Claim and run queued tests in one execution lane until none can be claimed.
+
+    Queued tests from the same test file are claimed together and run in one
+    pytest session (up to RUN_BATCH_MAX_TESTS); each still gets its own result
+    in the queue. Up to RUN_LANES lanes run sessions at once, but a test is only
+    claimed if none of its resources (login, prod DB, module log; browsers up to
+    RUN_MAX_BROWSERS) are held by a running session. Among the rest, the next
+    test is picked by RUN_QUEUE_ORDER (shortest expected run first by default,
+    see utils/run_estimates.py). Claiming is a transaction
+    in run_queue, so this is safe to call from several threads or processes at
+    once. Returns the names of the tests that were run.
+    """
+    run_queue.import_queue_file()
+    worker = lane_worker_id(lane)
+    processed_tests = []
+    while True:
+        runs = run_queue.claim_batch(worker, same_batch=same_module, max_tests=BATCH_MAX_TESTS,
+                                     max_running=RUN_LANES, admit=ADMIT, order=run_estimates.schedule)
+        if not runs:
+            break
+        STATUS.poke()
+        test_names = [run['test_name'] for run in runs]
+        print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ========================================")
+        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [lane {lane}] Starting test(s) from queue: {test_names} (runs {[run['id'] for run in runs]})")
         print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ========================================")
-        
-        set_lock()
-        
         try:
-            # Process queue items one at a time
-            processed_tests = []
-            while queue:
-                test_name = queue.pop(0)
-                if test_name:
-                    # CRITICAL: Check if ANY test is already running before processing (not just this specific test)
-                    # This prevents multiple tests from running simultaneously
-                    if TEST_EXECUTION_LOCK.exists():
-                        try:
-                            lock_pid = TEST_EXECUTION_LOCK.read_text().strip()
-                            server_pid = os.getpid()
-                            
-                            # If lock is server's PID, test is starting (just created lock)
-                            if lock_pid == str(server_pid):
-                                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test execution lock exists (server PID), another test is starting - skipping '{test_name}' from queue")
-                                # Put test back at front of queue to retry later
-                                queue.insert(0, test_name)
-                                write_queue(queue)
-                                break  # Exit loop, will retry on next queue check
-                            
-                            # Check if it's a real pytest process
-                            if sys.platform == 'win32':
-                                result = subprocess.run(
-                                    ['tasklist', '/FI', f'PID eq {lock_pid}'],
-                                    capture_output=True,
-                                    text=True,
-                                    timeout=2
-                                )
-                                if str(lock_pid) in result.stdout:
-                                    # Check if it's pytest
-                                    cmdline_result = subprocess.run(
-                                        ['wmic', 'process', 'where', f'ProcessId={lock_pid}', 'get', 'CommandLine'],
-                                        capture_output=True,
-                                        text=True,
-                                        timeout=2
-                                    )
-                                    if 'pytest' in cmdline_result.stdout.lower():
-                                        # ANY pytest is running - don't start another test
-                                        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Another test is running (PID: {lock_pid}), skipping '{test_name}' from queue")
-                                        # Put test back at front of queue to retry later
-                                        queue.insert(0, test_name)
-                                        write_queue(queue)
-                                        break  # Exit loop, will retry on next queue check
-                            else:
-                                # Non-Windows: check if process exists
-                                try:
-                                    os.kill(int(lock_pid), 0)
-                                    # Process exists, another test is running
-                                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Another test is running (PID: {lock_pid}), skipping '{test_name}' from queue")
-                                    queue.insert(0, test_name)
-                                    write_queue(queue)
-                                    break
-                                except (OSError, ValueError):
-                                    # Process doesn't exist, lock is stale - remove it
-                                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Removing stale lock (PID {lock_pid} not running)")
-                                    try:
-                                        TEST_EXECUTION_LOCK.unlink()
-                                    except:
-                                        pass
-                        except Exception as e:
-                            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Error checking running test: {e}")
-                            # On error, be safe and don't start test
-                            queue.insert(0, test_name)
-                            write_queue(queue)
-                            break
-                    
-                    print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ========================================")
-                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting test from queue: {test_name}")
-                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ========================================")
-                    run_test_command(test_name)
-                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test '{test_name}' execution completed")
-                    processed_tests.append(test_name)
-                    
-                    # CRITICAL: Write queue immediately after removing test to prevent re-processing
-                    write_queue(queue)
-                    
-                    # Wait a bit before processing next test (if any)
-                    if queue:
-                        time.sleep(1)
+            run_ids = [run['id'] for run in runs]
+            stop = threading.Event()
             
-            # Clear queue file if all tests processed
-            if not queue:
-                write_queue([])  # Ensure queue file is empty
-            
-            if processed_tests:
-                print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ========================================")
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Queue processing completed. Processed: {processed_tests}")
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ========================================")
-            else:
-                print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ========================================")
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Queue processing completed (no tests to process)")
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ========================================")
+            def on_lost():
+                # The runs may already be claimed again: end this session instead of running them twice
+                stop.set()
+                stop_lane_session(lane)
+            statuses = run_queue.execute_batch(runs, worker, lambda names: run_test_batch(names, lane, run_ids, stop),
+                                               on_lost=on_lost)
+            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Results: {statuses}")
         except Exception as e:
             print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR processing queue: {e}", file=sys.stderr)
             import traceback
             traceback.print_exc()
-    finally:
-        remove_lock()
-        # 3. Always release the thread lock
-        try:
-            _QUEUE_PROCESSING_LOCK.release()
-        except RuntimeError:
-            pass
+        STATUS.poke()
+        processed_tests.extend(test_names)
+    
+    if processed_tests:
+        print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ========================================")
+        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Queue processing completed. Processed: {processed_tests}")
+        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ========================================")
+    return processed_tests
 
 
 class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
@@ -948,101 +575,15 @@ class QueueHandler(BaseHTTPRequestHandler):
         if self.path.startswith('/status'):
             # Quick status check - don't log every request to avoid spam
             try:
-                # Check if busy (queue locked or test execution locked)
-                is_busy = is_locked()
-                if not is_busy and TEST_EXECUTION_LOCK.exists():
-                    # Double check test execution lock
-                    try:
-                        lock_pid = TEST_EXECUTION_LOCK.read_text().strip()
-                        server_pid = os.getpid()
-                        lock_age = time.time() - TEST_EXECUTION_LOCK.stat().st_mtime
-                        
-                        # If lock PID is server's PID, it's invalid - remove it and don't treat as busy
-                        if lock_pid == str(server_pid):
-                            try:
-                                TEST_EXECUTION_LOCK.unlink()
-                            except:
-                                pass
-                            is_busy = False
-                        # Basic check if file is fresh (less than 2 mins) and not server PID
-                        # Reduced from 5 mins to 2 mins for faster detection of completed tests
-                        elif lock_age < 120:
-                            # Verify it's actually a pytest process
-                            if sys.platform == 'win32':
-                                import subprocess
-                                result = subprocess.run(
-                                    ['tasklist', '/FI', f'PID eq {lock_pid}'],
-                                    capture_output=True,
-                                    text=True,
-                                    timeout=2
-                                )
-                                if str(lock_pid) in result.stdout:
-                                    # Check if it's pytest
-                                    cmdline_result = subprocess.run(
-                                        ['wmic', 'process', 'where', f'ProcessId={lock_pid}', 'get', 'CommandLine'],
-                                        capture_output=True,
-                                        text=True,
-                                        timeout=2
-                                    )
-                                    if 'pytest' in cmdline_result.stdout.lower():
-                                        is_busy = True
-                                    else:
-                                        # Not pytest, invalid lock - remove it
-                                        try:
-                                            TEST_EXECUTION_LOCK.unlink()
-                                        except:
-                                            pass
-                                        is_busy = False
-                                else:
-                                    # Process not running, stale lock - remove it
-                                    try:
-                                        TEST_EXECUTION_LOCK.unlink()
-                                    except:
-                                        pass
-                                    is_busy = False
-                            else:
-                                # Unix: check if process exists
-                                try:
-                                    os.kill(int(lock_pid), 0)
-                                    is_busy = True
-                                except OSError:
-                                    # Process dead, stale lock - remove it
-                                    try:
-                                        TEST_EXECUTION_LOCK.unlink()
-                                    except:
-                                        pass
-                                    is_busy = False
-                        else:
-                            # Lock is old (>2 mins), stale - remove it
-                            try:
-                                TEST_EXECUTION_LOCK.unlink()
-                            except:
-                                pass
-                            is_busy = False
-                    except:
-                        pass
-                
-                # Get queue status
-                queue = read_queue()
-                queue_size = len(queue) if queue else 0
-                
-                # CRITICAL: If queue has items, consider server as "busy" (test is queued/starting)
-                # This ensures dashboard knows test is being processed even before it actually starts
-                # This fixes the "Test Not Started" error when test is in queue but not yet running
-                if queue_size > 0 and not is_busy:
-                    # Test is in queue but not yet started - mark as busy to indicate processing
-                    is_busy = True
-                
+                # Answered from the status monitor's in-memory snapshot - no database
+                # reads, process checks or lock files per request
+                response = STATUS.snapshot()
                 self.send_response(200)
                 self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(response)))
                 self.send_header('Access-Control-Allow-Origin', '*')
                 self.end_headers()
-                response = json.dumps({
-                    'busy': is_busy,
-                    'queue_size': queue_size,
-                    'status': 'running'
-                })
-                self.wfile.write(response.encode('utf-8'))
+                self.wfile.write(response)
             except Exception as e:
                 print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Error in /status endpoint: {e}", file=sys.stderr)
                 self.send_response(500)
@@ -1052,6 +593,30 @@ class QueueHandler(BaseHTTPRequestHandler):
                 response = json.dumps({'error': str(e), 'status': 'error'})
                 self.wfile.write(response.encode('utf-8'))
             
+        elif re.match(r'^/runs/\d+/tail(\?|$)', self.path):
+            # Live output of a queued run from byte offset ?since= (see utils/run_output.py)
+            try:
+                url = urlparse(self.path)
+                run_id = int(url.path.split('/')[2])
+                since = int(parse_qs(url.query).get('since', ['0'])[0])
+                tail = run_output.tail(run_id, since)
+                if tail is None:
+                    self.send_error_response(404, f'No output for run {run_id}')
+                    return
+                data, next_offset, done = tail
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; charset=utf-8')
+                self.send_header('Content-Length', str(len(data)))
+                self.send_header('X-Next-Offset', str(next_offset))
+                self.send_header('X-Run-Done', '1' if done else '0')
+                self.send_header('Cache-Control', 'no-cache')
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.send_header('Access-Control-Expose-Headers', 'X-Next-Offset, X-Run-Done')
+                self.end_headers()
+                self.wfile.write(data)
+            except ValueError:
+                self.send_error_response(400, 'since must be a byte offset')
+            
         elif self.path == '/log-timestamps':
             # Return log file modification times for dashboard Last Run timestamps
             try:
@@ -1125,95 +690,31 @@ class QueueHandler(BaseHTTPRequestHandler):
                     self.send_error_response(400, 'Test name is required')
                     return
                 
-                # CRITICAL: Check if test is already running OR in queue BEFORE adding
-                # First check if test is in queue
-                queue = read_queue()
-                if test_name in queue:
-                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test '{test_name}' already in queue, skipping duplicate")
-                    self.send_response(200)
-                    self.send_header('Content-Type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    response = json.dumps({
-                        'success': False,
-                        'error': f'Test "{test_name}" is already in queue'
-                    })
-                    self.wfile.write(response.encode('utf-8'))
-                    return
-                
-                # Then check if test is already running (more robust check)
-                test_is_running = False
-                if TEST_EXECUTION_LOCK.exists():
-                    try:
-                        lock_pid = TEST_EXECUTION_LOCK.read_text().strip()
-                        server_pid = os.getpid()
-                        
-                        # If lock is server's PID, test is starting (just created lock)
-                        if lock_pid == str(server_pid):
-                            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test execution lock exists (server PID), test is starting - rejecting new request")
-                            test_is_running = True
-                        else:
-                            # Check if it's a real pytest process
-                            if sys.platform == 'win32':
-                                result = subprocess.run(
-                                    ['tasklist', '/FI', f'PID eq {lock_pid}'],
-                                    capture_output=True,
-                                    text=True,
-                                    timeout=2
-                                )
-                                if str(lock_pid) in result.stdout:
-                                    # Check if it's pytest
-                                    cmdline_result = subprocess.run(
-                                        ['wmic', 'process', 'where', f'ProcessId={lock_pid}', 'get', 'CommandLine'],
-                                        capture_output=True,
-                                        text=True,
-                                        timeout=2
-                                    )
-                                    cmdline_lower = cmdline_result.stdout.lower()
-                                    # Check if pytest is running (even if test name doesn't match exactly, if pytest is running, don't start another)
-                                    if 'pytest' in cmdline_lower:
-                                        # If test name is in command line, it's the same test
-                                        if test_name in cmdline_result.stdout or test_name.replace('_', ' ') in cmdline_result.stdout:
-                                            test_is_running = True
-                                        else:
-                                            # Another test is running - still reject to prevent multiple tests
-                                            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Another test is running (PID: {lock_pid}), rejecting new test request")
-                                            test_is_running = True
-                            else:
-                                # Non-Windows: check if process exists
-                                try:
-                                    os.kill(int(lock_pid), 0)
-                                    # Process exists, assume test is running
-                                    test_is_running = True
-                                except (OSError, ValueError):
-                                    # Process doesn't exist, lock is stale
-                                    pass
-                    except Exception as e:
-                        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Error checking running test: {e}")
-                        # On error, be safe and assume test might be running
-                        test_is_running = True
-                
-                if test_is_running:
-                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test '{test_name}' is already running or starting, skipping")
+                # Enqueue is atomic and de-duplicated: a test that is already queued or
+                # running is not added again (any number of tests can wait in the queue)
+                run_id, created = run_queue.enqueue(test_name, source='http')
+                if not created:
+                    existing = run_queue.get_run(run_id) or {}
+                    if existing.get('status') == 'running':
+                        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test '{test_name}' is already running, skipping")
+                        error = f'Test "{test_name}" is already running. Please wait for it to complete.'
+                    else:
+                        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test '{test_name}' already in queue, skipping duplicate")
+                        error = f'Test "{test_name}" is already in queue'
                     self.send_response(200)
                     self.send_header('Content-Type', 'application/json')
                     self.send_header('Access-Control-Allow-Origin', '*')
                     self.end_headers()
                     response = json.dumps({
                         'success': False,
-                        'error': f'Test "{test_name}" is already running. Please wait for it to complete.'
+                        'error': error
                     })
                     self.wfile.write(response.encode('utf-8'))
                     return
                 
-                # Add to queue (we already checked it's not in queue and not running above)
-                queue.append(test_name)
-                write_queue(queue)
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Added test '{test_name}' to queue (queue size: {len(queue)})")
-                
-                # NOTE: Queue watcher thread (watch_queue_loop) runs every 0.5 seconds and will automatically
-                # pick up the new test. No need for a separate background thread - this prevents duplicate processing.
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test added to queue. Queue watcher will process it automatically (checks every 0.5s).")
+                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Added test '{test_name}' to queue (run {run_id})")
+                STATUS.poke()
+                # The queue watcher thread (watch_queue_loop) claims it from the queue
                 
                 # Send success response
                 self.send_response(200)
@@ -1222,7 +723,8 @@ class QueueHandler(BaseHTTPRequestHandler):
                 self.end_headers()
                 response = json.dumps({
                     'success': True,
-                    'message': f'Test "{test_name}" added to queue and will run shortly'
+                    'message': f'Test "{test_name}" added to queue and will run shortly',
+                    'runId': run_id,  # Live output: GET /runs/<runId>/tail?since=0
                 })
                 self.wfile.write(response.encode('utf-8'))
                 print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Successfully sent response to client")
@@ -1250,7 +752,7 @@ class QueueHandler(BaseHTTPRequestHandler):
     def log_message(self, format, *args):
         """Override to customize logging."""
         # Don't log status checks to keep console clean
-        if args and args[0].startswith("GET /status"):
+        if args and (args[0].startswith("GET /status") or re.match(r'GET /runs/\d+/tail', args[0])):
             return
             
         # Log all other HTTP requests for debugging
@@ -1258,76 +760,22 @@ class QueueHandler(BaseHTTPRequestHandler):
         print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] HTTP: {message}")
 
 
-def watch_queue_loop():
-    """Background thread to watch file queue."""
+def watch_queue_loop(lane=1):
+    """Background thread (one per execution lane) that claims and runs queued tests.
+
+    Sleeps until run_queue reports a change (a test was queued, or a run finished
+    and freed a lane or resource) instead of polling.
+    """
     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ========================================")
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Queue watcher thread started")
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Queue watcher thread started (lane {lane} of {RUN_LANES})")
     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ========================================")
-    iteration = 0
     while True:
         try:
-            iteration += 1
-            # Only process if queue has items and no test is currently running
-            queue = read_queue()
-            if queue:
-                # CRITICAL: Check if test execution lock exists (means test is running or starting)
-                if TEST_EXECUTION_LOCK.exists():
-                    try:
-                        lock_pid = TEST_EXECUTION_LOCK.read_text().strip()
-                        server_pid = os.getpid()
-                        
-                        # If lock is server's PID, test is starting (lock just created)
-                        if lock_pid == str(server_pid):
-                            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test execution lock exists (server PID), test is starting - waiting 3 seconds...")
-                            time.sleep(3)  # Wait 3 seconds for test to start
-                            continue
-                        
-                        # Check if process in lock file is running
-                        if sys.platform == 'win32':
-                            result = subprocess.run(
-                                ['tasklist', '/FI', f'PID eq {lock_pid}'],
-                                capture_output=True,
-                                text=True,
-                                timeout=2
-                            )
-                            if str(lock_pid) in result.stdout:
-                                # Check if it's pytest
-                                cmdline_result = subprocess.run(
-                                    ['wmic', 'process', 'where', f'ProcessId={lock_pid}', 'get', 'CommandLine'],
-                                    capture_output=True,
-                                    text=True,
-                                    timeout=2
-                                )
-                                if 'pytest' in cmdline_result.stdout.lower():
-                                    # Test is running, wait longer before checking again
-                                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test is running (PID: {lock_pid}) - waiting 3 seconds...")
-                                    time.sleep(3)  # Wait 3 seconds if test is running
-                                    continue
-                                else:
-                                    # Not pytest, remove stale lock
-                                    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Removing stale lock (PID {lock_pid} is not pytest)")
-                                    try:
-                                        TEST_EXECUTION_LOCK.unlink()
-                                    except:
-                                        pass
-                            else:
-                                # Process not running, remove stale lock
-                                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Removing stale lock (PID {lock_pid} not running)")
-                                try:
-                                    TEST_EXECUTION_LOCK.unlink()
-                                except:
-                                    pass
-                    except Exception as e:
-                        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Error checking test lock: {e}")
-                        # If we can't check, wait a bit to be safe
-                        time.sleep(2)
-                        continue
-                
-                # No test running, process queue
-                process_queue()
-            else:
-                # No queue items, normal sleep
-                time.sleep(0.5)  # Check queue every 0.5 seconds when idle
+            seen = run_queue.change_count()
+            if not process_queue(lane):
+                # Nothing claimable (queue empty, lanes busy or resources held): wait for a change
+                run_queue.wait_for_change(seen)
+                STATUS.poke()
         except Exception as e:
             print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR in queue watcher: {e}", file=sys.stderr)
             import traceback
@@ -1335,14 +783,18 @@ def watch_queue_loop():
             time.sleep(1)
 
 
-def run_server(port=8766):
-    """Run the always-on server."""
+def run_server(port=8766, supervised=False):
+    """Run the always-on server.
+
+    supervised: started as a standby by utils/server_keep_alive.py, which has
+    already stopped the previous instance, so the running-server check is skipped.
+    """
     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ========================================")
     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting Always-On Test Server")
     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ========================================")
     
     # Check if server is already running
-    is_running = check_server_running()
+    is_running = not supervised and check_server_running()
     if is_running:
         print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] ERROR: Server appears to be already running!")
         print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}]    PID file: {SERVER_PID_FILE}")
@@ -1355,37 +807,8 @@ def run_server(port=8766):
     
     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] OK: No existing server found - proceeding with startup")
     
-    # Clean up any stale locks at startup
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Cleaning up stale locks at startup...")
-    if LOCK_FILE.exists():
-        try:
-            lock_age = time.time() - LOCK_FILE.stat().st_mtime
-            if lock_age > 60:  # Older than 1 minute, consider stale
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Removing stale queue lock (age: {lock_age:.0f}s)")
-                LOCK_FILE.unlink()
-        except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Error checking queue lock: {e}")
-    
-    if TEST_EXECUTION_LOCK.exists():
-        try:
-            lock_pid = TEST_EXECUTION_LOCK.read_text().strip()
-            lock_age = time.time() - TEST_EXECUTION_LOCK.stat().st_mtime
-            server_pid = os.getpid()
-            
-            # If lock PID is server's own PID, it's invalid (server shouldn't hold test lock)
-            if lock_pid == str(server_pid):
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Removing invalid test execution lock (lock PID {lock_pid} is server PID)")
-                TEST_EXECUTION_LOCK.unlink()
-            elif lock_age > 300:  # Older than 5 minutes, consider stale
-                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Removing stale test execution lock (age: {lock_age:.0f}s)")
-                TEST_EXECUTION_LOCK.unlink()
-        except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Error checking test execution lock: {e}")
-            # Try to remove it anyway if there's an error reading it
-            try:
-                TEST_EXECUTION_LOCK.unlink()
-            except:
-                pass
+    # No lock files to clean up: runs left 'running' by a crashed server are
+    # re-queued by run_queue once their lease expires
     
     # Write PID file
     write_pid_file()
@@ -1393,7 +816,6 @@ def run_server(port=8766):
     # Register cleanup handler
     def cleanup_handler(signum=None, frame=None):
         remove_pid_file()
-        remove_lock()
         sys.exit(0)
     
     if sys.platform != 'win32':
@@ -1426,33 +848,40 @@ def run_server(port=8766):
         traceback.print_exc()
         sys.exit(1)
     
-    # Start file queue watcher in background thread
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting queue watcher thread...")
-    queue_watcher = threading.Thread(target=watch_queue_loop, daemon=True)
-    queue_watcher.start()
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Queue watcher thread started")
+    # Keep the /status snapshot up to date in the background
+    STATUS.start()
     
-    # Verify queue file location
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Queue file path: {QUEUE_FILE}")
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Queue file exists: {QUEUE_FILE.exists()}")
-    if QUEUE_FILE.exists():
-        try:
-            queue = read_queue()
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Current queue contents: {queue}")
-        except Exception as e:
-            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Error reading queue: {e}")
+    # Tests queued by other processes (CLI, other servers) wake the watchers directly
+    if run_queue.listen_for_changes():
+        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Listening for queue notifications on 127.0.0.1:{run_queue.NOTIFY_PORT} (UDP)")
+    else:
+        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Queue notification port {run_queue.NOTIFY_PORT} is taken - tests queued by other processes are picked up within {run_queue.IDLE_RECHECK_SECONDS:.0f}s")
+    
+    # Start file queue watcher in background thread
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting {RUN_LANES} queue watcher thread(s) (RUN_LANES)...")
+    for lane in range(1, RUN_LANES + 1):
+        queue_watcher = threading.Thread(target=watch_queue_loop, args=(lane,), daemon=True)
+        queue_watcher.start()
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Queue watcher threads started")
+    
+    # Show queue location and contents
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Queue database: {run_queue.QUEUE_DB}")
+    try:
+        runs = run_queue.active_runs()
+        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Current queue contents: {[(run['test_name'], run['status']) for run in runs]}")
+    except Exception as e:
+        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Error reading queue: {e}")
     
     print(f"""
 {'='*60}
 Always-On Test Server
 {'='*60}
 Server running on http://localhost:{port}
-Queue file: {QUEUE_FILE}
-Queue file exists: {QUEUE_FILE.exists()}
+Queue database: {run_queue.QUEUE_DB}
 
 This server will:
 - Accept test requests via HTTP POST to /add-test
-- Watch queue file for test requests
+- Watch the queue for test requests (also picks up names written to {QUEUE_FILE.name})
 - Automatically run tests when requested
 
 Keep this running in the background.
@@ -1463,6 +892,7 @@ Press Ctrl+C to stop.
     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Server is now listening and ready to accept requests...")
     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] You can test the server by visiting: http://127.0.0.1:{port}/")
     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Status endpoint: http://127.0.0.1:{port}/status")
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Live output: http://127.0.0.1:{port}/runs/<run_id>/tail?since=<offset>")
     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Add test endpoint: http://127.0.0.1:{port}/add-test")
     print()
     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] OK: SERVER IS RUNNING - Ready to accept test requests!")
@@ -1493,12 +923,10 @@ Press Ctrl+C to stop.
     except KeyboardInterrupt:
         print("\n\nShutting down server...")
         httpd.shutdown()
-        remove_lock()
         remove_pid_file()
         print("Server stopped.")
     except Exception as e:
         remove_pid_file()
-        remove_lock()
         raise
 
 
@@ -1517,10 +945,19 @@ if __name__ == '__main__':
     try:
         parser = argparse.ArgumentParser(description='Run always-on test server')
         parser.add_argument('--port', type=int, default=8766, help='Port to run server on (default: 8766)')
+        parser.add_argument('--standby', action='store_true', help='Warm up, then wait for server_keep_alive.py to promote this process')
         args = parser.parse_args()
         
+        if args.standby:
+            # Hot standby: load the test index and runtime history now, not after a crash
+            from utils.server_keep_alive import wait_for_promotion
+            test_discovery.node_index()
+            run_estimates.history_stats()
+            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Standby warmed up - waiting to be promoted")
+            wait_for_promotion()
+        
         print(f"Starting server on port {args.port}...")
-        run_server(args.port)
+        run_server(args.port, supervised=args.standby)
     except KeyboardInterrupt:
         print("\n\nServer stopped by user (Ctrl+C)")
         sys.exit(0)
@@ -8,6 +8,8 @@ When you open http://localhost:8888 in any browser, it will:
 
 import http.server
 import socketserver
+import email.utils
+import re
 from socketserver import ThreadingMixIn
 import subprocess
 import sys
@@ -28,6 +30,13 @@ LOG_API_SCRIPT = PROJECT_ROOT / 'utils' / 'log_history_api.py'
 
 PORT = 8888
 
+# Content-hashed assets (dashboard.<hash>.css/js) never change, so browsers may keep them
+HASHED_ASSET_PATTERN = re.compile(r'\.[0-9a-f]{12}\.(css|js)$')
+HASHED_ASSET_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+# Everything else is revalidated with ETag/Last-Modified (cheap 304 when unchanged)
+DEFAULT_CACHE_CONTROL = 'no-cache'
+RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+
 
 def is_port_in_use(port):
     """Check if a port is already in use."""
@@ -147,7 +156,15 @@ def ensure_servers_running():
 
 
 class DashboardHandler(http.server.SimpleHTTPRequestHandler):
-    """HTTP handler for serving dashboard."""
+    """HTTP handler for serving dashboard.
+
+    Serves a precompressed <file>.gz when the client accepts gzip, answers
+    conditional requests (If-None-Match / If-Modified-Since) with 304, gives
+    content-hashed assets a long-lived Cache-Control and supports single
+    byte-range requests (for large log downloads). Keep-alive via HTTP/1.1.
+    """
+    
+    protocol_version = 'HTTP/1.1'
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=str(PROJECT_ROOT), **kwargs)
@@ -166,6 +183,132 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
         # Serve the file using parent class
         return super().do_GET()
     
+    def send_head(self):
+        """Send headers for a file (compression, validators, ranges); directories use the default."""
+        self._range = None
+        path = self.translate_path(self.path)
+        if os.path.isdir(path) or path.endswith('/'):
+            return super().send_head()
+        try:
+            source_stat = os.stat(path)
+        except OSError:
+            self.send_error(404, "File not found")
+            return None
+        
+        # Prefer a precompressed variant if the client accepts it and it's up to date
+        serve_path, serve_stat, encoding = path, source_stat, None
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            try:
+                gz_stat = os.stat(path + '.gz')
+                if gz_stat.st_mtime >= source_stat.st_mtime:
+                    serve_path, serve_stat, encoding = path + '.gz', gz_stat, 'gzip'
+            except OSError:
+                pass
+        
+        etag = f'"{serve_stat.st_size:x}-{serve_stat.st_mtime_ns:x}{"-gz" if encoding else ""}"'
+        last_modified = self.date_time_string(serve_stat.st_mtime)
+        cache_control = HASHED_ASSET_CACHE_CONTROL if HASHED_ASSET_PATTERN.search(path) else DEFAULT_CACHE_CONTROL
+        
+        if self._not_modified(etag, serve_stat.st_mtime):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", cache_control)
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return None
+        
+        try:
+            f = open(serve_path, 'rb')
+        except OSError:
+            self.send_error(404, "File not found")
+            return None
+        
+        size = serve_stat.st_size
+        status, length = 200, size
+        # Byte ranges only apply to the identity encoding
+        range_header = self.headers.get('Range')
+        if range_header and not encoding and self._if_range_matches(etag, last_modified):
+            byte_range = self._parse_range(range_header, size)
+            if byte_range == 'unsatisfiable':
+                f.close()
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return None
+            if byte_range:
+                start, end = byte_range
+                status, length = 206, end - start + 1
+                self._range = (start, length)
+        
+        self.send_response(status)
+        self.send_header("Content-type", self.guess_type(path))
+        self.send_header("Content-Length", str(length))
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {self._range[0]}-{self._range[0] + length - 1}/{size}")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", last_modified)
+        self.send_header("Cache-Control", cache_control)
+        self.end_headers()
+        return f
+    
+    def _not_modified(self, etag, mtime):
+        """True if the client's cached copy is still current."""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match:
+            # ETag wins over If-Modified-Since when both are sent
+            tags = [tag.strip() for tag in if_none_match.split(',')]
+            return '*' in tags or etag in tags or f'W/{etag}' in tags
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, IndexError, OverflowError, ValueError):
+                return False
+            return int(mtime) <= since
+        return False
+    
+    def _if_range_matches(self, etag, last_modified):
+        """A Range is only honored if If-Range (when sent) still matches the file."""
+        if_range = self.headers.get('If-Range')
+        return not if_range or if_range.strip() in (etag, last_modified)
+    
+    @staticmethod
+    def _parse_range(range_header, size):
+        """Parse a single 'bytes=start-end' range; None if unsupported, 'unsatisfiable' if out of bounds."""
+        match = RANGE_PATTERN.match(range_header.strip())
+        if not match or (not match.group(1) and not match.group(2)):
+            return None
+        if match.group(1):
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else size - 1
+        else:
+            # Suffix range: the last N bytes
+            suffix = int(match.group(2))
+            if suffix == 0:
+                return 'unsatisfiable'
+            start, end = max(0, size - suffix), size - 1
+        if start >= size or end < start:
+            return 'unsatisfiable'
+        return start, min(end, size - 1)
+    
+    def copyfile(self, source, outputfile):
+        """Copy the whole file, or just the requested byte range."""
+        if not self._range:
+            return super().copyfile(source, outputfile)
+        start, remaining = self._range
+        source.seek(start)
+        while remaining > 0:
+            chunk = source.read(min(64 * 1024, remaining))
+            if not chunk:
+                break
+            outputfile.write(chunk)
+            remaining -= len(chunk)
+    
     def end_headers(self):
         """Override to add CORS headers."""
         self.send_header('Access-Control-Allow-Origin', '*')
@@ -181,7 +324,9 @@ class DashboardHandler(http.server.SimpleHTTPRequestHandler):
 
 class ThreadingTCPServer(ThreadingMixIn, socketserver.TCPServer):
     """Handle requests in a separate thread."""
-    pass
+    # Keep-alive connections may stay open; don't let them block shutdown
+    daemon_threads = True
+    allow_reuse_address = True
 
 
 def run_dashboard_server(port=8888):
@@ -0,0 +1,1507 @@
+// Dashboard script. Static and content-hashed by unified_log_viewer.py, so the
+// browser caches it; the test results come from dashboard-data.json.
+
+// Dashboard Data
+function loadDashboardData() {
+    if (window.location.protocol === 'file:') {
+        // Browsers block fetch() for file:// pages, so load the script copy of the data
+        return new Promise(function(resolve, reject) {
+            const script = document.createElement('script');
+            script.src = 'dashboard-data.js?t=' + Date.now();
+            script.onload = function() { resolve(window.DASHBOARD_DATA); };
+            script.onerror = function() { reject(new Error('Could not load dashboard-data.js')); };
+            document.head.appendChild(script);
+        });
+    }
+    // no-cache revalidates with the server, so an unchanged file is a cheap 304
+    return fetch('dashboard-data.json', { cache: 'no-cache' }).then(function(response) {
+        if (!response.ok) throw new Error('HTTP ' + response.status);
+        return response.json();
+    });
+}
+
+function escapeAttr(text) {
+    return String(text === undefined || text === null ? '' : text)
+        .replace(/&/g, '&amp;')
+        .replace(/"/g, '&quot;')
+        .replace(/'/g, '&#x27;')
+        .replace(/</g, '&lt;')
+        .replace(/>/g, '&gt;');
+}
+
+function testStatusClass(info) {
+    return info.status.toLowerCase().replace(/_/g, '-');
+}
+
+// Name of the test whose details are open; recycled rows keep their highlight
+let activeTestName = null;
+
+function renderTestItem(test) {
+    const info = test.info;
+    const statusLower = testStatusClass(info);
+    let regressionHtml = '';
+    const regression = info.runtime_regression;
+    if (regression) {
+        const title = 'Runtime regression: median ' + regression.recent_median_seconds + 's over the last ' +
+            regression.recent_runs + ' runs vs ' + regression.baseline_median_seconds + 's baseline';
+        const label = regression.ratio ? '⏱ ' + regression.ratio + 'x slower' : '⏱ slower';
+        regressionHtml = `<span class="runtime-regression" title="${escapeAttr(title)}">${label}</span>`;
+    }
+    const activeClass = info.name === activeTestName ? ' active' : '';
+    // Rows scrolled out and back in are re-rendered, so a running test keeps its disabled button
+    const runButton = runningTests.has(info.name)
+        ? '<button class="run-test-btn running" disabled style="pointer-events: none; opacity: 0.7; cursor: not-allowed;">⏳ Running...</button>'
+        : `<button class="run-test-btn" onclick="event.stopPropagation(); runTest(this.closest('.test-item').dataset.testName, event)" title="Run this test">
+                    ▶ Run Test
+                </button>`;
+    return `
+        <div class="test-item ${statusLower}${activeClass}" data-test-info="${escapeAttr(JSON.stringify(info))}" data-test-name="${escapeAttr(info.name)}" onclick="showTestDetails(this)">
+            <div class="test-name">${escapeAttr(test.display_name)}</div>
+            <div class="test-badge ${statusLower}">${info.status.replace(/_/g, ' ')}</div>
+            <div class="test-source">Source: ${escapeAttr(info.source)}${regressionHtml}</div>
+            <div class="test-actions">
+                ${runButton}
+            </div>
+        </div>
+    `;
+}
+
+function createTestItemElement(test) {
+    const template = document.createElement('template');
+    template.innerHTML = renderTestItem(test).trim();
+    return template.content.firstElementChild;
+}
+
+// Section id -> VirtualList; only the rows in view are in the DOM
+const testLists = {};
+
+function getTestList(sectionId) {
+    if (!testLists[sectionId]) {
+        const container = document.querySelector('#' + sectionId + ' .test-list-container');
+        if (!container) return null;
+        container.innerHTML = '<div class="test-list"></div>';
+        const list = new VirtualList({
+            scrollElement: container,
+            listElement: container.firstElementChild,
+            renderRow: createTestItemElement,
+            getKey: function(test) { return test.info.source + ':' + test.info.name; },
+            getSignature: function(test) {
+                return JSON.stringify(test) + (runningTests.has(test.info.name) ? '|running' : '');
+            },
+            renderEmpty: function() {
+                if (list.items.length > 0) return null;  // Filtered out: filterByStatus shows its own message
+                const empty = document.createElement('div');
+                empty.className = 'no-tests';
+                empty.textContent = 'No tests found';
+                return empty;
+            },
+            estimatedRowHeight: 90
+        });
+        testLists[sectionId] = list;
+    }
+    return testLists[sectionId];
+}
+
+function countTestStatuses(sectionId) {
+    const counts = { total: 0, pass: 0, fail: 0, skip: 0, 'not-run': 0 };
+    const list = testLists[sectionId];
+    if (list) {
+        list.items.forEach(function(test) {
+            const status = testStatusClass(test.info);
+            counts.total++;
+            if (status in counts) counts[status]++;
+        });
+    }
+    return counts;
+}
+
+function renderDashboardData(data) {
+    const bySource = function(sources) {
+        return data.tests.filter(function(test) { return sources.includes(test.info.source); });
+    };
+    const sections = {
+        'all-tests': bySource(['Admin', 'Recruiter']),
+        'admin-tests': bySource(['Admin']),
+        'recruiter-tests': bySource(['Recruiter']),
+        'employer-tests': bySource(['Employer']),
+        'jobseeker-tests': bySource(['Job Seeker'])
+    };
+    Object.keys(sections).forEach(function(sectionId) {
+        // On refresh only the rows whose data changed are re-rendered
+        const list = getTestList(sectionId);
+        if (list) list.setItems(sections[sectionId]);
+    });
+
+    document.getElementById('tab-admin-count').textContent = sections['admin-tests'].length;
+    document.getElementById('tab-recruiter-count').textContent = sections['recruiter-tests'].length;
+    document.getElementById('tab-employer-count').textContent = sections['employer-tests'].length;
+    document.getElementById('tab-jobseeker-count').textContent = sections['jobseeker-tests'].length;
+
+    document.getElementById('last-run-time-main').textContent = data.last_updated;
+    document.getElementById('last-run-time-benchsale').textContent = data.last_run.benchsale;
+    document.getElementById('last-run-time-employer').textContent = data.last_run.employer;
+    document.getElementById('last-run-time-jobseeker').textContent = data.last_run.jobseeker;
+
+    ['employer', 'jobseeker'].forEach(function(module) {
+        const stats = data.stats[module];
+        ['total', 'passed', 'failed', 'skipped', 'not_run'].forEach(function(key) {
+            const el = document.getElementById('stat-' + module + '-' + key.replace('_', '-') + '-num');
+            if (el) el.textContent = stats[key];
+        });
+    });
+
+    const logLinks = document.getElementById('log-links-content');
+    if (logLinks) {
+        logLinks.innerHTML = data.log_links.length
+            ? data.log_links.map(function(link) {
+                return `<a href="${escapeAttr(link.href)}" class="log-link" target="_blank">${escapeAttr(link.label)}</a>`;
+            }).join('')
+            : '<p>No log files available</p>';
+    }
+    return data;
+}
+
+const dashboardDataReady = loadDashboardData().then(renderDashboardData).catch(function(e) {
+    console.error('Error loading dashboard data:', e);
+    document.querySelectorAll('.test-list-container').forEach(function(container) {
+        container.innerHTML = '<div class="no-tests">Error loading tests: ' + escapeAttr(e.message) + '</div>';
+    });
+    throw e;
+});
+
+// Run page setup that needs the rendered tests once both the DOM and the data are ready
+function onDashboardReady(callback) {
+    document.addEventListener('DOMContentLoaded', function() {
+        dashboardDataReady.then(callback, function() {});
+    });
+}
+
+// "~45s" / "~12m" / "~1h 05m" from seconds (ETAs in /status are epoch seconds)
+function formatEta(seconds) {
+    seconds = Math.max(0, Math.round(seconds));
+    if (seconds < 60) return '~' + seconds + 's';
+    const minutes = Math.round(seconds / 60);
+    if (minutes < 60) return '~' + minutes + 'm';
+    return '~' + Math.floor(minutes / 60) + 'h ' + String(minutes % 60).padStart(2, '0') + 'm';
+}
+
+// Server Status Management
+function checkServerStatus() {
+    const statusIndicator = document.getElementById('server-status-indicator');
+    const statusText = document.getElementById('server-status-text');
+    const startBtn = document.getElementById('start-server-btn');
+
+    if (!statusIndicator) return;
+
+    // Check main server directly on port 8766 (more reliable)
+    fetch('http://127.0.0.1:8766/status?t=' + Date.now(), {
+        method: 'GET',
+        mode: 'cors',
+        cache: 'no-cache',
+        headers: {
+            'Accept': 'application/json'
+        }
+    })
+    .then(r => {
+        if (!r.ok) {
+            throw new Error('Server returned ' + r.status);
+        }
+        return r.json();
+    })
+    .then(d => {
+        // Server is responding - any response means server is running
+        const completion = d.eta && d.eta.estimated_completion;
+        statusText.textContent = completion
+            ? 'Server: Running (' + (d.queue_size || 0) + ' queued, done in ' + formatEta(completion - Date.now() / 1000) + ')'
+            : 'Server: Running';
+        statusText.style.color = '#10B981'; // Green
+        if (startBtn) {
+            startBtn.style.display = 'none';
+            startBtn.disabled = false;
+        }
+        console.log('Server status: Running (busy=' + (d.busy || false) + ', queue=' + (d.queue_size || 0) + ')');
+    })
+    .catch((error) => {
+        console.log('Server check failed on port 8766:', error.message);
+        // Server not responding, try helper server (port 8767) as fallback
+        fetch('http://127.0.0.1:8767/status?t=' + Date.now(), {
+            method: 'GET',
+            mode: 'cors',
+            cache: 'no-cache'
+        })
+        .then(response => {
+            if (!response.ok) throw new Error('Helper server returned ' + response.status);
+            return response.json();
+        })
+        .then(data => {
+            if (data.running) {
+                statusText.textContent = 'Server: Running';
+                statusText.style.color = '#10B981';
+                if (startBtn) {
+                    startBtn.style.display = 'none';
+                    startBtn.disabled = false;
+                }
+            } else {
+                statusText.textContent = 'Server: Stopped';
+                statusText.style.color = '#EF4444'; // Red
+                if (startBtn) {
+                    startBtn.style.display = 'inline-block';
+                    startBtn.disabled = false;
+                }
+            }
+        })
+        .catch((fallbackError) => {
+            console.log('Both servers not responding:', fallbackError.message);
+            // Both servers not responding
+            statusText.textContent = 'Server: Stopped';
+            statusText.style.color = '#EF4444'; // Red
+            if (startBtn) {
+                startBtn.style.display = 'inline-block';
+                startBtn.disabled = false;
+            }
+        });
+    });
+}
+
+function startServer() {
+    const startBtn = document.getElementById('start-server-btn');
+    if (startBtn) {
+        startBtn.textContent = 'Starting...';
+        startBtn.disabled = true;
+    }
+
+    // First try helper server (port 8767) if available
+    fetch('http://127.0.0.1:8767/start', { method: 'POST', timeout: 3000 })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            showNotification('success', 'Server Started', 'Test server is starting... Please wait 5 seconds.', 5000);
+            setTimeout(checkServerStatus, 5000);
+        } else {
+            showNotification('info', 'Starting Server', 'Server start command sent.', 3000);
+            setTimeout(checkServerStatus, 5000);
+        }
+    })
+    .catch(() => {
+        // Helper server not available, show instructions
+        const message = `Server cannot be started automatically.\n\n` +
+            `Please do ONE of the following:\n\n` +
+            `1. Double-click: START_ALWAYS_ON_SERVER.bat\n` +
+            `2. Or run in terminal: python utils\\always_on_server.py\n\n` +
+            `The server will run on port 8766.\n` +
+            `Keep the window open while using the dashboard.`;
+
+        showNotification('warning', 'Start Server Manually', message, 10000);
+
+        // Copy command to clipboard if possible
+        const command = 'python utils\always_on_server.py';
+        if (navigator.clipboard && navigator.clipboard.writeText) {
+            navigator.clipboard.writeText(command).then(() => {
+                console.log('Command copied to clipboard: ' + command);
+            }).catch(() => {});
+        }
+
+        if (startBtn) {
+            startBtn.textContent = 'Start Server';
+            startBtn.disabled = false;
+        }
+    });
+}
+
+// Check if page is loaded via file:// protocol (CORS issue)
+// Only show warning once per session to avoid annoying user
+if (window.location.protocol === 'file:') {
+    const httpUrl = 'http://127.0.0.1:8888/logs/index.html' + window.location.search;
+    console.warn('⚠️ Dashboard loaded via file:// protocol - CORS will block server status checks!');
+    console.warn('💡 For full functionality, use: ' + httpUrl);
+
+    // Only show notification once per browser session (check sessionStorage)
+    const warningShown = sessionStorage.getItem('fileProtocolWarningShown');
+    if (!warningShown) {
+        sessionStorage.setItem('fileProtocolWarningShown', 'true');
+        // Show notification about file:// protocol issue (shorter, less intrusive)
+        setTimeout(() => {
+            const message = `Dashboard loaded via file:// protocol.\n\n` +
+                `For full functionality, use:\n` +
+                `http://127.0.0.1:8888/logs/index.html\n\n` +
+                `Or run: OPEN_DASHBOARD.bat`;
+            showNotification('warning', 'File Protocol Detected', message, 8000);
+        }, 3000); // Show after 3 seconds, not immediately
+    }
+}
+
+// Check status on load and every 5 seconds
+document.addEventListener('DOMContentLoaded', function() {
+    // Check server status immediately on page load
+    checkServerStatus();
+    // Also check after a short delay to ensure everything is ready
+    setTimeout(checkServerStatus, 1000);
+    // Check server status every 5 seconds (more frequent for better UX)
+    setInterval(checkServerStatus, 5000);
+});
+
+// Global filter state
+let currentStatusFilter = 'all';
+
+function filterByStatus(status) {
+    currentStatusFilter = status;
+
+    // 1. Update Visuals on Cards
+    // Remove active class from all
+    document.querySelectorAll('.stat-card').forEach(card => {
+        card.classList.remove('active-filter');
+    });
+
+    // Add active class to clicked card(s) matching the status
+    let selector = '';
+    if (status === 'all') selector = '.stat-card.total:not(.not-run-stat)';
+    else if (status === 'pass') selector = '.stat-card.passed';
+    else if (status === 'fail') selector = '.stat-card.failed';
+    else if (status === 'skip') selector = '.stat-card.skipped';
+    else if (status === 'not-run') selector = '.stat-card.not-run-stat';
+
+    // Only highlight visible cards
+    document.querySelectorAll(selector).forEach(card => {
+        if (window.getComputedStyle(card).display !== 'none') {
+            card.classList.add('active-filter');
+        }
+    });
+
+    // 2. Filter Test Items in current active section (on the in-memory list, not the DOM)
+    const activeSection = document.querySelector('.test-section.active');
+    if (activeSection) {
+        const predicate = status === 'all' ? null : function(test) {
+            return testStatusClass(test.info) === status;
+        };
+        Object.keys(testLists).forEach(function(sectionId) {
+            testLists[sectionId].setFilter(sectionId === activeSection.id ? predicate : null);
+        });
+        const activeList = testLists[activeSection.id];
+        const visibleCount = activeList ? activeList.itemCount : 0;
+
+        // Show/Hide "No tests" message
+        let noTestsMsg = activeSection.querySelector('.no-tests-message');
+        if (visibleCount === 0) {
+            if (!noTestsMsg) {
+                noTestsMsg = document.createElement('div');
+                noTestsMsg.className = 'no-tests-message';
+                noTestsMsg.style.textAlign = 'center';
+                noTestsMsg.style.padding = '40px';
+                noTestsMsg.style.color = 'var(--text-secondary)';
+                noTestsMsg.style.fontSize = '1.2em';
+                activeSection.appendChild(noTestsMsg);
+            }
+            noTestsMsg.textContent = status === 'all' ? 'No tests found in this section.' : 'No ' + status + ' tests found.';
+            noTestsMsg.style.display = 'block';
+        } else {
+            if (noTestsMsg) noTestsMsg.style.display = 'none';
+        }
+    }
+}
+
+function updateStatistics(section) {
+    const counts = countTestStatuses(section === 'all' ? 'all-tests' : section + '-tests');
+    const total = counts.total;
+    const passed = counts.pass;
+    const failed = counts.fail;
+    const skipped = counts.skip;
+    const notRun = counts['not-run'];
+
+    const statsGrid = document.getElementById('stats-grid');
+    if (section === 'employer') {
+        // Hide BenchSale tabs and stats, show only Employer
+        document.querySelectorAll('.benchsale-tab').forEach(tab => tab.style.display = 'none');
+        document.querySelectorAll('.benchsale-stat').forEach(el => el.style.display = 'none');
+        document.querySelectorAll('.employer-stat').forEach(el => el.style.display = 'flex');
+        document.querySelectorAll('.jobseeker-stat').forEach(el => el.style.display = 'none');
+        // Hide all BenchSale and Job Seeker test sections completely
+        document.getElementById('all-tests').style.display = 'none';
+        document.getElementById('admin-tests').style.display = 'none';
+        document.getElementById('recruiter-tests').style.display = 'none';
+        document.getElementById('jobseeker-tests').style.display = 'none';
+        // Show only Employer test section
+        document.getElementById('employer-tests').style.display = 'block';
+        // Update Employer statistics
+        const employerCounts = countTestStatuses('employer-tests');
+        document.getElementById('stat-employer-total-num').textContent = employerCounts.total;
+        document.getElementById('stat-employer-passed-num').textContent = employerCounts.pass;
+        document.getElementById('stat-employer-failed-num').textContent = employerCounts.fail;
+        document.getElementById('stat-employer-skipped-num').textContent = employerCounts.skip;
+        document.getElementById('stat-employer-not-run-num').textContent = employerCounts['not-run'];
+        if (statsGrid) statsGrid.style.gridTemplateColumns = 'repeat(auto-fit, minmax(180px, 1fr))';
+    } else if (section === 'jobseeker') {
+        // Hide BenchSale tabs and stats, show only Job Seeker
+        document.querySelectorAll('.benchsale-tab').forEach(tab => tab.style.display = 'none');
+        document.querySelectorAll('.benchsale-stat').forEach(el => el.style.display = 'none');
+        document.querySelectorAll('.employer-stat').forEach(el => el.style.display = 'none');
+        document.querySelectorAll('.jobseeker-stat').forEach(el => el.style.display = 'flex');
+        // Hide all BenchSale and Employer test sections completely
+        document.getElementById('all-tests').style.display = 'none';
+        document.getElementById('admin-tests').style.display = 'none';
+        document.getElementById('recruiter-tests').style.display = 'none';
+        document.getElementById('employer-tests').style.display = 'none';
+        // Show only Job Seeker test section
+        document.getElementById('jobseeker-tests').style.display = 'block';
+        // Update Job Seeker statistics
+        const jobseekerCounts = countTestStatuses('jobseeker-tests');
+        document.getElementById('stat-jobseeker-total-num').textContent = jobseekerCounts.total;
+        document.getElementById('stat-jobseeker-passed-num').textContent = jobseekerCounts.pass;
+        document.getElementById('stat-jobseeker-failed-num').textContent = jobseekerCounts.fail;
+        document.getElementById('stat-jobseeker-skipped-num').textContent = jobseekerCounts.skip;
+        document.getElementById('stat-jobseeker-not-run-num').textContent = jobseekerCounts['not-run'];
+        if (statsGrid) statsGrid.style.gridTemplateColumns = 'repeat(auto-fit, minmax(180px, 1fr))';
+    } else {
+        // Show BenchSale tabs and stats, hide Employer and Job Seeker
+        document.querySelectorAll('.benchsale-tab').forEach(tab => tab.style.display = 'block');
+        document.getElementById('tab-employer').style.display = 'none';
+        document.getElementById('tab-jobseeker').style.display = 'none';
+        document.querySelectorAll('.benchsale-stat').forEach(el => el.style.display = 'flex');
+        document.querySelectorAll('.employer-stat').forEach(el => el.style.display = 'none');
+        document.querySelectorAll('.jobseeker-stat').forEach(el => el.style.display = 'none');
+        // Hide Employer and Job Seeker test sections completely
+        document.getElementById('employer-tests').style.display = 'none';
+        document.getElementById('jobseeker-tests').style.display = 'none';
+
+        // Update BenchSale stats based on active section
+        // Use the already calculated values from the top of the function
+        const statTotal = document.getElementById('stat-total');
+        const statPassed = document.getElementById('stat-passed');
+        const statFailed = document.getElementById('stat-failed');
+        const statSkipped = document.getElementById('stat-skipped');
+        const statNotRun = document.getElementById('stat-not-run');
+
+        if (statTotal) statTotal.textContent = total;
+        if (statPassed) statPassed.textContent = passed;
+        if (statFailed) statFailed.textContent = failed;
+        if (statSkipped) statSkipped.textContent = skipped;
+        if (statNotRun) statNotRun.textContent = notRun;
+        if (statsGrid) statsGrid.style.gridTemplateColumns = 'repeat(auto-fit, minmax(180px, 1fr))';
+    }
+
+    const titleElement = document.getElementById('dashboard-title');
+    const urlParams = new URLSearchParams(window.location.search);
+    const filter = urlParams.get('filter');
+
+    // Update logo and title based on section
+    const benchsaleLogo = document.getElementById('benchsale-logo');
+    const employerLogo = document.getElementById('employer-logo');
+    const jobseekerLogo = document.getElementById('jobseeker-logo');
+    const logoContainer = document.getElementById('dashboard-logo');
+
+    if (filter === 'employer' || section === 'employer') {
+        titleElement.textContent = 'Employer Test Dashboard';
+        if (benchsaleLogo) benchsaleLogo.style.display = 'none';
+        if (employerLogo) employerLogo.style.display = 'block';
+        if (jobseekerLogo) jobseekerLogo.style.display = 'none';
+        if (logoContainer) logoContainer.className = 'dashboard-logo employer-logo';
+    } else if (filter === 'jobseeker' || section === 'jobseeker') {
+        titleElement.textContent = 'Job Seeker Test Dashboard';
+        if (benchsaleLogo) benchsaleLogo.style.display = 'none';
+        if (employerLogo) employerLogo.style.display = 'none';
+        if (jobseekerLogo) jobseekerLogo.style.display = 'block';
+        if (logoContainer) logoContainer.className = 'dashboard-logo jobseeker-logo';
+    } else {
+        titleElement.textContent = 'BenchSale Test Dashboard';
+        if (benchsaleLogo) benchsaleLogo.style.display = 'block';
+        if (employerLogo) employerLogo.style.display = 'none';
+        if (jobseekerLogo) jobseekerLogo.style.display = 'none';
+        if (logoContainer) logoContainer.className = 'dashboard-logo';
+    }
+}
+
+function showSection(section, clickedElement) {
+    // Reset filter when switching sections
+    filterByStatus('all');
+
+    // Hide/Show tabs and sections based on section
+    if (section === 'employer') {
+        // Hide BenchSale tabs when showing Employer
+        document.querySelectorAll('.benchsale-tab').forEach(tab => tab.style.display = 'none');
+        document.getElementById('tab-employer').style.display = 'block';
+        document.getElementById('tab-jobseeker').style.display = 'none';
+        // Hide all BenchSale and Job Seeker test sections completely
+        document.getElementById('all-tests').style.display = 'none';
+        document.getElementById('admin-tests').style.display = 'none';
+        document.getElementById('recruiter-tests').style.display = 'none';
+        document.getElementById('jobseeker-tests').style.display = 'none';
+        // Show only Employer test section
+        document.getElementById('employer-tests').style.display = 'block';
+        // Show Employer log link, hide BenchSale and Job Seeker log links
+        const logLinks = document.getElementById('log-links-content');
+        if (logLinks) {
+            const employerLogLink = logLinks.querySelector('a[href*="module=employer"]');
+            if (employerLogLink) employerLogLink.style.display = 'inline-block';
+            logLinks.querySelectorAll('a[href*="benchsale"]').forEach(link => link.style.display = 'none');
+            const jobseekerLogLink = logLinks.querySelector('a[href*="module=jobseeker"]');
+            if (jobseekerLogLink) jobseekerLogLink.style.display = 'none';
+        }
+    } else if (section === 'jobseeker') {
+        // Hide BenchSale tabs when showing Job Seeker
+        document.querySelectorAll('.benchsale-tab').forEach(tab => tab.style.display = 'none');
+        document.getElementById('tab-employer').style.display = 'none';
+        document.getElementById('tab-jobseeker').style.display = 'block';
+        // Hide all BenchSale and Employer test sections completely
+        document.getElementById('all-tests').style.display = 'none';
+        document.getElementById('admin-tests').style.display = 'none';
+        document.getElementById('recruiter-tests').style.display = 'none';
+        document.getElementById('employer-tests').style.display = 'none';
+        // Show only Job Seeker test section
+        document.getElementById('jobseeker-tests').style.display = 'block';
+        // Show Job Seeker log link, hide BenchSale and Employer log links
+        const logLinks = document.getElementById('log-links-content');
+        if (logLinks) {
+            const jobseekerLogLink = logLinks.querySelector('a[href*="module=jobseeker"]');
+            if (jobseekerLogLink) jobseekerLogLink.style.display = 'inline-block';
+            logLinks.querySelectorAll('a[href*="benchsale"]').forEach(link => link.style.display = 'none');
+            const employerLogLink = logLinks.querySelector('a[href*="module=employer"]');
+            if (employerLogLink) employerLogLink.style.display = 'none';
+        }
+    } else {
+        // Show BenchSale tabs, hide Employer and Job Seeker tabs
+        document.querySelectorAll('.benchsale-tab').forEach(tab => tab.style.display = 'block');
+        document.getElementById('tab-employer').style.display = 'none';
+        document.getElementById('tab-jobseeker').style.display = 'none';
+        // Hide Employer and Job Seeker test sections completely
+        document.getElementById('employer-tests').style.display = 'none';
+        document.getElementById('jobseeker-tests').style.display = 'none';
+
+        // Hide Employer and Job Seeker log links in BenchSale dashboard
+        const logLinks = document.getElementById('log-links-content');
+        if (logLinks) {
+            const employerLogLink = logLinks.querySelector('a[href*="module=employer"]');
+            if (employerLogLink) employerLogLink.style.display = 'none';
+            const jobseekerLogLink = logLinks.querySelector('a[href*="module=jobseeker"]');
+            if (jobseekerLogLink) jobseekerLogLink.style.display = 'none';
+
+            // Show/hide BenchSale log links based on selected section
+            const adminLogLink = logLinks.querySelector('a[href*="benchsale_admin"]');
+            const recruiterLogLink = logLinks.querySelector('a[href*="benchsale_recruiter"]');
+            const mainLogLink = logLinks.querySelector('a[href*="benchsale_test"]');
+
+            if (section === 'all') {
+                // Show all BenchSale log links
+                if (adminLogLink) adminLogLink.style.display = 'inline-block';
+                if (recruiterLogLink) recruiterLogLink.style.display = 'inline-block';
+                if (mainLogLink) mainLogLink.style.display = 'inline-block';
+            } else if (section === 'admin') {
+                // Show only Admin log link
+                if (adminLogLink) adminLogLink.style.display = 'inline-block';
+                if (recruiterLogLink) recruiterLogLink.style.display = 'none';
+                if (mainLogLink) mainLogLink.style.display = 'none';
+            } else if (section === 'recruiter') {
+                // Show only Recruiter log link
+                if (adminLogLink) adminLogLink.style.display = 'none';
+                if (recruiterLogLink) recruiterLogLink.style.display = 'inline-block';
+                if (mainLogLink) mainLogLink.style.display = 'none';
+            } else {
+                // Default: show all BenchSale log links
+                if (adminLogLink) adminLogLink.style.display = 'inline-block';
+                if (recruiterLogLink) recruiterLogLink.style.display = 'inline-block';
+                if (mainLogLink) mainLogLink.style.display = 'inline-block';
+            }
+        }
+
+        // Show/hide BenchSale sections based on selected section
+        if (section === 'all') {
+            // Show only "All Tests" section
+            document.getElementById('all-tests').style.display = 'block';
+            document.getElementById('admin-tests').style.display = 'none';
+            document.getElementById('recruiter-tests').style.display = 'none';
+        } else if (section === 'admin') {
+            // Show only "Admin Tests" section
+            document.getElementById('all-tests').style.display = 'none';
+            document.getElementById('admin-tests').style.display = 'block';
+            document.getElementById('recruiter-tests').style.display = 'none';
+        } else if (section === 'recruiter') {
+            // Show only "Recruiter Tests" section
+            document.getElementById('all-tests').style.display = 'none';
+            document.getElementById('admin-tests').style.display = 'none';
+            document.getElementById('recruiter-tests').style.display = 'block';
+        } else {
+            // Default: show all BenchSale sections
+            document.getElementById('all-tests').style.display = 'block';
+            document.getElementById('admin-tests').style.display = 'block';
+            document.getElementById('recruiter-tests').style.display = 'block';
+        }
+    }
+
+    document.querySelectorAll('.test-section').forEach(s => s.classList.remove('active'));
+    document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
+
+    const sectionId = section === 'all' ? 'all-tests' : section + '-tests';
+    const sectionElement = document.getElementById(sectionId);
+    if (sectionElement) {
+        sectionElement.classList.add('active');
+    }
+
+    // Update logo and title based on section
+    const titleElement = document.getElementById('dashboard-title');
+    const benchsaleLogo = document.getElementById('benchsale-logo');
+    const employerLogo = document.getElementById('employer-logo');
+    const jobseekerLogo = document.getElementById('jobseeker-logo');
+    const logoContainer = document.getElementById('dashboard-logo');
+
+    if (section === 'employer') {
+        if (titleElement) titleElement.textContent = 'Employer Test Dashboard';
+        if (benchsaleLogo) benchsaleLogo.style.display = 'none';
+        if (employerLogo) employerLogo.style.display = 'block';
+        if (jobseekerLogo) jobseekerLogo.style.display = 'none';
+        if (logoContainer) logoContainer.className = 'dashboard-logo employer-logo';
+    } else if (section === 'jobseeker') {
+        if (titleElement) titleElement.textContent = 'Job Seeker Test Dashboard';
+        if (benchsaleLogo) benchsaleLogo.style.display = 'none';
+        if (employerLogo) employerLogo.style.display = 'none';
+        if (jobseekerLogo) jobseekerLogo.style.display = 'block';
+        if (logoContainer) logoContainer.className = 'dashboard-logo jobseeker-logo';
+    } else {
+        if (titleElement) titleElement.textContent = 'BenchSale Test Dashboard';
+        if (benchsaleLogo) benchsaleLogo.style.display = 'block';
+        if (employerLogo) employerLogo.style.display = 'none';
+        if (jobseekerLogo) jobseekerLogo.style.display = 'none';
+        if (logoContainer) logoContainer.className = 'dashboard-logo';
+    }
+
+    if (clickedElement) {
+        clickedElement.classList.add('active');
+    } else {
+        const buttons = document.querySelectorAll('.tab');
+        buttons.forEach(btn => {
+            const onclickAttr = btn.getAttribute('onclick') || '';
+            const btnText = btn.textContent || '';
+            let shouldActivate = false;
+            if (section === 'all') {
+                shouldActivate = onclickAttr.includes("'all'") || btnText.includes('All Tests');
+            } else if (section === 'admin') {
+                shouldActivate = onclickAttr.includes("'admin'") || btnText.includes('Admin Tests');
+            } else if (section === 'recruiter') {
+                shouldActivate = onclickAttr.includes("'recruiter'") || btnText.includes('Recruiter Tests');
+            } else if (section === 'employer') {
+                shouldActivate = onclickAttr.includes("'employer'") || btnText.includes('Employer Tests');
+            } else if (section === 'jobseeker') {
+                shouldActivate = onclickAttr.includes("'jobseeker'") || btnText.includes('Job Seeker Tests');
+            }
+
+            if (shouldActivate) {
+                btn.classList.add('active');
+            }
+        });
+    }
+
+    setTimeout(() => {
+        updateStatistics(section);
+    }, 100);
+
+    try {
+        const url = new URL(window.location);
+        url.searchParams.set('filter', section);
+        window.history.pushState({filter: section}, '', url);
+    } catch(e) {
+        console.log('URL update failed:', e);
+    }
+}
+
+function showTestDetails(testItem) {
+    // Remove active class from all test items
+    document.querySelectorAll('.test-item').forEach(item => {
+        item.classList.remove('active');
+    });
+
+    // Add active class to clicked item
+    testItem.classList.add('active');
+    activeTestName = testItem.dataset.testName;
+
+    // Get test data from data attribute
+    const testDataJson = testItem.getAttribute('data-test-info');
+    if (!testDataJson) return;
+
+    let testData;
+    try {
+        testData = JSON.parse(testDataJson);
+    } catch(e) {
+        console.error('Error parsing test data:', e);
+        return;
+    }
+
+    // Special handling for db_solr_sync to extract job report from failure message if not present
+    if (testData.name && (testData.name.includes('db_solr_sync') || testData.name.includes('DB Solr Sync')) && (!testData.total_jobs || testData.total_jobs === 0) && testData.failure_message) {
+         // Newer failure message format: "Solr Sync Failed for X/Y jobs checked"
+         const quickMatch = testData.failure_message.match(/Solr Sync Failed for\s*(\d+)\s*\/\s*(\d+)\s*jobs checked/i);
+         if (quickMatch) {
+             testData.error_jobs_count = parseInt(quickMatch[1], 10);
+             testData.total_jobs = parseInt(quickMatch[2], 10);
+         }
+         // Try to find JSON report
+         const jsonMatch = testData.failure_message.match(/JSON_REPORT_START\s*({[:\s\S]*?})\s*JSON_REPORT_END/);
+         if (jsonMatch) {
+             try {
+                 const report = JSON.parse(jsonMatch[1]);
+                 if (report.total_jobs) testData.total_jobs = report.total_jobs;
+                 if (report.error_jobs_count) testData.error_jobs_count = report.error_jobs_count;
+             } catch(e) {}
+         }
+
+         // Try to find text table report
+         if (!testData.total_jobs) {
+             const tableMatch = testData.failure_message.match(/Total Jobs Checked:\s*(\d+)/);
+             if (tableMatch) {
+                 testData.total_jobs = parseInt(tableMatch[1], 10);
+                 const failMatch = testData.failure_message.match(/Failures found:\s*(\d+)/);
+                 if (failMatch) {
+                     testData.error_jobs_count = parseInt(failMatch[1], 10);
+                 }
+             }
+         }
+
+         // Try to find older text format
+         if (!testData.total_jobs) {
+             const oldMatch = testData.failure_message.match(/Total Jobs Available in DB \(last 12h\):\s*(\d+)/);
+             if (oldMatch) {
+                 testData.total_jobs = parseInt(oldMatch[1], 10);
+                 const oldFailMatch = testData.failure_message.match(/Total Failures:\s*(\d+)/);
+                 if (oldFailMatch) {
+                     testData.error_jobs_count = parseInt(oldFailMatch[1], 10);
+                 }
+             }
+         }
+    }
+
+    // Find the details panel in the same section
+    const testSection = testItem.closest('.test-section');
+    const detailsPanel = testSection ? testSection.querySelector('.test-details-panel') : null;
+    if (!detailsPanel) return;
+
+    // Build details HTML
+    const status = testData.status || 'NOT_RUN';
+    const statusLower = status.toLowerCase().replace('_', '-');
+    const statusDisplay = status.replace('_', ' ');
+
+    let detailsHTML = `
+        <div class="test-details-header">
+            <div class="test-details-title">${testData.name || 'Test Case'}</div>
+            <div class="test-details-status test-badge ${statusLower}">${statusDisplay}</div>
+        </div>
+
+        <div class="test-details-info">
+            <div class="test-details-info-item">
+                <div class="test-details-info-label">Source</div>
+                <div class="test-details-info-value">${testData.source || 'N/A'}</div>
+            </div>
+            <div class="test-details-info-item">
+                <div class="test-details-info-label">Running Time</div>
+                <div class="test-details-info-value">${testData.running_time || 'N/A'}</div>
+            </div>
+            ${testData.total_jobs ? `
+            <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 15px; margin-top: 15px;">
+                <div style="background: #f8f9fa; border: 1px solid #dee2e6; border-radius: 8px; padding: 15px; text-align: center;">
+                    <div style="font-size: 24px; margin-bottom: 8px;">📊</div>
+                    <div style="font-size: 20px; font-weight: 700; color: #1e293b; margin-bottom: 4px;">${testData.total_jobs.toLocaleString()}</div>
+                    <div style="font-size: 12px; color: #64748b; font-weight: 600; text-transform: uppercase;">Total Jobs Checked</div>
+                </div>
+                ${testData.error_jobs_count !== undefined ? `
+                <div style="background: #fff5f5; border: 1px solid #fed7d7; border-radius: 8px; padding: 15px; text-align: center;">
+                    <div style="font-size: 24px; margin-bottom: 8px;">❌</div>
+                    <div style="font-size: 20px; font-weight: 700; color: #dc3545; margin-bottom: 4px;">${testData.error_jobs_count.toLocaleString()}</div>
+                    <div style="font-size: 12px; color: #64748b; font-weight: 600; text-transform: uppercase;">Failures</div>
+                </div>
+                ` : ''}
+                ${testData.total_jobs && testData.error_jobs_count !== undefined ? `
+                <div style="background: #f0fdf4; border: 1px solid #bbf7d0; border-radius: 8px; padding: 15px; text-align: center;">
+                    <div style="font-size: 24px; margin-bottom: 8px;">📈</div>
+                    <div style="font-size: 20px; font-weight: 700; color: #10b981; margin-bottom: 4px;">${((testData.total_jobs - testData.error_jobs_count) / testData.total_jobs * 100).toFixed(2)}%</div>
+                    <div style="font-size: 12px; color: #64748b; font-weight: 600; text-transform: uppercase;">Success Rate</div>
+                </div>
+                ` : ''}
+            </div>
+            ` : ''}
+        </div>
+
+        <div class="test-details-content">
+    `;
+
+    // Add screenshot ONLY if test failed and screenshot is available
+    // For passed tests, show empty space (no screenshot)
+    if ((status === 'FAIL' || status === 'FAILED') && testData.screenshots && testData.screenshots.length > 0) {
+        const screenshotUrl = testData.screenshots[0];
+        // Show the small thumbnail; the full-size screenshot is only loaded when opened
+        const thumbnailUrl = (testData.screenshot_thumbnails && testData.screenshot_thumbnails[0]) || screenshotUrl;
+        detailsHTML += `
+            <div class="test-details-screenshot">
+                <h4 style="margin-bottom: 10px; font-weight: 600; color: var(--text-primary);">📸 Screenshot</h4>
+                <img src="${thumbnailUrl}" data-full-src="${screenshotUrl}" alt="Test Screenshot"
+                     loading="lazy" decoding="async"
+                     onerror="this.parentElement.style.display='none'"
+                     onclick="openModal(this.dataset.fullSrc || this.src)">
+                <a href="${screenshotUrl}" target="_blank" style="display: inline-block; margin-top: 8px;">Open full screenshot</a>
+            </div>
+        `;
+    }
+
+    // Add artifact links if available (HTML snapshot + URL text)
+    if (testData.artifacts && (testData.artifacts.html_url || testData.artifacts.url_txt_url)) {
+        detailsHTML += `
+            <div class="test-details-location">
+                <div class="test-details-location-title">🧾 Failure Artifacts</div>
+                <div class="test-details-location-content">
+                    ${testData.artifacts.html_url ? `<a href="${testData.artifacts.html_url}" target="_blank">Open HTML snapshot</a>` : ''}
+                    ${testData.artifacts.html_url && testData.artifacts.url_txt_url ? ' | ' : ''}
+                    ${testData.artifacts.url_txt_url ? `<a href="${testData.artifacts.url_txt_url}" target="_blank">Open URL file</a>` : ''}
+                </div>
+            </div>
+        `;
+    }
+
+    // Add failure details if test failed
+    if (status === 'FAIL' || status === 'FAILED') {
+        if (testData.failure_message) {
+            detailsHTML += `
+                <div class="test-details-failure">
+                    <div class="test-details-failure-title">❌ Failure Message</div>
+                    <div class="test-details-failure-content">${escapeHtml(testData.failure_message)}</div>
+                </div>
+            `;
+        }
+
+        if (testData.failure_location) {
+            detailsHTML += `
+                <div class="test-details-location">
+                    <div class="test-details-location-title">📍 Failure Location</div>
+                    <div class="test-details-location-content">${escapeHtml(testData.failure_location)}</div>
+                </div>
+            `;
+        }
+
+        if (testData.xpath) {
+            detailsHTML += `
+                <div class="test-details-location">
+                    <div class="test-details-location-title">🔗 XPath / Element Location</div>
+                    <div class="test-details-location-content">${escapeHtml(testData.xpath)}</div>
+                </div>
+            `;
+        }
+    }
+
+    // Close the content div
+    detailsHTML += '</div>';
+
+    // Update details panel
+    detailsPanel.innerHTML = detailsHTML;
+    detailsPanel.classList.remove('empty');
+    detailsPanel.style.display = 'flex';
+    detailsPanel.style.opacity = '1';
+
+    // Scroll details content to top
+    const contentDiv = detailsPanel.querySelector('.test-details-content');
+    if (contentDiv) {
+        contentDiv.scrollTop = 0;
+    }
+}
+
+function escapeHtml(text) {
+    if (!text) return '';
+    const div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+}
+
+onDashboardReady(function() {
+    const tabs = document.querySelectorAll('.tab');
+    tabs.forEach(tab => {
+        const onclickAttr = tab.getAttribute('onclick');
+        if (onclickAttr) {
+            const match = onclickAttr.match(/showSection\('([^']+)'\)/);
+            if (match) {
+                const section = match[1];
+                tab.removeAttribute('onclick');
+                tab.addEventListener('click', function(e) {
+                    e.preventDefault();
+                    showSection(section, this);
+                });
+            }
+        }
+    });
+
+    const urlParams = new URLSearchParams(window.location.search);
+    const filter = urlParams.get('filter');
+
+    if (filter === 'employer') {
+        // Hide all BenchSale tabs (All Tests, Admin Tests, Recruiter Tests)
+        document.querySelectorAll('.benchsale-tab').forEach(tab => tab.style.display = 'none');
+        // Hide BenchSale stats
+        document.querySelectorAll('.benchsale-stat').forEach(stat => stat.style.display = 'none');
+        document.querySelectorAll('.jobseeker-stat').forEach(stat => stat.style.display = 'none');
+        // Show only Employer tab
+        document.getElementById('tab-employer').style.display = 'block';
+        document.getElementById('tab-employer').classList.add('active');
+        document.getElementById('tab-jobseeker').style.display = 'none';
+        // Hide all BenchSale and Job Seeker test sections completely (not just inactive)
+        document.getElementById('all-tests').style.display = 'none';
+        document.getElementById('admin-tests').style.display = 'none';
+        document.getElementById('recruiter-tests').style.display = 'none';
+        document.getElementById('jobseeker-tests').style.display = 'none';
+        // Show only Employer test section
+        document.getElementById('employer-tests').style.display = 'block';
+        document.getElementById('employer-tests').classList.add('active');
+        // Show Employer log link
+        const logLinks = document.getElementById('log-links-content');
+        if (logLinks) {
+            const employerLogLink = logLinks.querySelector('a[href*="module=employer"]');
+            if (employerLogLink) employerLogLink.style.display = 'inline-block';
+            // Hide BenchSale and Job Seeker log links
+            logLinks.querySelectorAll('a[href*="benchsale"]').forEach(link => link.style.display = 'none');
+            const jobseekerLogLink = logLinks.querySelector('a[href*="module=jobseeker"]');
+            if (jobseekerLogLink) jobseekerLogLink.style.display = 'none';
+        }
+    } else if (filter === 'jobseeker') {
+        // Hide all BenchSale tabs (All Tests, Admin Tests, Recruiter Tests)
+        document.querySelectorAll('.benchsale-tab').forEach(tab => tab.style.display = 'none');
+        // Hide BenchSale stats
+        document.querySelectorAll('.benchsale-stat').forEach(stat => stat.style.display = 'none');
+        document.querySelectorAll('.employer-stat').forEach(stat => stat.style.display = 'none');
+        // Show only Job Seeker tab
+        document.getElementById('tab-jobseeker').style.display = 'block';
+        document.getElementById('tab-jobseeker').classList.add('active');
+        document.getElementById('tab-employer').style.display = 'none';
+        // Hide all BenchSale and Employer test sections completely (not just inactive)
+        document.getElementById('all-tests').style.display = 'none';
+        document.getElementById('admin-tests').style.display = 'none';
+        document.getElementById('recruiter-tests').style.display = 'none';
+        document.getElementById('employer-tests').style.display = 'none';
+        // Show only Job Seeker test section
+        document.getElementById('jobseeker-tests').style.display = 'block';
+        document.getElementById('jobseeker-tests').classList.add('active');
+        // Show Job Seeker log link
+        const logLinks = document.getElementById('log-links-content');
+        if (logLinks) {
+            const jobseekerLogLink = logLinks.querySelector('a[href*="module=jobseeker"]');
+            if (jobseekerLogLink) jobseekerLogLink.style.display = 'inline-block';
+            // Hide BenchSale and Employer log links
+            logLinks.querySelectorAll('a[href*="benchsale"]').forEach(link => link.style.display = 'none');
+            const employerLogLink = logLinks.querySelector('a[href*="module=employer"]');
+            if (employerLogLink) employerLogLink.style.display = 'none';
+        }
+    } else {
+        // Show all BenchSale tabs
+        document.querySelectorAll('.benchsale-tab').forEach(tab => tab.style.display = 'block');
+        // Show BenchSale stats
+        document.querySelectorAll('.benchsale-stat').forEach(stat => stat.style.display = 'block');
+        // Hide Employer and Job Seeker tabs
+        document.getElementById('tab-employer').style.display = 'none';
+        document.getElementById('tab-jobseeker').style.display = 'none';
+        // Hide Employer and Job Seeker test sections completely
+        document.getElementById('employer-tests').style.display = 'none';
+        document.getElementById('employer-tests').classList.remove('active');
+        document.getElementById('jobseeker-tests').style.display = 'none';
+        document.getElementById('jobseeker-tests').classList.remove('active');
+        // Initially show only "All Tests" section (will be updated by showSection if filter is set)
+        document.getElementById('all-tests').style.display = 'block';
+        document.getElementById('admin-tests').style.display = 'none';
+        document.getElementById('recruiter-tests').style.display = 'none';
+        // Hide Employer and Job Seeker log links in BenchSale dashboard
+        const logLinks = document.getElementById('log-links-content');
+        if (logLinks) {
+            const employerLogLink = logLinks.querySelector('a[href*="module=employer"]');
+            if (employerLogLink) employerLogLink.style.display = 'none';
+            const jobseekerLogLink = logLinks.querySelector('a[href*="module=jobseeker"]');
+            if (jobseekerLogLink) jobseekerLogLink.style.display = 'none';
+
+            // Show all BenchSale log links by default (for "All Tests" view)
+            const adminLogLink = logLinks.querySelector('a[href*="benchsale_admin"]');
+            const recruiterLogLink = logLinks.querySelector('a[href*="benchsale_recruiter"]');
+            const mainLogLink = logLinks.querySelector('a[href*="benchsale_test"]');
+            if (adminLogLink) adminLogLink.style.display = 'inline-block';
+            if (recruiterLogLink) recruiterLogLink.style.display = 'inline-block';
+            if (mainLogLink) mainLogLink.style.display = 'inline-block';
+        }
+    }
+
+    if (filter && ['admin', 'recruiter', 'employer', 'jobseeker', 'all'].includes(filter)) {
+        setTimeout(function() {
+            showSection(filter);
+            setTimeout(function() {
+            updateStatistics(filter);
+            }, 100);
+        }, 200);
+    } else {
+        showSection('all');
+        setTimeout(function() {
+        updateStatistics('all');
+        }, 300);
+    }
+});
+
+document.addEventListener('click', function(e) {
+    if (e.target.tagName === 'IMG' && e.target.closest('.screenshot-item')) {
+        openModal(e.target.dataset.fullSrc || e.target.src);
+    }
+});
+
+// Re-read dashboard-data.json and patch the lists in place (only changed rows are re-rendered)
+function refreshDashboardData() {
+    return loadDashboardData().then(function(data) {
+        renderDashboardData(data);
+        const activeSection = document.querySelector('.test-section.active');
+        if (activeSection) {
+            filterByStatus(currentStatusFilter);
+            updateStatistics(activeSection.id.replace(/-tests$/, ''));
+            // Show the latest result for the test whose details are open
+            const activeItem = activeSection.querySelector('.test-item.active');
+            if (activeItem) showTestDetails(activeItem);
+        }
+        console.log('Dashboard data refreshed. Last updated: ' + data.last_updated);
+        return data;
+    }).catch(function(e) {
+        console.error('Error refreshing dashboard data, reloading page:', e);
+        location.reload(true);
+    });
+}
+
+function refreshDashboard() {
+    const statusEl = document.getElementById('refreshStatus');
+    if (statusEl) {
+        statusEl.textContent = 'Refreshing...';
+        statusEl.style.background = 'rgba(255, 204, 0, 0.2)';
+        statusEl.style.color = '#ed8936';
+    }
+    // Force a hard reload to clear cache and get fresh data
+    setTimeout(function() {
+        location.reload(true);
+    }, 500);
+}
+
+// Auto-refresh dashboard every 6 hours if page is visible
+// This ensures status updates even if test was run outside the UI
+let autoRefreshInterval = null;
+function startAutoRefresh() {
+    if (autoRefreshInterval) clearInterval(autoRefreshInterval);
+    autoRefreshInterval = setInterval(() => {
+        // Only refresh if page is visible (not in background tab)
+        if (!document.hidden) {
+            // Check if any test is currently running
+            const runningButtons = document.querySelectorAll('.run-test-btn.running');
+
+            // Check if user is viewing a test case (details panel open)
+            if (runningButtons.length === 0 && !activeTestName) {
+                // No tests running AND no test details being viewed, safe to refresh
+                console.log('Auto-refreshing dashboard to check for status updates...');
+                refreshDashboardData();
+            } else if (activeTestName) {
+                console.log('Skipping auto-refresh: User is viewing test details');
+            }
+        }
+    }, 21600000); // Refresh every 6 hours
+}
+
+// Start auto-refresh when page loads
+onDashboardReady(function(data) {
+    const dashboardVersion = data.generated_at;
+    console.log('Dashboard loaded. Last updated: ' + data.last_updated);
+    console.log('Dashboard generated at: ' + dashboardVersion);
+    console.log('Dashboard auto-updates after each test run.');
+    console.log('Current browser time: ' + new Date().toISOString());
+    startAutoRefresh();
+});
+// Modal Functions
+function openModal(src) {
+    const modal = document.getElementById('imageModal');
+    const modalImg = document.getElementById('modalImage');
+    modal.style.display = 'flex';
+    modalImg.src = src;
+    document.body.style.overflow = 'hidden'; // Prevent scrolling
+}
+
+function closeModal() {
+    const modal = document.getElementById('imageModal');
+    modal.style.display = 'none';
+    // Release the full-size image so closed screenshots don't stay in memory
+    document.getElementById('modalImage').removeAttribute('src');
+    document.body.style.overflow = 'auto'; // Restore scrolling
+}
+
+document.addEventListener('keydown', function(event) {
+    if (event.key === "Escape") {
+        closeModal();
+    }
+});
+
+// Notification functions
+function showNotification(type, title, message, duration = 5000) {
+    const banner = document.getElementById('notificationBanner');
+    if (!banner) {
+        console.warn('Notification banner not found in DOM');
+        return;
+    }
+
+    const icon = document.getElementById('notificationIcon');
+    const titleEl = document.getElementById('notificationTitle');
+    const messageEl = document.getElementById('notificationMessage');
+
+    if (!icon || !titleEl || !messageEl) {
+        console.warn('Notification elements not found');
+        return;
+    }
+
+    // Remove all type classes
+    banner.classList.remove('success', 'info', 'warning', 'error');
+    banner.classList.add(type);
+
+    // Set icon based on type
+    const icons = {
+        'success': '✅',
+        'info': 'ℹ️',
+        'warning': '⚠️',
+        'error': '❌'
+    };
+    icon.textContent = icons[type] || 'ℹ️';
+
+    titleEl.textContent = title;
+    messageEl.textContent = message;
+
+    banner.classList.add('show');
+
+    // Auto-hide after duration
+    if (duration > 0) {
+        setTimeout(() => {
+            hideNotification();
+        }, duration);
+    }
+}
+
+function hideNotification() {
+    const banner = document.getElementById('notificationBanner');
+    banner.classList.remove('show');
+}
+
+// Run test function
+// Track running tests to prevent duplicates
+const runningTests = new Set();
+const buttonClickTimes = new Map(); // Track when button was last clicked
+
+function runTest(testName, event) {
+    // CRITICAL: Prevent default and stop propagation
+    if (event) {
+        event.preventDefault();
+        event.stopPropagation();
+        event.stopImmediatePropagation();
+    }
+
+    // CRITICAL: Check if test is already running or queued FIRST (before debounce check)
+    if (runningTests.has(testName)) {
+        console.log('Test ' + testName + ' is already running or queued, ignoring duplicate request');
+        showNotification('warning', 'Test Already Running', 'Test "' + testName + '" is already running or queued. Please wait for it to complete.', 3000);
+        return;
+    }
+
+    // CRITICAL: Debounce - prevent rapid clicks (within 3 seconds - increased from 2)
+    const now = Date.now();
+    const lastClickTime = buttonClickTimes.get(testName) || 0;
+    if (now - lastClickTime < 3000) {
+        console.log('Test ' + testName + ' clicked too soon after last click, ignoring');
+        showNotification('info', 'Please Wait', 'Test "' + testName + '" was just clicked. Please wait a moment.', 2000);
+        return;
+    }
+    buttonClickTimes.set(testName, now);
+
+    // Mark test as running immediately (before any async operations)
+    runningTests.add(testName);
+
+    // Find the button that was clicked
+    const buttons = document.querySelectorAll('.run-test-btn');
+    let clickedButton = null;
+    buttons.forEach(btn => {
+        if (btn.textContent.includes('Run Test') || btn.textContent.includes('Running') || btn.textContent.includes('Done')) {
+            const testItem = btn.closest('.test-item');
+            if (testItem && testItem.getAttribute('data-test-info')) {
+                try {
+                    const testData = JSON.parse(testItem.getAttribute('data-test-info'));
+                    if (testData.name === testName) {
+                        clickedButton = btn;
+                    }
+                } catch(e) {
+                    // Ignore
+                }
+            }
+        }
+    });
+
+    if (!clickedButton) {
+        // Fallback: find button by test name in parent
+        document.querySelectorAll('.run-test-btn').forEach(btn => {
+            const onclickAttr = btn.getAttribute('onclick') || '';
+            if (onclickAttr.includes(testName)) {
+                clickedButton = btn;
+            }
+        });
+    }
+
+    // CRITICAL: Disable button IMMEDIATELY to prevent multiple clicks
+    if (clickedButton) {
+        clickedButton.classList.add('running');
+        clickedButton.textContent = '⏳ Running...';
+        clickedButton.disabled = true;
+        clickedButton.style.pointerEvents = 'none'; // Prevent any clicks
+        clickedButton.style.opacity = '0.7'; // Visual feedback
+        clickedButton.style.cursor = 'not-allowed'; // Show disabled cursor
+
+        // Remove onclick to prevent any clicks
+        clickedButton.removeAttribute('onclick');
+
+        // Also prevent any event listeners
+        clickedButton.onclick = function(e) {
+            e.preventDefault();
+            e.stopPropagation();
+            e.stopImmediatePropagation();
+            return false;
+        };
+    }
+
+    // Try to run via always-on server first (port 8766)
+    // Falls back to regular server (port 8765) if needed
+    let serverUrl = 'http://127.0.0.1:8766/add-test';
+    let isAlwaysOnServer = true;
+
+    // Helper function for polling
+    let testWasStarted = false; // Track if test actually started
+    function startPolling(port) {
+        // Poll for completion - more aggressive polling
+        const pollInterval = 1000; // Check every 1 second (faster detection)
+        const maxPolls = 600; // 10 minutes max (600 seconds)
+        let pollCount = 0;
+        let wasBusy = false; // Track if server was ever busy (test was running)
+        let notBusyCount = 0; // Count consecutive "not busy" responses
+        const requiredNotBusyCount = 3; // Need 3 consecutive "not busy" to confirm test is done
+
+        // Wait 2 seconds before starting to poll (give server time to start test and set lock)
+        setTimeout(() => {
+            const timer = setInterval(() => {
+                pollCount++;
+                fetch(`http://127.0.0.1:${port}/status?t=${Date.now()}`) // Add cache-busting parameter
+                    .then(r => {
+                        if (!r.ok) {
+                            throw new Error(`Server returned ${r.status}`);
+                        }
+                        return r.json();
+                    })
+                    .then(statusData => {
+                        // Track if server was ever busy (means test was actually running)
+                        if (statusData.busy) {
+                            wasBusy = true;
+                            notBusyCount = 0; // Reset counter when busy
+                            // Show where this test is in the queue and when it should start/finish
+                            const eta = statusData.eta && statusData.eta.tests && statusData.eta.tests[testName];
+                            if (eta && clickedButton) {
+                                const now = Date.now() / 1000;
+                                clickedButton.textContent = eta.state === 'queued'
+                                    ? '⏳ Queued #' + eta.position + ' · starts in ' + formatEta(eta.eta_start - now)
+                                    : '✅ Running · ' + formatEta(eta.eta_finish - now) + ' left';
+                            }
+                            if (pollCount % 10 === 0) { // Log every 10 polls to reduce console spam
+                                console.log('Test is running... (poll count: ' + pollCount + ')');
+                            }
+                        } else {
+                            // Server is not busy
+                            notBusyCount++;
+
+                            // If test was running and we've seen multiple "not busy" responses, test is done
+                            if (wasBusy && notBusyCount >= requiredNotBusyCount) {
+                                clearInterval(timer);
+
+                                // Remove from running set when test completes
+                                runningTests.delete(testName);
+
+                                if (clickedButton) {
+                                    clickedButton.textContent = '✅ Done';
+                                    clickedButton.classList.remove('running');
+                                    clickedButton.style.opacity = '1';
+
+                                    // Re-enable button after delay
+                                    setTimeout(() => {
+                                        clickedButton.disabled = false;
+                                        clickedButton.style.pointerEvents = 'auto';
+                                        clickedButton.style.cursor = 'pointer';
+                                        clickedButton.textContent = '▶ Run Test';
+                                        // Restore onclick
+                                        clickedButton.setAttribute('onclick', `event.stopPropagation(); runTest('${testName}', event)`);
+                                        clickedButton.onclick = function(e) {
+                                            runTest(testName, e);
+                                        };
+                                    }, 3000);
+                                }
+                                showNotification('success', 'Test Completed', 'Waiting for log file to update, then refreshing dashboard...', 3000);
+                                // Wait longer (7 seconds) to ensure log file is written and dashboard is regenerated
+                                setTimeout(() => {
+                                    console.log('Refreshing dashboard data to show updated status...');
+                                    refreshDashboardData();
+                                }, 7000);
+                            } else if (!wasBusy && notBusyCount >= 3) {
+                                // Server was never busy and we've confirmed it multiple times
+                                clearInterval(timer);
+                                if (clickedButton) {
+                                    clickedButton.textContent = '▶ Run Test';
+                                    clickedButton.classList.remove('running');
+                                    clickedButton.disabled = false;
+                                }
+                                showNotification('error', 'Test Not Started', 'Server may not be running or test failed to start. Please check server status.', 5000);
+                            }
+                        }
+                    })
+                    .catch(e => {
+                        console.log('Polling error', e);
+                        pollCount += 2; // Accelerate timeout on errors
+
+                        // If server is not responding after many attempts, show error
+                        if (pollCount > 30) {
+                            clearInterval(timer);
+                            if (clickedButton) {
+                                clickedButton.textContent = '▶ Run Test';
+                                clickedButton.classList.remove('running');
+                                clickedButton.disabled = false;
+                            }
+                            showNotification('error', 'Server Not Responding', 'Cannot connect to test server. Please make sure the server is running.', 5000);
+                        }
+                    });
+
+                if (pollCount > maxPolls) {
+                    clearInterval(timer);
+                    if (clickedButton) {
+                        clickedButton.textContent = '▶ Run Test';
+                        clickedButton.classList.remove('running');
+                        clickedButton.disabled = false;
+                    }
+                    showNotification('warning', 'Timeout', 'Test is taking longer than expected. Reloading dashboard...', 3000);
+                    setTimeout(() => {
+                        // Force a hard reload to clear cache and get fresh data
+                        location.reload(true);
+                    }, 3000);
+                }
+            }, pollInterval);
+        }, 2000); // Wait 2 seconds before starting to poll
+    }
+
+    // Also add a fallback: if polling doesn't detect completion, check after a reasonable time
+    // This handles cases where status endpoint might not be working correctly
+    setTimeout(() => {
+        // After 2 minutes, force a reload to check status (in case polling missed it)
+        console.log('Fallback: Checking dashboard status after 2 minutes...');
+        // This will be handled by the auto-refresh mechanism
+    }, 120000);
+
+    fetch(serverUrl, {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({ testName: testName })
+    })
+    .then(response => {
+        if (!response.ok) {
+            throw new Error(`Server returned ${response.status}: ${response.statusText}`);
+        }
+        return response.json();
+    })
+    .then(data => {
+        if (data.success) {
+            testWasStarted = true; // Mark that test was successfully started
+            if (clickedButton) {
+                clickedButton.textContent = '✅ Running';
+                clickedButton.style.background = 'linear-gradient(135deg, #16A34A 0%, #15803D 100%)';
+            }
+            // Show notification
+            showNotification('success', 'Test Started', 'Test "' + testName + '" is running. Dashboard will update automatically when done.', 5000);
+
+            // Start polling for completion
+            startPolling(8766);
+        } else {
+            // Test failed to start - remove from running set
+            runningTests.delete(testName);
+            if (clickedButton) {
+                clickedButton.disabled = false;
+                clickedButton.style.pointerEvents = 'auto';
+                clickedButton.style.opacity = '1';
+                clickedButton.textContent = '▶ Run Test';
+                clickedButton.classList.remove('running');
+            }
+            throw new Error(data.error || 'Failed to run test');
+        }
+    })
+    .catch(error => {
+        // Remove from running set on error
+        runningTests.delete(testName);
+
+        // Re-enable button on error
+        if (clickedButton) {
+            clickedButton.disabled = false;
+            clickedButton.style.pointerEvents = 'auto';
+            clickedButton.style.opacity = '1';
+            clickedButton.style.cursor = 'pointer';
+            clickedButton.textContent = '▶ Run Test';
+            clickedButton.classList.remove('running');
+            // Restore onclick
+            clickedButton.setAttribute('onclick', `event.stopPropagation(); runTest('${testName}', event)`);
+            clickedButton.onclick = function(e) {
+                runTest(testName, e);
+            };
+        }
+
+        // If always-on server failed, try regular server as fallback
+        if (isAlwaysOnServer) {
+            isAlwaysOnServer = false;
+            serverUrl = 'http://127.0.0.1:8765/run-test';
+
+            // Retry with regular server
+            fetch(serverUrl, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify({ testName: testName })
+            })
+            .then(response => response.json())
+            .then(data => {
+                if (data.success) {
+                    if (clickedButton) {
+                        clickedButton.textContent = '✅ Running';
+                        clickedButton.style.background = 'linear-gradient(135deg, #16A34A 0%, #15803D 100%)';
+                    }
+                    showNotification('success', 'Test Started', 'Test running. Dashboard will reload shortly.', 4000);
+
+                    // Fallback server might not have status endpoint, wait longer then reload
+                    // Wait 15 seconds to ensure test completes and log file is written
+                    setTimeout(() => {
+                        // Force a hard reload to clear cache and get fresh data
+                        location.reload(true);
+                    }, 15000);
+                } else {
+                    throw new Error(data.error || 'Failed to run test');
+                }
+            })
+            .catch(() => {
+                // Both servers failed
+                const command = 'python -m pytest -k "' + testName + '" -s -vv';
+
+                if (navigator.clipboard && navigator.clipboard.writeText) {
+                    navigator.clipboard.writeText(command).catch(() => {});
+                }
+
+                const serverMessage = `Test server is not running!\n\n` +
+                    `To start the server:\n` +
+                    `1. Double-click: START_ALWAYS_ON_SERVER.bat\n` +
+                    `2. Or run: python utils\\always_on_server.py\n\n` +
+                    `Keep the server window open while using the dashboard.\n` +
+                    `Server runs on port 8766.`;
+
+                showNotification(
+                    'error',
+                    'Server Not Running',
+                    serverMessage,
+                    10000
+                );
+
+                if (clickedButton) {
+                    clickedButton.classList.remove('running');
+                    clickedButton.textContent = '▶ Run Test';
+                    clickedButton.disabled = false;
+                }
+            });
+        }
+    });
+}
@@ -0,0 +1,255 @@
+// Windowed list rendering, shared by the dashboard and log_viewer_ui.html.
+// Only the rows inside the scroll viewport (plus a few either side) exist in
+// the DOM; the rest of the list is represented by two spacer elements. Row
+// heights are measured once rendered and cached per key, so rows can have
+// variable height. setItems() keeps rendered rows whose content didn't change,
+// so a refresh only re-renders the rows whose status actually changed.
+
+class VirtualList {
+    /**
+     * options:
+     *   scrollElement       element that scrolls (overflow-y: auto); contains listElement
+     *   listElement         element the rows are rendered into (a div or a tbody)
+     *   renderRow(item, i)  returns the row Element for an item
+     *   getKey(item, i)     stable key for an item (default: its index)
+     *   getSignature(item)  a rendered row is replaced when this changes (default: JSON)
+     *   createSpacer()      returns a spacer Element (default: div; use a <tr> for tables)
+     *   renderEmpty()       returns an Element (or null) to show when no items match, optional
+     *   estimatedRowHeight  height used for rows not measured yet (default 60)
+     *   overscan            rows rendered above/below the viewport (default 8)
+     *   gap                 space between rows, e.g. a flex gap (default: read from CSS)
+     */
+    constructor(options) {
+        this.scrollElement = options.scrollElement;
+        this.listElement = options.listElement;
+        this.renderRow = options.renderRow;
+        this.getKey = options.getKey || function(item, index) { return String(index); };
+        this.getSignature = options.getSignature || function(item) { return JSON.stringify(item); };
+        this.renderEmpty = options.renderEmpty || null;
+        this.estimatedRowHeight = options.estimatedRowHeight || 60;
+        this.overscan = options.overscan === undefined ? 8 : options.overscan;
+        this.gap = options.gap === undefined
+            ? (parseFloat(window.getComputedStyle(this.listElement).rowGap) || 0)
+            : options.gap;
+
+        this.items = [];
+        this.keys = [];
+        this.signatures = new Map();   // key -> signature of the current item
+        this.filter = null;
+        this.visible = [];             // indexes into items that pass the filter
+        this.heights = new Map();      // key -> measured row height
+        this.offsets = null;           // prefix sums of row heights over visible, rebuilt lazily
+        this.rows = new Map();         // key -> {element, signature} for rendered rows
+        this.measuredWidth = 0;
+        this.frame = null;
+        this.emptyElement = null;
+
+        const createSpacer = options.createSpacer || function() { return document.createElement('div'); };
+        this.topSpacer = createSpacer();
+        this.bottomSpacer = createSpacer();
+        [this.topSpacer, this.bottomSpacer].forEach(function(spacer) {
+            spacer.classList.add('virtual-list-spacer');
+            spacer.setAttribute('aria-hidden', 'true');
+            spacer.style.display = 'none';
+        });
+        this.listElement.textContent = '';
+        this.listElement.appendChild(this.topSpacer);
+        this.listElement.appendChild(this.bottomSpacer);
+
+        this.onScroll = () => this.scheduleRender();
+        this.scrollElement.addEventListener('scroll', this.onScroll, { passive: true });
+        if (typeof ResizeObserver !== 'undefined') {
+            // Also fires when a hidden section is shown, so its rows get laid out then
+            this.resizeObserver = new ResizeObserver(this.onScroll);
+            this.resizeObserver.observe(this.scrollElement);
+        } else {
+            window.addEventListener('resize', this.onScroll);
+        }
+    }
+
+    get itemCount() {
+        return this.visible.length;
+    }
+
+    setItems(items) {
+        this.items = items || [];
+        this.keys = this.items.map(this.getKey);
+        const signatures = new Map();
+        this.items.forEach((item, index) => signatures.set(this.keys[index], this.getSignature(item)));
+        this.signatures = signatures;
+
+        // Keep rendered rows that are unchanged; changed or removed ones are re-rendered
+        this.rows.forEach((row, key) => {
+            if (signatures.get(key) !== row.signature) {
+                row.element.remove();
+                this.rows.delete(key);
+            }
+        });
+        this.heights.forEach((height, key) => {
+            if (!signatures.has(key)) this.heights.delete(key);
+        });
+        this.applyFilter();
+    }
+
+    // predicate(item) -> boolean, or null to show everything
+    setFilter(predicate) {
+        if (!predicate && !this.filter) return;
+        this.filter = predicate || null;
+        this.applyFilter();
+    }
+
+    applyFilter() {
+        const visible = [];
+        for (let i = 0; i < this.items.length; i++) {
+            if (!this.filter || this.filter(this.items[i])) visible.push(i);
+        }
+        this.visible = visible;
+        this.offsets = null;
+        this.render();
+    }
+
+    scheduleRender() {
+        if (this.frame === null) {
+            this.frame = window.requestAnimationFrame(() => this.render());
+        }
+    }
+
+    getOffsets() {
+        if (!this.offsets) {
+            const count = this.visible.length;
+            const offsets = new Float64Array(count + 1);
+            for (let i = 0; i < count; i++) {
+                const height = this.heights.get(this.keys[this.visible[i]]);
+                offsets[i + 1] = offsets[i] + (height === undefined ? this.estimatedRowHeight : height) + this.gap;
+            }
+            this.offsets = offsets;
+        }
+        return this.offsets;
+    }
+
+    // Index of the visible row at vertical position y (relative to the list top)
+    indexAt(y) {
+        const offsets = this.getOffsets();
+        let low = 0;
+        let high = this.visible.length - 1;
+        while (low < high) {
+            const mid = (low + high + 1) >> 1;
+            if (offsets[mid] <= y) low = mid;
+            else high = mid - 1;
+        }
+        return Math.max(0, low);
+    }
+
+    render() {
+        if (this.frame !== null) {
+            window.cancelAnimationFrame(this.frame);
+            this.frame = null;
+        }
+        const scroll = this.scrollElement;
+
+        // Layout reads first, before any DOM writes
+        const viewportHeight = scroll.clientHeight;
+        const width = this.listElement.clientWidth;
+        const listTop = this.listElement.getBoundingClientRect().top - scroll.getBoundingClientRect().top
+            - scroll.clientTop + scroll.scrollTop;
+        if (width && width !== this.measuredWidth) {
+            // Rows wrap differently at another width, so the cached heights are stale
+            if (this.measuredWidth) this.heights.clear();
+            this.measuredWidth = width;
+            this.offsets = null;
+        }
+
+        const count = this.visible.length;
+        const offsets = this.getOffsets();
+        let start = 0;
+        let end = 0;
+        if (count > 0) {
+            if (viewportHeight > 0) {
+                const top = scroll.scrollTop - listTop;
+                start = Math.max(0, this.indexAt(top) - this.overscan);
+                end = Math.min(count, this.indexAt(top + viewportHeight) + 1 + this.overscan);
+            } else {
+                // Hidden (e.g. inactive tab): render the first screen so it's ready when shown
+                end = Math.min(count, this.overscan * 3);
+            }
+        }
+
+        // Drop rows that left the window, then insert/reorder the ones inside it
+        const wanted = [];
+        for (let i = start; i < end; i++) wanted.push(this.keys[this.visible[i]]);
+        const wantedKeys = new Set(wanted);
+        this.rows.forEach((row, key) => {
+            if (!wantedKeys.has(key)) {
+                row.element.remove();
+                this.rows.delete(key);
+            }
+        });
+
+        let cursor = this.topSpacer.nextSibling;
+        if (this.emptyElement && (count > 0 || !this.renderEmpty)) {
+            this.emptyElement.remove();
+            this.emptyElement = null;
+            cursor = this.topSpacer.nextSibling;
+        }
+        for (let i = start; i < end; i++) {
+            const index = this.visible[i];
+            const key = this.keys[index];
+            let row = this.rows.get(key);
+            if (!row) {
+                row = { element: this.renderRow(this.items[index], index), signature: this.signatures.get(key) };
+                this.rows.set(key, row);
+            }
+            if (row.element === cursor) {
+                cursor = cursor.nextSibling;
+            } else {
+                this.listElement.insertBefore(row.element, cursor);
+            }
+        }
+        if (count === 0 && this.renderEmpty && !this.emptyElement) {
+            this.emptyElement = this.renderEmpty();
+            if (this.emptyElement) this.listElement.insertBefore(this.emptyElement, this.bottomSpacer);
+        }
+
+        // The gap between a spacer and its neighbouring row is part of the spacer's share
+        this.setSpacerHeight(this.topSpacer, offsets[start] - this.gap);
+        this.setSpacerHeight(this.bottomSpacer, offsets[count] - offsets[end] - this.gap);
+
+        // Measure what was just rendered; if estimates were off, lay out again next frame
+        if (viewportHeight > 0) {
+            let changed = false;
+            wanted.forEach((key) => {
+                const height = this.rows.get(key).element.offsetHeight;
+                if (height > 0 && this.heights.get(key) !== height) {
+                    this.heights.set(key, height);
+                    changed = true;
+                }
+            });
+            if (changed) {
+                this.offsets = null;
+                this.scheduleRender();
+            }
+        }
+    }
+
+    setSpacerHeight(spacer, height) {
+        if (height > 0) {
+            spacer.style.height = height + 'px';
+            spacer.style.display = '';
+        } else {
+            spacer.style.display = 'none';
+        }
+    }
+
+    // Rendered row elements, e.g. to update a class without re-rendering
+    forEachRenderedRow(callback) {
+        this.rows.forEach((row, key) => callback(row.element, key));
+    }
+
+    destroy() {
+        if (this.frame !== null) window.cancelAnimationFrame(this.frame);
+        this.frame = null;
+        this.scrollElement.removeEventListener('scroll', this.onScroll);
+        if (this.resizeObserver) this.resizeObserver.disconnect();
+        else window.removeEventListener('resize', this.onScroll);
+    }
+}
@@ -4,15 +4,22 @@ Parses log files and provides API endpoints for historical test data
 """
 import os
 import re
+import sys
 import json
 import threading
 import time
+from statistics import median
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
 from flask import Flask, jsonify, send_file
 from flask_cors import CORS
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.test_discovery import discover_test_names
+from utils import skills_similarity
+from utils.run_estimates import parse_running_time_seconds
+
 app = Flask(__name__)
 CORS(app)
 
@@ -55,37 +62,28 @@ MODULES = {
     }
 }
 
-# Cache of allowed test names per module (from test files)
-_ALLOWED_TESTS_CACHE: Dict[str, set] = {}
-
 # Historical data storage directory (always relative to project root)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 HISTORY_DIR = PROJECT_ROOT / 'logs' / 'history'
 HISTORY_DIR.mkdir(parents=True, exist_ok=True)
 
-# Prevent concurrent heavy updates per module
-_UPDATE_LOCKS: Dict[str, threading.Lock] = {}
-
-
-def _normalize_skills_for_similarity(skills_str: str) -> List[str]:
-    if not skills_str:
-        return []
-    cleaned = re.sub(r"[^\w\s\-\+#,]", "", str(skills_str)).lower()
-    return [s.strip() for s in cleaned.split(",") if s.strip()]
+# Background history updates: one bounded worker pool shared by all modules.
+# Requests for the same module are coalesced, and a module is re-parsed at most
+# once per HISTORY_UPDATE_DEBOUNCE seconds while its log is still being written.
+HISTORY_UPDATE_WORKERS = max(1, int(os.getenv('HISTORY_UPDATE_WORKERS', '2')))
+HISTORY_UPDATE_DEBOUNCE = float(os.getenv('HISTORY_UPDATE_DEBOUNCE', '15'))
 
+# Per-module aggregate table, rebuilt on every history update.
+# Runtime samples are kept for the longest window (history itself only keeps 7 days).
+SUMMARY_WINDOWS_DAYS = (1, 7, 30)
 
-def _calculate_skills_similarity(list1: List[str], list2: List[str]) -> float:
-    if not list1 and not list2:
-        return 100.0
-    if not list1 or not list2:
-        return 0.0
-    set1 = set(list1)
-    set2 = set(list2)
-    intersection = set1.intersection(set2)
-    denominator = max(len(set1), len(set2))
-    if denominator == 0:
-        return 0.0
-    return (len(intersection) / denominator) * 100.0
+# Runtime regression detection: median of the most recent runs vs a rolling
+# baseline of the runs before them, scaled by the baseline's MAD.
+REGRESSION_RECENT_RUNS = 3
+REGRESSION_BASELINE_RUNS = 10
+REGRESSION_MIN_BASELINE_RUNS = 5
+REGRESSION_MIN_RATIO = float(os.getenv('REGRESSION_MIN_RATIO', '1.5'))
+REGRESSION_MIN_SCORE = float(os.getenv('REGRESSION_MIN_SCORE', '3.5'))
 
 
 def _should_filter_failure_message(error_msg: str) -> bool:
@@ -97,47 +95,261 @@ def _should_filter_failure_message(error_msg: str) -> bool:
     # Filter ai_skills false positives (>=70% similarity)
     match = re.search(r"ai_skills:\s*'([^']+)'\s*!=\s*'([^']+)'", error_msg)
     if match:
-        db_skills = _normalize_skills_for_similarity(match.group(1))
-        solr_skills = _normalize_skills_for_similarity(match.group(2))
-        similarity = _calculate_skills_similarity(db_skills, solr_skills)
-        if similarity >= 70:
+        if skills_similarity.is_false_positive(match.group(1), match.group(2)):
             return True
     return False
 
 
-def _start_update_if_needed(module_id: str):
-    """Start background update only if log file is newer than history and no update is running."""
+def _is_false_positive_failure(failure: Dict) -> bool:
+    """Use the verifier's precomputed verdict; parse the message only for older reports."""
+    if 'is_false_positive' in failure:
+        return bool(failure['is_false_positive'])
+    return _should_filter_failure_message(str(failure.get('msg', '')).strip())
+
+
+# Parsed + filtered db_solr_sync failure report, rebuilt only when the file changes
+SYNC_FAILURES_FILE = PROJECT_ROOT / 'reports' / 'db_solr_sync_failures.json'
+_SYNC_REPORT_CACHE: Dict = {'key': None, 'report': None}
+_SYNC_REPORT_LOCK = threading.Lock()
+
+
+def load_sync_failure_report() -> Optional[Dict]:
+    """Load reports/db_solr_sync_failures.json with false positives filtered out.
+
+    The file is parsed and filtered once per (mtime, size); later calls return the
+    cached dict, which callers must treat as read-only. Returns None if the file
+    is missing or cannot be parsed.
+    """
+    try:
+        stat = SYNC_FAILURES_FILE.stat()
+    except OSError:
+        return None
+    cache_key = (stat.st_mtime_ns, stat.st_size)
+
+    with _SYNC_REPORT_LOCK:
+        if _SYNC_REPORT_CACHE['key'] == cache_key:
+            return _SYNC_REPORT_CACHE['report']
+
+        try:
+            with open(SYNC_FAILURES_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"Error reading JSON failure file: {e}")
+            return None
+
+        if isinstance(data, dict):
+            failures_list = data.get('failures', []) or []
+            total_jobs = data.get('total_jobs_checked', data.get('total_jobs_available', 0)) or 0
+            total_failures = data.get('total_failures', len(failures_list)) or 0
+        else:
+            failures_list = data if isinstance(data, list) else []
+            total_jobs = 0
+            total_failures = len(failures_list)
+
+        # Filter out false positives (DB='N/A' and ai_skills >=70%)
+        filtered_failures = [f for f in failures_list if not _is_false_positive_failure(f)]
+
+        file_mtime = datetime.fromtimestamp(stat.st_mtime)
+        stable_datetime = file_mtime.isoformat()
+        error_jobs = _dedupe_error_jobs([
+            {
+                'id': str(f.get('id', 'N/A')),
+                'title': str(f.get('db_title', 'N/A'))[:100],
+                'error': str(f.get('msg', 'N/A'))[:500],
+                'detected_at': stable_datetime
+            }
+            for f in filtered_failures
+        ])[:len(filtered_failures)]
+
+        report = {
+            'file_mtime': file_mtime,
+            'stable_datetime': stable_datetime,
+            'total_jobs': total_jobs,
+            'total_failures': total_failures,
+            'failures': filtered_failures,
+            'filtered_out_count': len(failures_list) - len(filtered_failures),
+            'error_jobs': error_jobs
+        }
+        _SYNC_REPORT_CACHE['key'] = cache_key
+        _SYNC_REPORT_CACHE['report'] = report
+        return report
+
+
+def _history_is_stale(module_id: str) -> bool:
+    """Return True if the module log file is newer than its history file."""
     if module_id not in MODULES:
-        return
+        return False
 
-    project_root = get_project_root()
-    log_file = project_root / MODULES[module_id]['log_file']
+    log_file = get_project_root() / MODULES[module_id]['log_file']
     history_file = HISTORY_DIR / f"{module_id}_history.json"
 
     if not log_file.exists():
-        return
+        return False
 
     # Skip update if history is already newer or equal to log file
     if history_file.exists():
         try:
             if history_file.stat().st_mtime >= log_file.stat().st_mtime:
-                return
+                return False
         except Exception:
             pass
+    return True
 
-    lock = _UPDATE_LOCKS.setdefault(module_id, threading.Lock())
-    if not lock.acquire(blocking=False):
-        return
 
-    def _run():
-        try:
-            update_historical_data(module_id)
-        except Exception as e:
-            print(f"Background update error for {module_id}: {e}")
-        finally:
-            lock.release()
+class HistoryUpdateScheduler:
+    """Single scheduler for background history updates.
+
+    - A fixed pool of worker threads runs update_historical_data.
+    - Requests for a module that is already pending are coalesced into one run.
+    - Requests for a module that is running schedule exactly one follow-up run.
+    - Non-forced runs start no sooner than `debounce` seconds after the previous
+      run of the same module started, and are skipped if history caught up.
+    """
 
-    threading.Thread(target=_run, daemon=True).start()
+    def __init__(self, workers: int = HISTORY_UPDATE_WORKERS, debounce: float = HISTORY_UPDATE_DEBOUNCE):
+        self.workers = workers
+        self.debounce = debounce
+        self._cond = threading.Condition()
+        self._pending: Dict[str, Dict] = {}  # module_id -> {'due': ts, 'force': bool}
+        self._running: set = set()
+        self._rerun: Dict[str, bool] = {}  # module_id -> force flag for follow-up run
+        self._stats: Dict[str, Dict] = {}
+        self._threads: List[threading.Thread] = []
+
+    def _module_stats(self, module_id: str) -> Dict:
+        return self._stats.setdefault(module_id, {
+            'requests': 0,
+            'coalesced': 0,
+            'runs': 0,
+            'skipped': 0,
+            'last_started': 0.0,
+            'last_finished': 0.0,
+            'last_duration': None,
+            'last_error': None
+        })
+
+    def _ensure_workers(self):
+        # Workers are started lazily so importing this module (e.g. from pytest) spawns no threads
+        if self._threads:
+            return
+        for i in range(self.workers):
+            worker = threading.Thread(target=self._worker_loop, name=f"history-update-{i}", daemon=True)
+            worker.start()
+            self._threads.append(worker)
+
+    def request(self, module_id: str, force: bool = False) -> bool:
+        """Request a history update. Returns True if a new run was queued, False if coalesced."""
+        if module_id not in MODULES:
+            return False
+        with self._cond:
+            self._ensure_workers()
+            stats = self._module_stats(module_id)
+            stats['requests'] += 1
+
+            if module_id in self._running:
+                self._rerun[module_id] = self._rerun.get(module_id, False) or force
+                stats['coalesced'] += 1
+                return False
+
+            now = time.time()
+            due = now if force else max(now, stats['last_started'] + self.debounce)
+            pending = self._pending.get(module_id)
+            if pending:
+                pending['due'] = min(pending['due'], due)
+                pending['force'] = pending['force'] or force
+                stats['coalesced'] += 1
+                self._cond.notify_all()
+                return False
+
+            self._pending[module_id] = {'due': due, 'force': force}
+            self._cond.notify_all()
+            return True
+
+    def wait_idle(self, module_ids: List[str], timeout: float = None) -> bool:
+        """Block until none of the given modules is pending or running."""
+        deadline = time.time() + timeout if timeout is not None else None
+        with self._cond:
+            while any(m in self._pending or m in self._running or m in self._rerun for m in module_ids):
+                remaining = None if deadline is None else deadline - time.time()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _next_module(self) -> tuple:
+        """Pop the next due module (called with the condition held)."""
+        while True:
+            if not self._pending:
+                self._cond.wait()
+                continue
+            module_id, item = min(self._pending.items(), key=lambda kv: kv[1]['due'])
+            delay = item['due'] - time.time()
+            if delay > 0:
+                self._cond.wait(delay)
+                continue
+            del self._pending[module_id]
+            self._running.add(module_id)
+            return module_id, item['force']
+
+    def _worker_loop(self):
+        while True:
+            with self._cond:
+                module_id, force = self._next_module()
+
+            started = time.time()
+            ran = False
+            error = None
+            try:
+                if force or _history_is_stale(module_id):
+                    ran = True
+                    update_historical_data(module_id)
+            except Exception as e:
+                error = str(e)
+                print(f"Background update error for {module_id}: {e}")
+            finished = time.time()
+
+            with self._cond:
+                self._running.discard(module_id)
+                stats = self._module_stats(module_id)
+                if ran:
+                    stats['runs'] += 1
+                    stats['last_started'] = started
+                    stats['last_finished'] = finished
+                    stats['last_duration'] = round(finished - started, 3)
+                    stats['last_error'] = error
+                else:
+                    stats['skipped'] += 1
+                if module_id in self._rerun:
+                    rerun_force = self._rerun.pop(module_id)
+                    due = time.time() if rerun_force else max(time.time(), stats['last_started'] + self.debounce)
+                    self._pending[module_id] = {'due': due, 'force': rerun_force}
+                self._cond.notify_all()
+
+    def status(self) -> Dict:
+        """Snapshot of queue depth, running modules and per-module timings."""
+        with self._cond:
+            now = time.time()
+            return {
+                'workers': self.workers,
+                'debounce_seconds': self.debounce,
+                'queue_depth': len(self._pending),
+                'running': sorted(self._running),
+                'pending': {
+                    m: {'due_in': round(max(0.0, p['due'] - now), 3), 'force': p['force']}
+                    for m, p in self._pending.items()
+                },
+                'modules': {m: dict(s) for m, s in self._stats.items()}
+            }
+
+
+_UPDATE_SCHEDULER = HistoryUpdateScheduler()
+
+
+def _start_update_if_needed(module_id: str):
+    """Schedule a background update only if the log file is newer than history."""
+    if not _history_is_stale(module_id):
+        return
+    _UPDATE_SCHEDULER.request(module_id)
 
 
 def get_project_root():
@@ -161,25 +373,25 @@ def _dedupe_error_jobs(error_jobs: List[Dict]) -> List[Dict]:
     return deduped
 
 
+def _normalize_entry_runtimes(history: Dict) -> None:
+    """Store running_time_seconds on every entry (display string is kept for the UI)."""
+    for entries in history.values():
+        for entry in entries:
+            if 'running_time_seconds' not in entry:
+                entry['running_time_seconds'] = parse_running_time_seconds(entry.get('running_time'))
+
+
 def get_allowed_tests(module: str) -> set:
-    """Get allowed test names for a module from its test files (strict allowlist)."""
+    """Get allowed test names for a module from its test files (strict allowlist).
+
+    Uses the shared test discovery cache, so test files are only re-parsed when they change.
+    """
     if module not in MODULES:
         return set()
-    if module in _ALLOWED_TESTS_CACHE:
-        return _ALLOWED_TESTS_CACHE[module]
     allowed: set = set()
     project_root = get_project_root()
     for test_file in MODULES[module].get('test_files', []):
-        test_file_path = project_root / test_file
-        if not test_file_path.exists():
-            continue
-        try:
-            content = test_file_path.read_text(encoding='utf-8')
-            matches = re.findall(r'def\s+(test_[a-zA-Z0-9_]+)', content, re.IGNORECASE)
-            allowed.update(matches)
-        except Exception as e:
-            print(f"Error reading test file {test_file_path}: {e}")
-    _ALLOWED_TESTS_CACHE[module] = allowed
+        allowed.update(discover_test_names(project_root / test_file))
     return allowed
 
 
@@ -994,22 +1206,12 @@ def get_all_test_cases(module: str) -> List[str]:
         if is_test_for_module(test_name, module):
             test_cases.add(test_name)
     
-    # Secondary: Check test files (for tests that haven't run yet)
+    # Secondary: Check test files (for tests that haven't run yet), via the shared discovery cache
     for test_file in module_config['test_files']:
-        test_file_path = project_root / test_file
-        if test_file_path.exists():
-            try:
-                with open(test_file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Extract test function names - improved pattern
-                    test_func_pattern = re.compile(r'def\s+(test_[a-zA-Z0-9_]+)', re.IGNORECASE)
-                    matches = test_func_pattern.findall(content)
-                    for match in matches:
-                        # For ALL modules, filter by is_test_for_module to ensure correct data isolation
-                        if is_test_for_module(match, module):
-                            test_cases.add(match)
-            except Exception as e:
-                print(f"Error reading test file {test_file_path}: {e}")
+        for test_name in discover_test_names(project_root / test_file):
+            # For ALL modules, filter by is_test_for_module to ensure correct data isolation
+            if is_test_for_module(test_name, module):
+                test_cases.add(test_name)
     
     # Last resort: Parse log file (only if history is empty and we need fresh data)
     # For large log files, this is done in background by update_historical_data
@@ -1283,6 +1485,156 @@ def save_historical_data(module: str, data: Dict):
                 pass
 
 
+def _percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, int(-(-pct * len(sorted_values) // 100)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _entry_datetime(entry: Dict) -> Optional[datetime]:
+    value = entry.get('datetime') or entry.get('date') or ''
+    if ' to ' in value:
+        value = value.split(' to ')[0].strip()
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).replace(tzinfo=None)
+    except (ValueError, AttributeError):
+        return None
+
+
+def detect_runtime_regression(samples: List[Dict]) -> Optional[Dict]:
+    """Compare recent runtimes against a rolling baseline using median/MAD.
+
+    samples must be sorted oldest first. Only passing runs count: a failed run
+    stops early or waits out a timeout, so its runtime says nothing about speed.
+    Returns None when there are not enough timed passing runs; otherwise a dict
+    with the baseline/recent medians, the ratio, the robust score and whether
+    the test is flagged as having slowed down.
+    """
+    runtimes = [s['seconds'] for s in samples
+                if s.get('seconds') is not None and s.get('status') == 'PASS']
+    if len(runtimes) < REGRESSION_RECENT_RUNS + REGRESSION_MIN_BASELINE_RUNS:
+        return None
+
+    recent = runtimes[-REGRESSION_RECENT_RUNS:]
+    baseline = runtimes[-(REGRESSION_RECENT_RUNS + REGRESSION_BASELINE_RUNS):-REGRESSION_RECENT_RUNS]
+    baseline_median = median(baseline)
+    recent_median = median(recent)
+    mad = median(abs(x - baseline_median) for x in baseline)
+    # 1.4826 * MAD estimates the standard deviation; floor it so a perfectly
+    # stable baseline doesn't flag sub-second jitter
+    scale = max(1.4826 * mad, 0.05 * baseline_median, 1.0)
+    score = (recent_median - baseline_median) / scale
+    ratio = recent_median / baseline_median if baseline_median > 0 else None
+
+    return {
+        'flagged': score >= REGRESSION_MIN_SCORE and (ratio is None or ratio >= REGRESSION_MIN_RATIO),
+        'baseline_median_seconds': round(baseline_median, 3),
+        'recent_median_seconds': round(recent_median, 3),
+        'ratio': round(ratio, 2) if ratio is not None else None,
+        'score': round(score, 2),
+        'baseline_runs': len(baseline),
+        'recent_runs': len(recent),
+    }
+
+
+def load_module_summary(module: str) -> Dict:
+    """Load the materialized aggregate table for a module (empty dict if none yet)."""
+    summary_file = HISTORY_DIR / f"{module}_summary.json"
+    if not summary_file.exists():
+        return {}
+    try:
+        with open(summary_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception as e:
+        print(f"Error loading summary file {summary_file}: {e}")
+        return {}
+
+
+def update_module_summary(module: str, history: Dict) -> Dict:
+    """Merge new history entries into the module's runtime samples and rebuild aggregates.
+
+    Each test keeps one sample per run (keyed by datetime) for the longest window;
+    pass rate, last status, p50/p95/max runtime and runtime regression flags are
+    precomputed so summary views don't process individual entries at request time.
+    """
+    summary_file = HISTORY_DIR / f"{module}_summary.json"
+    previous = load_module_summary(module).get('tests', {})
+    now = datetime.now()
+    oldest = now - timedelta(days=max(SUMMARY_WINDOWS_DAYS))
+
+    tests = {}
+    for test_name in set(previous) | set(history):
+        samples = {s['datetime']: s for s in previous.get(test_name, {}).get('samples', [])}
+        for entry in history.get(test_name, []):
+            entry_dt = _entry_datetime(entry)
+            if entry_dt is None:
+                continue
+            seconds = entry.get('running_time_seconds')
+            if seconds is None:
+                seconds = parse_running_time_seconds(entry.get('running_time'))
+            samples[entry_dt.isoformat()] = {
+                'datetime': entry_dt.isoformat(),
+                'status': str(entry.get('status', '')).upper(),
+                'seconds': seconds,
+            }
+
+        kept = sorted(
+            (s for s in samples.values() if datetime.fromisoformat(s['datetime']) >= oldest),
+            key=lambda s: s['datetime']
+        )
+        if not kept:
+            continue
+
+        windows = {}
+        for days in SUMMARY_WINDOWS_DAYS:
+            since = (now - timedelta(days=days)).isoformat()
+            in_window = [s for s in kept if s['datetime'] >= since]
+            passed = sum(1 for s in in_window if s['status'] == 'PASS')
+            failed = sum(1 for s in in_window if s['status'] == 'FAIL')
+            runtimes = sorted(s['seconds'] for s in in_window if s['seconds'] is not None)
+            windows[f"{days}d"] = {
+                'runs': len(in_window),
+                'passed': passed,
+                'failed': failed,
+                'pass_rate': round(passed / len(in_window) * 100, 1) if in_window else None,
+                'p50_seconds': _percentile(runtimes, 50),
+                'p95_seconds': _percentile(runtimes, 95),
+                'max_seconds': runtimes[-1] if runtimes else None,
+            }
+
+        tests[test_name] = {
+            'last_status': kept[-1]['status'],
+            'last_run': kept[-1]['datetime'],
+            'last_running_time_seconds': kept[-1]['seconds'],
+            'windows': windows,
+            'regression': detect_runtime_regression(kept),
+            'samples': kept,
+        }
+
+    regressions = sorted(
+        (name for name, data in tests.items() if (data['regression'] or {}).get('flagged')),
+        key=lambda name: tests[name]['regression']['ratio'] or 0,
+        reverse=True
+    )
+    summary = {'module': module, 'updated_at': now.isoformat(), 'regressions': regressions, 'tests': tests}
+    # Own temp file per writer: the API and a test's in-process update may save at the same time
+    tmp_file = summary_file.with_name(f"{summary_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False)
+        os.replace(tmp_file, summary_file)
+    except Exception as e:
+        print(f"Error saving summary file {summary_file}: {e}")
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+    return summary
+
+
 def update_historical_data(module: str):
     """Update historical data from current log file"""
     module_config = MODULES.get(module)
@@ -1307,26 +1659,17 @@ def update_historical_data(module: str):
             try:
                 # Check if JSON file is recent (within last 24 hours)
                 file_mtime = datetime.fromtimestamp(json_failure_path.stat().st_mtime)
-                if (datetime.now() - file_mtime).total_seconds() < 86400:  # 24 hours
-                    with open(json_failure_path, 'r', encoding='utf-8') as f:
-                        failures_data = json.load(f)
-                    
+                report = load_sync_failure_report()
+                if report and (datetime.now() - file_mtime).total_seconds() < 86400:  # 24 hours
                     # Check if we have a db_solr_sync test entry
                     db_solr_test = next((t for t in current_tests if 'db_solr_sync' in t.get('test_name', '').lower()), None)
                     
-                    total_jobs = failures_data.get('total_jobs_checked', failures_data.get('total_jobs_available', 0))
-                    original_error_count = failures_data.get('total_failures', 0)
-                    failures_list = failures_data.get('failures', [])
-
-                    # Filter out false positives (DB='N/A' and ai_skills >=70%)
-                    filtered_failures = []
-                    filtered_out_count = 0
-                    for f in failures_list:
-                        error_msg = str(f.get('msg', '')).strip()
-                        if _should_filter_failure_message(error_msg):
-                            filtered_out_count += 1
-                            continue
-                        filtered_failures.append(f)
+                    total_jobs = report['total_jobs']
+                    original_error_count = report['total_failures']
+
+                    # False positives (DB='N/A' and ai_skills >=70%) are already filtered out
+                    filtered_failures = report['failures']
+                    filtered_out_count = report['filtered_out_count']
                     
                     # Use filtered count instead of original count
                     error_count = len(filtered_failures)
@@ -1447,12 +1790,10 @@ def update_historical_data(module: str):
     # This ensures failures from JSON are always reflected in history
     # NOTE: Filtering is already applied in db_solr_test_from_json above, so don't overwrite here
     # The test entry already has the filtered count, so we don't need to read JSON again
-    json_failure_path = project_root / "reports" / "db_solr_sync_failures.json"
-    if json_failure_path.exists():
+    sync_report = load_sync_failure_report()
+    if sync_report:
         try:
-            with open(json_failure_path, 'r', encoding='utf-8') as f:
-                json_data = json.load(f)
-            total_jobs = json_data.get('total_jobs_checked', json_data.get('total_jobs_available', 0))
+            total_jobs = sync_report['total_jobs']
             
             # Find db_solr_sync test in current_tests and update its status if JSON shows failures
             # CRITICAL: Don't overwrite error_jobs_count - it's already filtered in db_solr_test_from_json
@@ -1593,10 +1934,9 @@ def update_historical_data(module: str):
                         json_file_mtime = datetime.fromtimestamp(json_failure_path.stat().st_mtime)
                         json_file_age = (datetime.now() - json_file_mtime).total_seconds()
                         
-                        with open(json_failure_path, 'r', encoding='utf-8') as f:
-                            json_data = json.load(f)
-                        total_failures = json_data.get('total_failures', 0)
-                        total_jobs = json_data.get('total_jobs_checked', json_data.get('total_jobs_available', 0))
+                        sync_report = load_sync_failure_report() or {}
+                        total_failures = sync_report.get('total_failures', 0)
+                        total_jobs = sync_report.get('total_jobs', 0)
                         
                         # CRITICAL: If JSON file is recent (within 24 hours), ALWAYS use its datetime and data
                         if json_file_age < 86400:  # 24 hours
@@ -1611,14 +1951,8 @@ def update_historical_data(module: str):
                             if stable_datetime and ' to ' in stable_datetime:
                                 stable_datetime = stable_datetime.split(' to ')[0].strip()
                         
-                        # Filter out false positives (DB='N/A' and ai_skills >=70%)
-                        failures_list = json_data.get('failures', [])
-                        filtered_failures = []
-                        for f in failures_list:
-                            error_msg = str(f.get('msg', '')).strip()
-                            if _should_filter_failure_message(error_msg):
-                                continue
-                            filtered_failures.append(f)
+                        # False positives are already filtered out of the cached report
+                        filtered_failures = sync_report.get('failures', [])
                         
                         # Use filtered count instead of original count
                         filtered_error_count = len(filtered_failures)
@@ -1918,7 +2252,9 @@ def update_historical_data(module: str):
             print(f"Preserved existing {module} history ({len(existing_history)} tests)")
     
     # Save updated history
+    _normalize_entry_runtimes(history)
     save_historical_data(module, history)
+    update_module_summary(module, history)
 
 
 def get_7day_log_data(module: str, test_case: str, force_reload: bool = False) -> List[Dict]:
@@ -1929,10 +2265,6 @@ def get_7day_log_data(module: str, test_case: str, force_reload: bool = False) -
         print(f"BLOCKED: '{test_case}' does not belong to {module} - returning empty data")
         return []  # Return empty if test doesn't belong to this module
     
-    # CRITICAL: Force fresh read for db_solr_sync to ensure latest data
-    if 'db_solr_sync' in test_case.lower():
-        force_reload = True
-    
     history = load_historical_data(module, force_reload=force_reload)
     
     # CRITICAL: For read-only operations, DON'T modify history file during reads
@@ -1973,11 +2305,10 @@ def get_7day_log_data(module: str, test_case: str, force_reload: bool = False) -
         if fast_entries:
             if test_case not in history:
                 history[test_case] = fast_entries
-                # Only save if purely missing (initial load fix), but ideally rely on background thread
-                try:
-                    save_historical_data(module, history)
-                except Exception as e:
-                    print(f"Warning: Could not save fast history for {module}/{test_case}: {e}")
+                # Read path stays read-only - the background updater persists the full parse.
+                # Not forced: if history is already current (the test was filtered out of
+                # the module), polls must not keep re-parsing the log.
+                _UPDATE_SCHEDULER.request(module)
             else:
                 # Merge fast_entries into existing history (in-memory only)
                 # This ensures UI gets latest data without waiting for background thread
@@ -2205,35 +2536,21 @@ def get_test_history(module_id: str, test_case: str):
             response.headers['Expires'] = '0'
             return response
 
-        # Fast path for db_solr_sync using JSON file if available
+        # Fast path for db_solr_sync: served from the cached, pre-filtered failure report.
+        # Read-only - persisting to history is left to the background updater.
         if 'db_solr_sync' in test_case.lower():
             try:
-                project_root = get_project_root()
-                json_failure_path = project_root / "reports" / "db_solr_sync_failures.json"
-                print(f"API-DB-SOLR-SYNC: Fast JSON path for {test_case}")
-                print(f"API-JSON-CHECK: JSON file exists: {json_failure_path.exists()}, path: {json_failure_path}")
-
-                if json_failure_path.exists():
-                    import json
-                    from datetime import datetime
-
-                    with open(json_failure_path, 'r', encoding='utf-8') as f:
-                        json_data = json.load(f)
-
-                    total_failures = json_data.get('total_failures', 0)
-                    total_jobs = json_data.get('total_jobs_checked', json_data.get('total_jobs_available', 0))
-                    file_mtime = datetime.fromtimestamp(json_failure_path.stat().st_mtime)
-                    stable_datetime = file_mtime.isoformat()
-                    if ' to ' in stable_datetime:
-                        stable_datetime = stable_datetime.split(' to ')[0].strip()
-
+                report = load_sync_failure_report()
+                if report:
+                    stable_datetime = report['stable_datetime']
+                    file_mtime = report['file_mtime']
                     entry = {
                         'test_name': test_case,
-                        'status': 'FAIL' if total_failures > 0 else 'PASS',
+                        'status': 'FAIL' if report['total_failures'] > 0 else 'PASS',
                         'date': file_mtime.strftime('%Y-%m-%d'),
                         'datetime': stable_datetime,
                         'stable_datetime': stable_datetime,
-                        'total_jobs': total_jobs,
+                        'total_jobs': report['total_jobs'],
                         'error_jobs_count': 0,
                         'running_time': 'N/A',
                         'start_time': file_mtime.strftime('%Y%m%d %H:%M:%S'),
@@ -2242,51 +2559,31 @@ def get_test_history(module_id: str, test_case: str):
                         'error_jobs': []
                     }
 
-                    if total_failures > 0:
-                        failures_list = json_data.get('failures', [])
-                        # Filter out false positives (DB='N/A' and ai_skills >=70%)
-                        filtered_failures = []
-                        for f in failures_list:
-                            error_msg = str(f.get('msg', '')).strip()
-                            if _should_filter_failure_message(error_msg):
-                                continue
-                            filtered_failures.append(f)
-                        filtered_error_count = len(filtered_failures)
+                    if report['total_failures'] > 0:
+                        filtered_error_count = len(report['failures'])
                         entry['error_jobs_count'] = filtered_error_count
-                        entry['error_jobs'] = [
-                            {
-                                'id': str(f.get('id', 'N/A')),
-                                'title': str(f.get('db_title', 'N/A'))[:100],
-                                'error': str(f.get('msg', 'N/A'))[:500],
-                                'detected_at': stable_datetime
-                            }
-                            for f in filtered_failures[:filtered_error_count]
-                        ]
-                        entry['error_jobs'] = _dedupe_error_jobs(entry['error_jobs'])
-                        if len(entry['error_jobs']) > filtered_error_count:
-                            entry['error_jobs'] = entry['error_jobs'][:filtered_error_count]
+                        entry['error_jobs'] = report['error_jobs']
                         entry['failure_message'] = (
-                            f"Solr Sync Failed for {filtered_error_count}/{total_jobs} jobs checked "
+                            f"Solr Sync Failed for {filtered_error_count}/{report['total_jobs']} jobs checked "
                             f"(all jobs from last 12 hours). See logs for details."
                         )
 
-                    history = load_historical_data(module_id, force_reload=False)
-                    history[test_case] = [entry]
+                    # Report is newer than the stored history - let the scheduler persist it
+                    # (debounced, and skipped once history has caught up with the log)
+                    history_file_path = HISTORY_DIR / f"{module_id}_history.json"
                     try:
-                        save_historical_data(module_id, history)
-                    except Exception as save_err:
-                        print(f"API-SAVE-ERROR: Failed to save history for {test_case}: {save_err}")
+                        history_mtime = history_file_path.stat().st_mtime if history_file_path.exists() else 0
+                        if file_mtime.timestamp() > history_mtime:
+                            _UPDATE_SCHEDULER.request(module_id)
+                    except OSError:
+                        pass
 
                     return _response([entry])
             except Exception as e:
-                print(f"API-UPDATE-ERROR: Failed to update {test_case} from JSON: {e}")
+                print(f"API-DB-SOLR-SYNC-ERROR: Failed to build {test_case} from report: {e}")
 
-        # For non-db_solr_sync tests, avoid heavy updates inside request handlers
-        if 'db_solr_sync' not in test_case.lower():
-            log_data = get_7day_log_data(module_id, test_case, force_reload=False)
-        else:
-            # For db_solr_sync, fallback to history/log parsing if JSON path didn't return
-            log_data = get_7day_log_data(module_id, test_case, force_reload=True)
+        # Avoid heavy updates inside request handlers (db_solr_sync falls back here if no report)
+        log_data = get_7day_log_data(module_id, test_case, force_reload=False)
 
         # Final verification: ensure all returned data is for this test case and module
         # Note: get_7day_log_data already filters by test_case, so all entries should match
@@ -2318,6 +2615,27 @@ def get_test_history(module_id: str, test_case: str):
         return jsonify([]), 200
 
 
+@app.route('/api/modules/<module_id>/summary', methods=['GET'])
+def get_module_summary(module_id: str):
+    """Get precomputed per-test aggregates (pass rate, last status, runtime percentiles)"""
+    if module_id not in MODULES:
+        return jsonify({'error': 'Module not found'}), 404
+
+    _start_update_if_needed(module_id)
+    summary = load_module_summary(module_id)
+    tests = {
+        name: {k: v for k, v in data.items() if k != 'samples'}
+        for name, data in summary.get('tests', {}).items()
+    }
+    return jsonify({
+        'module_id': module_id,
+        'updated_at': summary.get('updated_at'),
+        'windows': [f"{days}d" for days in SUMMARY_WINDOWS_DAYS],
+        'regressions': summary.get('regressions', []),
+        'tests': tests
+    })
+
+
 @app.route('/api/modules/<module_id>/download-log', methods=['GET'])
 def download_log(module_id: str):
     """Download log file for a module"""
@@ -2343,30 +2661,39 @@ def update_module_data(module_id: str):
     if module_id not in MODULES:
         return jsonify({'error': 'Module not found'}), 404
     
-    update_historical_data(module_id)
+    # Run through the scheduler so a manual update never overlaps a background one
+    _UPDATE_SCHEDULER.request(module_id, force=True)
+    if not _UPDATE_SCHEDULER.wait_idle([module_id], timeout=300):
+        return jsonify({'status': 'pending'}), 202
     return jsonify({'status': 'updated'})
 
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint to verify server is running"""
+    scheduler_status = _UPDATE_SCHEDULER.status()
     return jsonify({
         'status': 'running',
         'modules': list(MODULES.keys()),
-        'timestamp': datetime.now().isoformat()
+        'timestamp': datetime.now().isoformat(),
+        'update_queue_depth': scheduler_status['queue_depth'],
+        'updates_running': scheduler_status['running']
     })
 
 
+@app.route('/api/update-status', methods=['GET'])
+def update_status():
+    """Background history update scheduler status (queue depth, last durations)"""
+    return jsonify(_UPDATE_SCHEDULER.status())
+
+
 @app.route('/api/update-all', methods=['POST'])
 def update_all_modules():
-    """Update historical data for all modules"""
+    """Queue a historical data update for all modules"""
     results = {}
     for module_id in MODULES.keys():
-        try:
-            update_historical_data(module_id)
-            results[module_id] = 'updated'
-        except Exception as e:
-            results[module_id] = f'error: {str(e)}'
+        queued = _UPDATE_SCHEDULER.request(module_id, force=True)
+        results[module_id] = 'queued' if queued else 'coalesced'
     return jsonify(results)
 
 
@@ -2406,22 +2733,40 @@ def migrate_old_benchsale_data():
             print(f"Error migrating old benchsale data: {e}")
 
 
+def warm_up_read_only():
+    """Standby warm-up: read every module's history and summary and the sync report, writing nothing.
+
+    The primary owns the history files while it runs (save_historical_data is not
+    safe against a second writer), so a standby only loads them until it is promoted.
+    """
+    for module_id in MODULES.keys():
+        get_allowed_tests(module_id)
+        for path in (HISTORY_DIR / f"{module_id}_history.json", HISTORY_DIR / f"{module_id}_summary.json"):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    json.load(f)
+            except (OSError, ValueError):
+                pass
+    load_sync_failure_report()
+
+
 if __name__ == '__main__':
-    # Migrate old data if exists
-    migrate_old_benchsale_data()
-    
-    # Initialize history for all modules in background thread to avoid blocking server startup
-    def init_history():
-        """Initialize history in background"""
+    if '--standby' in sys.argv[1:]:
+        # Hot standby for server_keep_alive.py: warm up without touching the history
+        # files (the primary is still updating them), then wait to be promoted
+        from utils.server_keep_alive import wait_for_promotion
+        warm_up_read_only()
+        wait_for_promotion()
+        # Now the only writer: migrate and catch up on anything logged since the primary's last update
+        migrate_old_benchsale_data()
         for module_id in MODULES.keys():
-            try:
-                update_historical_data(module_id)
-            except Exception as e:
-                print(f"Error updating history for {module_id}: {e}")
-    
-    # Start history update in background
-    history_thread = threading.Thread(target=init_history, daemon=True)
-    history_thread.start()
+            _start_update_if_needed(module_id)
+    else:
+        # Migrate old data if exists
+        migrate_old_benchsale_data()
+        # Initialize history for all modules through the background update scheduler
+        for module_id in MODULES.keys():
+            _UPDATE_SCHEDULER.request(module_id, force=True)
     
     # Run with better error handling for 24/7 operation
     try:
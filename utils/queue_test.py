@@ -1,40 +1,25 @@
 """
-Helper script to add test to queue file.
+Helper script to add test to the run queue.
 Called from dashboard when HTTP server is not available.
 """
 
-import json
 import sys
 from pathlib import Path
-from datetime import datetime
 
 PROJECT_ROOT = Path(__file__).parent.parent.resolve()
-QUEUE_FILE = PROJECT_ROOT / '.test_queue.json'
+
+sys.path.insert(0, str(PROJECT_ROOT))
+from utils import run_queue
 
 
 def add_test_to_queue(test_name):
-    """Add test name to queue file."""
+    """Add test name to the run queue (no-op if it is already queued or running)."""
     try:
-        # Read existing queue
-        if QUEUE_FILE.exists():
-            with open(QUEUE_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                queue = data.get('queue', [])
+        run_id, created = run_queue.enqueue(test_name, source='cli')
+        if created:
+            print(f"Added test '{test_name}' to queue")
         else:
-            queue = []
-        
-        # Add test if not already in queue
-        if test_name not in queue:
-            queue.append(test_name)
-        
-        # Write queue back
-        with open(QUEUE_FILE, 'w', encoding='utf-8') as f:
-            json.dump({
-                'queue': queue,
-                'last_updated': datetime.now().isoformat()
-            }, f, indent=2)
-        
-        print(f"Added test '{test_name}' to queue")
+            print(f"Test '{test_name}' is already queued or running")
         return True
     except Exception as e:
         print(f"Error adding test to queue: {e}", file=sys.stderr)
@@ -0,0 +1,223 @@
+"""
+Run Estimates - Expected test durations, queue ordering and ETAs from historical runtimes.
+
+Durations come from the per-module history files the log history API writes
+(logs/history/<module>_history.json, one entry per run with its running_time):
+the median of a test's last RECENT_RUNS runtimes, plus SESSION_OVERHEAD_SECONDS
+for starting pytest, the browser and the login. Tests without history get
+RUN_ESTIMATE_DEFAULT_SECONDS. The files are re-read only when they change.
+
+RUN_QUEUE_ORDER picks which queued test the always-on server starts next:
+    sjf         shortest expected duration first (default), so quick tests
+                don't wait behind a 20-minute sync run
+    fail-first  tests that failed recently first, then shortest first
+    fifo        oldest first
+With sjf and fail-first a test that has waited RUN_QUEUE_MAX_WAIT seconds goes
+ahead of everything else, so long tests can't be starved.
+
+queue_eta() replays the schedule over the lanes (and the resources each test
+holds, see utils/test_resources.py) to estimate when every queued test starts
+and finishes.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from statistics import median
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+HISTORY_DIR = PROJECT_ROOT / 'logs' / 'history'
+RECENT_RUNS = 10
+DEFAULT_SECONDS = float(os.getenv('RUN_ESTIMATE_DEFAULT_SECONDS', '120'))
+SESSION_OVERHEAD_SECONDS = float(os.getenv('RUN_ESTIMATE_OVERHEAD_SECONDS', '15'))
+QUEUE_ORDER = os.getenv('RUN_QUEUE_ORDER', 'sjf').strip().lower()
+MAX_WAIT_SECONDS = float(os.getenv('RUN_QUEUE_MAX_WAIT', '1800'))
+
+# {'signature': [(path, size, mtime_ns), ...], 'stats': {test_name: {...}}}
+_HISTORY_CACHE = {'signature': None, 'stats': {}}
+_HISTORY_LOCK = threading.Lock()
+
+
+def parse_running_time_seconds(value):
+    """Normalize a running_time value to float seconds.
+
+    Accepts "HH:MM:SS.mmm", "MM:SS", "12.3 seconds", "12.3s", plain numbers and
+    "N/A"/empty (returns None).
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip().lower()
+    if not text or text in ('n/a', 'na', 'none', 'null'):
+        return None
+    if ':' in text:
+        try:
+            seconds = 0.0
+            for part in text.split(':'):
+                seconds = seconds * 60 + float(part)
+            return seconds
+        except ValueError:
+            return None
+    match = re.match(r'^([\d.]+)\s*(s|sec|secs|second|seconds)?$', text)
+    if match:
+        try:
+            return float(match.group(1))
+        except ValueError:
+            return None
+    return None
+
+
+def _load_history_stats(paths):
+    samples = {}  # test_name -> {datetime: (seconds, status)}
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                history = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read {path.name} for run estimates: {e}")
+            continue
+        if not isinstance(history, dict):
+            continue
+        for test_name, entries in history.items():
+            if not isinstance(entries, list):
+                continue
+            runs = samples.setdefault(test_name, {})
+            for entry in entries:
+                if not isinstance(entry, dict):
+                    continue
+                seconds = entry.get('running_time_seconds')
+                if seconds is None:
+                    seconds = parse_running_time_seconds(entry.get('running_time'))
+                # benchsale_test duplicates the admin/recruiter entries; key by run time
+                key = str(entry.get('datetime') or entry.get('date') or len(runs))
+                runs[key] = (seconds, str(entry.get('status', '')).upper())
+    stats = {}
+    for test_name, runs in samples.items():
+        recent = [runs[key] for key in sorted(runs, reverse=True)[:RECENT_RUNS]]
+        runtimes = [seconds for seconds, _ in recent if seconds]
+        results = [status for _, status in recent if status in ('PASS', 'FAIL')]
+        stats[test_name] = {
+            'seconds': median(runtimes) if runtimes else None,
+            'fail_rate': results.count('FAIL') / len(results) if results else 0.0,
+            'last_status': results[0] if results else None,
+            'runs': len(recent),
+        }
+    return stats
+
+
+def history_stats():
+    """{test_name: {'seconds', 'fail_rate', 'last_status', 'runs'}} from logs/history."""
+    paths = sorted(HISTORY_DIR.glob('*_history.json'))
+    signature = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        signature.append((str(path), stat.st_size, stat.st_mtime_ns))
+    with _HISTORY_LOCK:
+        if _HISTORY_CACHE['signature'] != signature:
+            _HISTORY_CACHE['stats'] = _load_history_stats(paths)
+            _HISTORY_CACHE['signature'] = signature
+        return _HISTORY_CACHE['stats']
+
+
+def estimate_seconds(test_name, stats=None):
+    """Expected wall-clock time to run one test, including session start-up."""
+    stats = history_stats() if stats is None else stats
+    seconds = (stats.get(test_name) or {}).get('seconds')
+    return (seconds if seconds else DEFAULT_SECONDS) + SESSION_OVERHEAD_SECONDS
+
+
+def schedule(queued_runs, order=None, now=None):
+    """Queued runs (dicts with id, test_name, enqueued_at) in the order they should start.
+
+    Used as run_queue.claim_batch(order=...).
+    """
+    order = order or QUEUE_ORDER
+    now = time.time() if now is None else now
+    stats = history_stats()
+
+    def key(run):
+        if order not in ('sjf', 'fail-first') or now - (run.get('enqueued_at') or now) >= MAX_WAIT_SECONDS:
+            return (0, 0.0, 0.0, run['id'])  # FIFO, and overdue tests before the rest
+        seconds = estimate_seconds(run['test_name'], stats)
+        if order == 'fail-first':
+            test_stats = stats.get(run['test_name']) or {}
+            recently_failed = test_stats.get('fail_rate', 0.0) + (1.0 if test_stats.get('last_status') == 'FAIL' else 0.0)
+            return (1, -recently_failed, seconds, run['id'])
+        return (1, 0.0, seconds, run['id'])
+
+    return sorted(queued_runs, key=key)
+
+
+def queue_eta(runs, lanes=1, resources_for=None, order=None, now=None):
+    """Estimated start/finish times for active runs (run_queue.active_runs()).
+
+    Replays the schedule: running sessions finish at start + their estimate,
+    queued tests take the next free lane in schedule order but not before the
+    resources they need are released. Returns
+    {'tests': {test_name: {...}}, 'estimated_completion': epoch or None}.
+    """
+    now = time.time() if now is None else now
+    stats = history_stats()
+    tests = {}
+    resource_free = {}  # resource -> time it is released
+
+    def exclusive(test_name):
+        resources = set(resources_for(test_name)) if resources_for else set()
+        resources.discard('browser')  # Bounded by the lanes here
+        return resources
+
+    sessions = {}
+    for run in runs:
+        if run['status'] == 'running':
+            sessions.setdefault(run.get('worker'), []).append(run)
+    lane_free = []
+    for session in sessions.values():
+        started = min(run.get('started_at') or now for run in session)
+        # A batch runs its tests one after another in one session; results arrive together
+        work = sum(estimate_seconds(run['test_name'], stats) - SESSION_OVERHEAD_SECONDS for run in session)
+        finish = max(started + SESSION_OVERHEAD_SECONDS + work, now)
+        lane_free.append(finish)
+        for run in session:
+            tests[run['test_name']] = {
+                'state': 'running',
+                'started_at': run.get('started_at'),
+                'estimated_seconds': round(estimate_seconds(run['test_name'], stats), 1),
+                'eta_finish': round(finish, 1),
+            }
+            for resource in exclusive(run['test_name']):
+                resource_free[resource] = max(resource_free.get(resource, now), finish)
+    lane_free += [now] * max(0, lanes - len(lane_free))
+    lane_free.sort()
+
+    queued = [run for run in runs if run['status'] == 'queued']
+    for position, run in enumerate(schedule(queued, order, now), start=1):
+        seconds = estimate_seconds(run['test_name'], stats)
+        resources = exclusive(run['test_name'])
+        start = lane_free[0]
+        if '*' in resources:
+            start = max([lane_free[-1]] + list(resource_free.values()))
+        else:
+            start = max([start] + [resource_free.get(resource, now) for resource in resources])
+        finish = start + seconds
+        lane_free[0] = finish
+        if '*' in resources:
+            lane_free = [max(free, finish) for free in lane_free]
+        lane_free.sort()
+        for resource in resources:
+            resource_free[resource] = finish
+        tests[run['test_name']] = {
+            'state': 'queued',
+            'position': position,
+            'estimated_seconds': round(seconds, 1),
+            'eta_start': round(start, 1),
+            'eta_finish': round(finish, 1),
+        }
+    finishes = [test['eta_finish'] for test in tests.values()]
+    return {'tests': tests, 'estimated_completion': max(finishes) if finishes else None}
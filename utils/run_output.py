@@ -0,0 +1,271 @@
+"""
+Run Output - Live pytest output of queued runs, for watching a test while it runs.
+
+The always-on server reads each pytest child's stdout/stderr through a pipe (a
+reader thread takes whatever bytes are available, no line buffering) and keeps
+them in two places:
+
+    memory   the last RUN_OUTPUT_BUFFER_BYTES bytes of every active run, plus
+             the RUN_OUTPUT_KEEP most recently finished runs
+    disk     logs/runs/run_<id>.log, the full output (the newest
+             RUN_OUTPUT_KEEP_FILES files are kept)
+
+GET /runs/<id>/tail?since=<offset> on the always-on server returns the output
+bytes from byte offset `since` (at most RUN_OUTPUT_TAIL_MAX_BYTES per request).
+The X-Next-Offset header is the `since` for the next request and X-Run-Done is
+1 once the run has finished. Polling is answered from memory, so it never
+touches the module logs. The file is read only when a client asks for bytes
+that have already left the buffer, or for a run that has been evicted from memory.
+
+A batch of tests shares one pytest session, so every run ID in the batch maps
+to the same output. On disk that output is stored under the batch's first run ID;
+each other run ID gets a run_<id>.ref file naming it, so its output can still be
+found once it has left memory.
+
+Follow a run from a terminal:
+    python utils/run_output.py <run_id> [--server http://127.0.0.1:8766]
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+OUTPUT_DIR = PROJECT_ROOT / 'logs' / 'runs'
+BUFFER_BYTES = int(os.getenv('RUN_OUTPUT_BUFFER_BYTES', str(256 * 1024)))
+TAIL_MAX_BYTES = int(os.getenv('RUN_OUTPUT_TAIL_MAX_BYTES', str(64 * 1024)))
+KEEP_FINISHED = int(os.getenv('RUN_OUTPUT_KEEP', '20'))
+KEEP_FILES = int(os.getenv('RUN_OUTPUT_KEEP_FILES', '200'))
+READ_CHUNK = 64 * 1024
+
+# run_id -> RunOutput (a batch's run IDs share one); finished ones in finish order
+_OUTPUTS = OrderedDict()
+_FINISHED = OrderedDict()
+_LOCK = threading.Lock()
+
+
+def output_file(run_id):
+    return OUTPUT_DIR / f'run_{int(run_id)}.log'
+
+
+def _ref_file(run_id):
+    return OUTPUT_DIR / f'run_{int(run_id)}.ref'
+
+
+def find_output_file(run_id):
+    """The log file holding a run's output (its own, or its batch's), or None."""
+    path = output_file(run_id)
+    if path.exists():
+        return path
+    try:
+        name = _ref_file(run_id).read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+    path = OUTPUT_DIR / Path(name).name
+    return path if path.exists() else None
+
+
+class RunOutput:
+    """Output of one pytest session: a bounded in-memory tail plus the full file.
+
+    Offsets are byte positions in the whole output, so a client can resume
+    where it stopped however much has been dropped from memory since.
+    """
+
+    def __init__(self, run_ids, path, limit=BUFFER_BYTES):
+        self.run_ids = list(run_ids)
+        self.path = path
+        self.limit = limit
+        self.done = False
+        self._buffer = bytearray()
+        self._start = 0  # Offset of _buffer[0]
+        self._size = 0   # Bytes written so far
+        self._lock = threading.Lock()
+        self._file = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(path, 'wb')
+        except OSError as e:
+            print(f"Warning: Could not create {path}: {e}", file=sys.stderr)
+
+    @property
+    def size(self):
+        return self._size
+
+    def write(self, data):
+        if isinstance(data, str):
+            data = data.encode('utf-8', errors='replace')
+        if not data:
+            return
+        with self._lock:
+            if self._file:
+                try:
+                    self._file.write(data)
+                    self._file.flush()  # Readers of old offsets open the file themselves
+                except OSError:
+                    pass
+            self._buffer += data
+            self._size += len(data)
+            # Trim in one go once the buffer is twice the limit (amortized O(1) per byte)
+            if len(self._buffer) > 2 * self.limit:
+                drop = len(self._buffer) - self.limit
+                del self._buffer[:drop]
+                self._start += drop
+
+    def close(self):
+        with self._lock:
+            self.done = True
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def read(self, since=0, max_bytes=TAIL_MAX_BYTES):
+        """(bytes from offset `since`, next offset, done)."""
+        since = max(0, min(int(since), self._size))
+        with self._lock:
+            done = self.done
+            if since >= self._start:
+                offset = since - self._start
+                data = bytes(self._buffer[offset:offset + max_bytes])
+                return data, since + len(data), done
+            end = min(self._start, since + max_bytes)
+        # Older than the memory tail: read the gap from the file
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(since)
+                data = f.read(end - since)
+        except OSError:
+            data = b''
+            since = end  # Lost; skip to what is still in memory
+        return data, since + len(data), done
+
+
+def _prune_files():
+    try:
+        files = sorted(OUTPUT_DIR.glob('run_*.log'), key=lambda p: p.stat().st_mtime)
+        refs = list(OUTPUT_DIR.glob('run_*.ref'))
+    except OSError:
+        return
+    for path in files[:max(0, len(files) - KEEP_FILES)]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+    for ref in refs:
+        try:
+            if not (OUTPUT_DIR / ref.read_text(encoding='utf-8').strip()).exists():
+                ref.unlink()
+        except OSError:
+            pass
+
+
+def start(run_ids):
+    """Create and register the output for a session running these queued runs."""
+    output = RunOutput(run_ids, output_file(run_ids[0]))
+    with _LOCK:
+        for run_id in output.run_ids:
+            _OUTPUTS[run_id] = output
+    for run_id in output.run_ids[1:]:
+        try:
+            _ref_file(run_id).write_text(output.path.name, encoding='utf-8')
+        except OSError as e:
+            print(f"Warning: Could not create {_ref_file(run_id)}: {e}", file=sys.stderr)
+    _prune_files()
+    return output
+
+
+def finish(output):
+    """Mark a session's output complete; only the newest KEEP_FINISHED stay in memory."""
+    output.close()
+    with _LOCK:
+        _FINISHED[id(output)] = output
+        while len(_FINISHED) > KEEP_FINISHED:
+            _, old = _FINISHED.popitem(last=False)
+            for run_id in old.run_ids:
+                if _OUTPUTS.get(run_id) is old:
+                    del _OUTPUTS[run_id]
+
+
+def tail(run_id, since=0, max_bytes=TAIL_MAX_BYTES):
+    """(data, next_offset, done) for a run, or None if there is no output for it."""
+    with _LOCK:
+        output = _OUTPUTS.get(run_id)
+    if output is not None:
+        return output.read(since, max_bytes)
+    path = find_output_file(run_id)
+    if path is None:
+        return None
+    try:
+        size = path.stat().st_size
+        since = max(0, min(int(since), size))
+        with open(path, 'rb') as f:
+            f.seek(since)
+            data = f.read(max_bytes)
+    except OSError:
+        return None
+    return data, since + len(data), True
+
+
+def pump(stream, output, echo=None):
+    """Copy a child's output pipe into `output` until EOF (run it in a thread).
+
+    os.read returns as soon as any bytes are available, so output shows up while
+    the test runs, not when a buffer fills. echo (a binary stream) also gets a
+    copy, e.g. the server's console.
+    """
+    fd = stream.fileno()
+    try:
+        while True:
+            try:
+                data = os.read(fd, READ_CHUNK)
+            except OSError:
+                break
+            if not data:
+                break
+            output.write(data)
+            if echo is not None:
+                try:
+                    echo.write(data)
+                    echo.flush()
+                except (OSError, ValueError):
+                    echo = None
+    finally:
+        stream.close()
+
+
+def follow(run_id, server='http://127.0.0.1:8766', interval=1.0):
+    """Print a run's output as it arrives (like tail -f) until the run finishes."""
+    import time
+    import urllib.error
+    import urllib.request
+    since = 0
+    out = sys.stdout.buffer
+    while True:
+        try:
+            with urllib.request.urlopen(f'{server}/runs/{run_id}/tail?since={since}', timeout=10) as response:
+                data = response.read()
+                since = int(response.headers.get('X-Next-Offset', since + len(data)))
+                done = response.headers.get('X-Run-Done') == '1'
+        except urllib.error.HTTPError as e:
+            print(f"No output for run {run_id} ({e.code})", file=sys.stderr)
+            return 1
+        except OSError as e:
+            print(f"Could not reach {server}: {e}", file=sys.stderr)
+            return 1
+        out.write(data)
+        out.flush()
+        if done and not data:
+            return 0
+        if not data:
+            time.sleep(interval)
+
+
+if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='Follow the live output of a queued test run')
+    parser.add_argument('run_id', type=int)
+    parser.add_argument('--server', default='http://127.0.0.1:8766')
+    args = parser.parse_args()
+    sys.exit(follow(args.run_id, args.server))
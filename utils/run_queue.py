@@ -0,0 +1,570 @@
+"""
+Run Queue - Durable, transactional queue of test runs shared by the runner servers.
+
+always_on_server.py, test_runner_server.py and test_queue_watcher.py all enqueue
+and claim runs here instead of read-modify-writing .test_queue.json under lock
+files. The queue is a SQLite database (.test_queue.db, WAL mode) and every
+operation is a single transaction, so several processes can use it at once.
+
+A run goes queued -> running -> passed / failed. A worker claims the oldest
+queued run and holds a lease on it that is renewed by a heartbeat while the test
+runs. If the worker dies, its lease expires and the run is queued again (up to
+RUN_QUEUE_MAX_ATTEMPTS, then marked 'lost') - no lock-file mtime guessing. A
+worker that finds its lease lost stops the run and doesn't record a result, so
+a run never executes twice at once. A test that is already queued or running is
+not enqueued a second time.
+
+.test_queue.json is still accepted as an inbox: names written to it are moved
+into the queue by import_queue_file().
+
+Watchers don't poll: enqueue/complete/requeue call notify_change(), which wakes
+wait_for_change() in this process and sends a datagram to 127.0.0.1:RUN_QUEUE_NOTIFY_PORT
+for the process that called listen_for_changes(). Watchers still re-check every
+RUN_QUEUE_IDLE_RECHECK seconds for the .test_queue.json inbox and expired leases.
+
+Usage:
+    python utils/run_queue.py list
+    python utils/run_queue.py recent
+    python utils/run_queue.py add <test_name>
+    python utils/run_queue.py clear
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+QUEUE_DB = Path(os.getenv('RUN_QUEUE_DB', str(PROJECT_ROOT / '.test_queue.db')))
+QUEUE_FILE = PROJECT_ROOT / '.test_queue.json'  # Legacy inbox, imported into the queue
+LEASE_SECONDS = float(os.getenv('RUN_QUEUE_LEASE_SECONDS', '60'))
+MAX_ATTEMPTS = int(os.getenv('RUN_QUEUE_MAX_ATTEMPTS', '2'))
+# Finished runs older than this are deleted; the queue is not a results archive
+KEEP_FINISHED_SECONDS = float(os.getenv('RUN_QUEUE_KEEP_FINISHED_SECONDS', str(7 * 24 * 3600)))
+NOTIFY_PORT = int(os.getenv('RUN_QUEUE_NOTIFY_PORT', '8769'))  # Local UDP wake-ups between processes
+IDLE_RECHECK_SECONDS = float(os.getenv('RUN_QUEUE_IDLE_RECHECK', '30'))  # Watchers' fallback re-check when idle
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    test_name TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    source TEXT,
+    enqueued_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    worker TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    exit_code INTEGER,
+    error TEXT
+);
+-- At most one queued/running run per test: enqueue de-duplicates atomically
+CREATE UNIQUE INDEX IF NOT EXISTS runs_active_test ON runs(test_name) WHERE status IN ('queued', 'running');
+CREATE INDEX IF NOT EXISTS runs_status ON runs(status, id);
+"""
+
+_initialized = set()
+_init_lock = threading.Lock()
+
+# Bumped on every queue change; watchers wait on the condition instead of polling
+_changes = 0
+_changed = threading.Condition()
+
+
+def _now():
+    return time.time()
+
+
+@contextmanager
+def _connect():
+    """Open a connection to the queue database (autocommit; use BEGIN IMMEDIATE for writes)."""
+    conn = sqlite3.connect(str(QUEUE_DB), timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    try:
+        db_key = str(QUEUE_DB)
+        if db_key not in _initialized:
+            with _init_lock:
+                if db_key not in _initialized:
+                    conn.execute('PRAGMA journal_mode=WAL')
+                    conn.executescript(_SCHEMA)
+                    _initialized.add(db_key)
+        yield conn
+    finally:
+        conn.close()
+
+
+@contextmanager
+def _transaction(conn):
+    # IMMEDIATE takes the write lock up front, so read-then-update can't interleave
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        yield conn
+        conn.execute('COMMIT')
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+
+
+def change_count() -> int:
+    """Current change counter, to pass to wait_for_change() later."""
+    with _changed:
+        return _changes
+
+
+def _wake_local():
+    global _changes
+    with _changed:
+        _changes += 1
+        _changed.notify_all()
+
+
+def notify_change():
+    """Wake queue watchers: in this process directly, in another via a local UDP datagram."""
+    _wake_local()
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.sendto(str(os.getpid()).encode('ascii'), ('127.0.0.1', NOTIFY_PORT))
+    except OSError:
+        pass  # Nobody listening is fine
+
+
+def wait_for_change(seen: int, timeout: float = IDLE_RECHECK_SECONDS) -> int:
+    """Block until the queue changed since change_count() returned seen (or timeout). Returns the new count."""
+    with _changed:
+        _changed.wait_for(lambda: _changes != seen, timeout)
+        return _changes
+
+
+def listen_for_changes() -> bool:
+    """Receive other processes' notify_change() datagrams in a background thread.
+
+    Only one process on the machine can listen (the first to bind the port);
+    returns False for the others, whose watchers fall back to the idle re-check.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sock.bind(('127.0.0.1', NOTIFY_PORT))
+    except OSError:
+        sock.close()
+        return False
+    own_pid = str(os.getpid()).encode('ascii')
+
+    def receive():
+        while True:
+            try:
+                sender = sock.recv(64)
+            except ConnectionResetError:
+                continue  # Windows reports ICMP errors on UDP sockets
+            except OSError:
+                return
+            if sender != own_pid:
+                _wake_local()
+
+    threading.Thread(target=receive, name='run-queue-notify', daemon=True).start()
+    return True
+
+
+def worker_id(name: str = '') -> str:
+    """Identify the claiming process (and thread, if name is given)."""
+    base = f"{socket.gethostname()}:{os.getpid()}"
+    return f"{base}:{name}" if name else base
+
+
+def _requeue_expired(conn, now):
+    """Re-queue runs whose worker stopped heartbeating; give up after MAX_ATTEMPTS."""
+    conn.execute(
+        "UPDATE runs SET status = 'lost', finished_at = ?, error = 'lease expired' "
+        "WHERE status = 'running' AND lease_expires < ? AND attempts >= ?",
+        (now, now, MAX_ATTEMPTS),
+    )
+    conn.execute(
+        "UPDATE runs SET status = 'queued', worker = NULL, lease_expires = NULL "
+        "WHERE status = 'running' AND lease_expires < ?",
+        (now,),
+    )
+
+
+def enqueue(test_name: str, source: str = None):
+    """Add a test to the queue unless it is already queued or running.
+
+    Returns (run_id, created). created is False when the test was already
+    active; run_id is then the existing run.
+    """
+    test_name = (test_name or '').strip()
+    if not test_name:
+        raise ValueError('Test name is required')
+    with _connect() as conn, _transaction(conn):
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO runs (test_name, status, source, enqueued_at) VALUES (?, 'queued', ?, ?)",
+            (test_name, source, _now()),
+        )
+        if cursor.rowcount:
+            run_id, created = cursor.lastrowid, True
+        else:
+            row = conn.execute(
+                "SELECT id FROM runs WHERE test_name = ? AND status IN ('queued', 'running')", (test_name,)
+            ).fetchone()
+            run_id, created = (row['id'] if row else None), False
+    if created:
+        notify_change()
+    return run_id, created
+
+
+def claim(worker: str, max_running: int = 1, lease_seconds: float = LEASE_SECONDS):
+    """Atomically claim the oldest queued run for this worker.
+
+    Nothing is claimed while max_running workers (across all processes) already
+    hold runs with a live lease. Returns the run as a dict, or None.
+    """
+    runs = claim_batch(worker, max_tests=1, max_running=max_running, lease_seconds=lease_seconds)
+    return runs[0] if runs else None
+
+
+def claim_batch(worker: str, same_batch=None, max_tests: int = 1, max_running: int = 1,
+                lease_seconds: float = LEASE_SECONDS, admit=None, order=None) -> list:
+    """Atomically claim the next queued run plus queued runs that can share its session.
+
+    same_batch(first_test_name, other_test_name) decides whether another queued
+    test joins the batch (e.g. same test module); at most max_tests runs are
+    claimed. A batch counts once against max_running.
+
+    admit(test_name, running_sessions) decides whether a queued test may start
+    next to what is already running (running_sessions: one list of test names
+    per running worker); tests it refuses stay queued and later tests may go
+    first. order(queued_runs) returns the queued runs (dicts with id, test_name,
+    enqueued_at) in the order they should start; the default is oldest first.
+    Returns a list of runs (empty if nothing could be claimed).
+    """
+    now = _now()
+    with _connect() as conn, _transaction(conn):
+        _requeue_expired(conn, now)
+        sessions = {}
+        for row in conn.execute("SELECT worker, test_name FROM runs WHERE status = 'running' ORDER BY id"):
+            sessions.setdefault(row['worker'], []).append(row['test_name'])
+        if len(sessions) >= max_running:
+            return []
+        rows = [dict(row) for row in conn.execute(
+            "SELECT id, test_name, enqueued_at FROM runs WHERE status = 'queued' ORDER BY id"
+        )]
+        if order:
+            rows = order(rows)
+        if admit:
+            running_sessions = list(sessions.values())
+            rows = [row for row in rows if admit(row['test_name'], running_sessions)]
+        if not rows:
+            return []
+        first = rows[0]
+        ids = [first['id']]
+        if same_batch:
+            for row in rows[1:]:
+                if len(ids) >= max_tests:
+                    break
+                if same_batch(first['test_name'], row['test_name']):
+                    ids.append(row['id'])
+        placeholders = ', '.join('?' * len(ids))
+        conn.execute(
+            "UPDATE runs SET status = 'running', worker = ?, started_at = ?, lease_expires = ?, "
+            f"attempts = attempts + 1 WHERE id IN ({placeholders})",
+            (worker, now, now + lease_seconds, *ids),
+        )
+        rows = conn.execute(f"SELECT * FROM runs WHERE id IN ({placeholders}) ORDER BY id", ids).fetchall()
+        return [dict(row) for row in rows]
+
+
+def heartbeat(run_ids, worker: str, lease_seconds: float = LEASE_SECONDS) -> bool:
+    """Extend the lease on claimed run(s). Returns False if any lease was lost."""
+    run_ids = [run_ids] if isinstance(run_ids, int) else list(run_ids)
+    placeholders = ', '.join('?' * len(run_ids))
+    with _connect() as conn, _transaction(conn):
+        cursor = conn.execute(
+            f"UPDATE runs SET lease_expires = ? WHERE id IN ({placeholders}) AND worker = ? AND status = 'running'",
+            (_now() + lease_seconds, *run_ids, worker),
+        )
+        return cursor.rowcount == len(run_ids)
+
+
+def complete(run_id: int, worker: str, status: str, exit_code: int = None, error: str = None) -> bool:
+    """Record the outcome of a claimed run ('passed', 'failed' or 'skipped')."""
+    now = _now()
+    with _connect() as conn, _transaction(conn):
+        cursor = conn.execute(
+            "UPDATE runs SET status = ?, finished_at = ?, exit_code = ?, error = ?, lease_expires = NULL "
+            "WHERE id = ? AND worker = ? AND status = 'running'",
+            (status, now, exit_code, error, run_id, worker),
+        )
+        conn.execute(
+            "DELETE FROM runs WHERE status NOT IN ('queued', 'running') AND finished_at < ?",
+            (now - KEEP_FINISHED_SECONDS,),
+        )
+        completed = cursor.rowcount == 1
+    if completed:
+        notify_change()  # Frees a lane and the run's resources
+    return completed
+
+
+def expire_worker_leases(pid: int, host: str = None) -> int:
+    """End the leases held by a process that is known to be dead (with everything it started).
+
+    Its runs are requeued (or marked lost) at the next claim instead of after
+    their lease runs out. Returns the number of runs affected.
+    """
+    worker = f"{host or socket.gethostname()}:{int(pid)}"
+    now = _now()
+    with _connect() as conn, _transaction(conn):
+        expired = conn.execute(
+            "UPDATE runs SET lease_expires = ? WHERE status = 'running' AND (worker = ? OR worker LIKE ?)",
+            (now - 1, worker, worker + ':%'),
+        ).rowcount
+    if expired:
+        notify_change()
+    return expired
+
+
+def requeue(run_id: int, worker: str) -> bool:
+    """Give a claimed run back to the queue without counting the attempt."""
+    with _connect() as conn, _transaction(conn):
+        cursor = conn.execute(
+            "UPDATE runs SET status = 'queued', worker = NULL, lease_expires = NULL, attempts = attempts - 1 "
+            "WHERE id = ? AND worker = ? AND status = 'running'",
+            (run_id, worker),
+        )
+        requeued = cursor.rowcount == 1
+    if requeued:
+        notify_change()
+    return requeued
+
+
+def clear() -> int:
+    """Drop all queued runs (running ones finish normally). Returns how many were removed."""
+    with _connect() as conn, _transaction(conn):
+        return conn.execute("DELETE FROM runs WHERE status = 'queued'").rowcount
+
+
+def active_runs() -> list:
+    """Queued and running runs, oldest first."""
+    with _connect() as conn:
+        rows = conn.execute(
+            "SELECT * FROM runs WHERE status IN ('queued', 'running') ORDER BY id"
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def recent_runs(limit: int = 20) -> list:
+    """Most recently finished runs (passed / failed / skipped / lost), newest first."""
+    with _connect() as conn:
+        rows = conn.execute(
+            "SELECT * FROM runs WHERE status NOT IN ('queued', 'running') ORDER BY finished_at DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def queued_tests() -> list:
+    """Names of the queued (not yet running) tests, in queue order."""
+    return [run['test_name'] for run in active_runs() if run['status'] == 'queued']
+
+
+def get_run(run_id: int):
+    with _connect() as conn:
+        row = conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+    return dict(row) if row else None
+
+
+def _read_inbox(path) -> list:
+    """Test names in an inbox file. A writer that still had the file open may finish
+    writing after it was moved, so a partial file is re-read a few times."""
+    for attempt in range(5):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            if not text.strip():
+                return []
+            names = json.loads(text).get('queue', [])
+            return names if isinstance(names, list) else []
+        except ValueError:
+            time.sleep(0.2)
+        except (OSError, AttributeError):
+            return []
+    raise ValueError(f"{path.name} is not valid JSON")
+
+
+def import_queue_file(source: str = 'file') -> list:
+    """Move test names written to .test_queue.json into the queue.
+
+    The inbox is first renamed to a file only this call uses, so names
+    appended by a writer meanwhile land in a new inbox and are imported next
+    time: every name is imported exactly once, even with several processes
+    importing. An inbox left behind by an importer that died is imported too.
+    Returns the names that were newly enqueued.
+    """
+    claimed = QUEUE_FILE.with_name(f"{QUEUE_FILE.name}.{os.getpid()}.{threading.get_ident()}.importing")
+    try:
+        os.replace(QUEUE_FILE, claimed)
+        inboxes = [claimed]
+    except OSError:
+        inboxes = []  # No inbox, or a writer has it open (Windows): next time
+    try:
+        inboxes += [path for path in QUEUE_FILE.parent.glob(f"{QUEUE_FILE.name}.*.importing")
+                    if path != claimed and _now() - path.stat().st_mtime > 60]
+    except OSError:
+        pass
+    added = []
+    for inbox in inboxes:
+        try:
+            names = _read_inbox(inbox)
+        except ValueError as e:
+            # Keep it for a look instead of dropping the names
+            print(f"Warning: Could not import {inbox.name}: {e}", file=sys.stderr)
+            try:
+                os.replace(inbox, inbox.with_suffix('.invalid'))
+            except OSError:
+                pass
+            continue
+        for name in names:
+            if isinstance(name, str) and name.strip():
+                _, created = enqueue(name, source=source)
+                if created:
+                    added.append(name)
+        try:
+            inbox.unlink()
+        except OSError as e:
+            print(f"Warning: Could not remove {inbox.name}: {e}", file=sys.stderr)
+    return added
+
+
+class LeaseHeartbeat:
+    """Keep claimed runs' leases alive from a background thread while they execute.
+
+    If a lease is lost (it expired, so the run may already be queued or running
+    elsewhere), on_lost() is called from the heartbeat thread to stop the
+    execution, and the runs' outcome must not be recorded.
+    """
+
+    def __init__(self, run_ids, worker: str, lease_seconds: float = LEASE_SECONDS, on_lost=None):
+        self.run_ids = [run_ids] if isinstance(run_ids, int) else list(run_ids)
+        self.worker = worker
+        self.lease_seconds = lease_seconds
+        self.on_lost = on_lost
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._beat, name=f'lease-{self.run_ids[0]}', daemon=True)
+
+    def _beat(self):
+        interval = max(1.0, self.lease_seconds / 3)
+        while not self._stop.wait(interval):
+            try:
+                if not heartbeat(self.run_ids, self.worker, self.lease_seconds):
+                    self.lost = True
+                    print(f"Warning: Lost lease on run(s) {self.run_ids} - stopping them", file=sys.stderr)
+                    if self.on_lost:
+                        try:
+                            self.on_lost()
+                        except Exception as e:
+                            print(f"Warning: Could not stop run(s) {self.run_ids}: {e}", file=sys.stderr)
+                    return
+            except sqlite3.Error as e:
+                print(f"Warning: Heartbeat for run(s) {self.run_ids} failed: {e}", file=sys.stderr)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join(timeout=5)
+        return False
+
+
+def _report_lost(runs: list):
+    # The runs belong to the queue again; whatever this worker saw is not their result
+    print(f"Warning: Not recording results for run(s) {[run['id'] for run in runs]}: "
+          f"the lease was lost while they ran", file=sys.stderr)
+
+
+def execute(run: dict, worker: str, run_fn, on_lost=None) -> bool:
+    """Run a claimed run via run_fn(test_name) -> bool under a lease, then record the outcome.
+
+    on_lost() is called if the lease is lost while run_fn is running (see
+    LeaseHeartbeat); the outcome is then not recorded and False is returned.
+    """
+    lease = LeaseHeartbeat(run['id'], worker, on_lost=on_lost)
+    try:
+        with lease:
+            passed = bool(run_fn(run['test_name']))
+    except Exception as e:
+        if not lease.lost:
+            complete(run['id'], worker, 'failed', error=str(e))
+        raise
+    if lease.lost:
+        _report_lost([run])
+        return False
+    complete(run['id'], worker, 'passed' if passed else 'failed')
+    return passed
+
+
+def execute_batch(runs: list, worker: str, run_fn, on_lost=None) -> dict:
+    """Run claimed runs in one go via run_fn(test_names) -> {test_name: outcome}.
+
+    An outcome is 'passed', 'failed' or 'skipped' (or a bool); tests missing
+    from the result are recorded as failed. Returns {test_name: status}.
+    If the lease is lost meanwhile, on_lost() is called, nothing is recorded
+    and every status is 'lost'.
+    """
+    names = [run['test_name'] for run in runs]
+    lease = LeaseHeartbeat([run['id'] for run in runs], worker, on_lost=on_lost)
+    try:
+        with lease:
+            outcomes = run_fn(names) or {}
+    except Exception as e:
+        if not lease.lost:
+            for run in runs:
+                complete(run['id'], worker, 'failed', error=str(e))
+        raise
+    if lease.lost:
+        _report_lost(runs)
+        return {name: 'lost' for name in names}
+    statuses = {}
+    for run in runs:
+        outcome = outcomes.get(run['test_name'])
+        if isinstance(outcome, bool):
+            outcome = 'passed' if outcome else 'failed'
+        error = None if outcome else 'no result reported'
+        statuses[run['test_name']] = outcome or 'failed'
+        complete(run['id'], worker, statuses[run['test_name']], error=error)
+    return statuses
+
+
+def main(argv):
+    command = argv[1] if len(argv) > 1 else 'list'
+    if command == 'add' and len(argv) > 2:
+        run_id, created = enqueue(argv[2], source='cli')
+        print(f"Added test '{argv[2]}' to queue (run {run_id})" if created
+              else f"Test '{argv[2]}' is already queued or running (run {run_id})")
+    elif command == 'clear':
+        print(f"Removed {clear()} queued run(s)")
+    elif command == 'recent':
+        for run in recent_runs():
+            finished = datetime.fromtimestamp(run['finished_at']).strftime('%Y-%m-%d %H:%M:%S')
+            print(f"{run['id']:>6}  {run['status']:<8} {run['test_name']}  (finished {finished})")
+    elif command == 'list':
+        runs = active_runs()
+        if not runs:
+            print("Queue is empty")
+        for run in runs:
+            since = datetime.fromtimestamp(run['started_at'] or run['enqueued_at']).strftime('%Y-%m-%d %H:%M:%S')
+            print(f"{run['id']:>6}  {run['status']:<8} {run['test_name']}  (since {since}, worker {run['worker'] or '-'})")
+    else:
+        print(__doc__)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
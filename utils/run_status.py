@@ -0,0 +1,369 @@
+"""
+Run Status - In-memory status snapshot for the always-on server's /status endpoint.
+
+Dashboards poll /status every few seconds per open tab. Instead of reading the
+queue database or checking processes on every request, one background monitor
+keeps the pytest child processes it was handed (their Popen handles) and a
+ready-to-send JSON snapshot; /status just returns the snapshot bytes.
+
+The snapshot is rebuilt when something changes (poke(): a test was queued,
+claimed or finished, a child exited, run_queue reported a change), every
+MONITOR_INTERVAL seconds while a child is running, and every
+MONITOR_IDLE_INTERVAL seconds otherwise (expired leases). No processes are
+spawned: child liveness comes from Popen.poll(), other PIDs from pid_alive().
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.resolve()))
+from utils import run_estimates, run_queue, test_resources
+
+MONITOR_INTERVAL = float(os.getenv('STATUS_MONITOR_INTERVAL', '1'))
+MONITOR_IDLE_INTERVAL = float(os.getenv('STATUS_MONITOR_IDLE_INTERVAL', '30'))
+
+
+def pid_alive(pid) -> bool:
+    """True if a process with this PID exists, without spawning tasklist/ps."""
+    try:
+        pid = int(pid)
+    except (TypeError, ValueError):
+        return False
+    if pid <= 0:
+        return False
+    if sys.platform == 'win32':
+        # os.kill(pid, 0) would terminate the process on Windows
+        import ctypes
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        STILL_ACTIVE = 259
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            return False
+        try:
+            exit_code = ctypes.c_ulong()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return False
+            return exit_code.value == STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, owned by another user
+    except OSError:
+        return False
+    return True
+
+
+def wait_for_exit(pid, timeout) -> bool:
+    """Block until the process exits or timeout passes. Returns True if it has exited.
+
+    Uses a process handle (Windows) or pidfd (Linux) so the wait costs nothing;
+    elsewhere falls back to checking pid_alive() once a second.
+    """
+    if sys.platform == 'win32':
+        import ctypes
+        SYNCHRONIZE = 0x00100000
+        WAIT_TIMEOUT = 0x102
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(SYNCHRONIZE, False, int(pid))
+        if not handle:
+            return True
+        try:
+            return kernel32.WaitForSingleObject(handle, int(timeout * 1000)) != WAIT_TIMEOUT
+        finally:
+            kernel32.CloseHandle(handle)
+    if hasattr(os, 'pidfd_open'):
+        import select
+        try:
+            fd = os.pidfd_open(int(pid))
+        except ProcessLookupError:
+            return True
+        except OSError:
+            fd = None  # e.g. kernel without pidfd support
+        if fd is not None:
+            try:
+                readable, _, _ = select.select([fd], [], [], timeout)
+                return bool(readable)
+            finally:
+                os.close(fd)
+    deadline = time.time() + timeout
+    while pid_alive(pid):
+        if time.time() >= deadline:
+            return False
+        time.sleep(min(1.0, max(0.0, deadline - time.time())))
+    return True
+
+
+def _process_table():
+    """{pid: (ppid, pgid, zombie)} of all processes (POSIX), from /proc or ps."""
+    table = {}
+    proc = Path('/proc')
+    if proc.is_dir():
+        for entry in proc.iterdir():
+            if not entry.name.isdigit():
+                continue
+            try:
+                stat = (entry / 'stat').read_text()
+            except OSError:
+                continue
+            # The command name may contain spaces and parentheses: fields start after the last ')'
+            fields = stat[stat.rfind(')') + 2:].split()
+            try:
+                table[int(entry.name)] = (int(fields[1]), int(fields[2]), fields[0] == 'Z')
+            except (IndexError, ValueError):
+                continue
+        return table
+    import subprocess
+    try:
+        ps = subprocess.run(['ps', '-A', '-o', 'pid=,ppid=,pgid=,stat='],
+                            capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return table
+    for line in ps.stdout.splitlines():
+        parts = line.split()
+        if len(parts) >= 4 and parts[0].isdigit():
+            table[int(parts[0])] = (int(parts[1]), int(parts[2]), parts[3].startswith('Z'))
+    return table
+
+
+def _process_tree(pid, table):
+    """pid's descendants, plus the members of the process group it leads (they outlive it)."""
+    own_group = os.getpgrp()
+    tree = {p for p, (_, pgid, _) in table.items() if pgid == pid and pgid != own_group}
+    stack = [pid] + list(tree)
+    while stack:
+        parent = stack.pop()
+        for p, (ppid, _, _) in table.items():
+            if ppid == parent and p not in tree:
+                tree.add(p)
+                stack.append(p)
+    tree.discard(pid)
+    tree.discard(os.getpid())
+    return tree
+
+
+def kill_process_tree(pid, timeout=10.0) -> bool:
+    """Forcefully stop a process and everything it started (pytest children, browsers).
+
+    A pytest session left behind by a killed server would keep driving its
+    browser and account while the runs are claimed again. Works after `pid`
+    itself has died too, for children still in the process group it led
+    (POSIX). Returns True once all of them have exited (pid itself may remain
+    a zombie until its parent waits for it).
+    """
+    try:
+        pid = int(pid)
+    except (TypeError, ValueError):
+        return False
+    if pid <= 0 or pid == os.getpid():
+        return False
+    if sys.platform == 'win32':
+        import subprocess
+        try:
+            subprocess.run(['taskkill', '/T', '/F', '/PID', str(pid)], capture_output=True, timeout=30)
+        except (OSError, subprocess.SubprocessError):
+            pass
+        return wait_for_exit(pid, timeout)
+    import signal
+    tree = _process_tree(pid, _process_table())
+    for target in [pid] + sorted(tree):
+        try:
+            os.kill(target, signal.SIGKILL)
+        except OSError:
+            pass
+    deadline = time.time() + timeout
+    while True:
+        table = _process_table()
+        # Children started between the scan and the kill are caught by the next pass
+        remaining = {p for p in tree | _process_tree(pid, table) if p in table and not table[p][2]}
+        if not remaining:
+            return True
+        if time.time() >= deadline:
+            return False
+        for target in remaining:
+            try:
+                os.kill(target, signal.SIGKILL)
+            except OSError:
+                pass
+        time.sleep(0.05)
+
+
+_kill_job = None
+
+
+def kill_with_this_process(process):
+    """Windows: end a child process (and what it starts) when this process exits, however it exits.
+
+    The child is put in a job object with KILL_ON_JOB_CLOSE; the job handle is
+    only closed when this process ends. On POSIX children stay in this
+    process's group, which kill_process_tree() on this process stops.
+    """
+    global _kill_job
+    if sys.platform != 'win32':
+        return
+    import ctypes
+    from ctypes import wintypes
+    kernel32 = ctypes.windll.kernel32
+    kernel32.CreateJobObjectW.restype = wintypes.HANDLE
+    kernel32.SetInformationJobObject.argtypes = [wintypes.HANDLE, ctypes.c_int, ctypes.c_void_p, wintypes.DWORD]
+    kernel32.AssignProcessToJobObject.argtypes = [wintypes.HANDLE, wintypes.HANDLE]
+    if _kill_job is None:
+        class IO_COUNTERS(ctypes.Structure):
+            _fields_ = [(name, ctypes.c_ulonglong) for name in (
+                'ReadOperationCount', 'WriteOperationCount', 'OtherOperationCount',
+                'ReadTransferCount', 'WriteTransferCount', 'OtherTransferCount')]
+
+        class JOBOBJECT_BASIC_LIMIT_INFORMATION(ctypes.Structure):
+            _fields_ = [
+                ('PerProcessUserTimeLimit', ctypes.c_int64),
+                ('PerJobUserTimeLimit', ctypes.c_int64),
+                ('LimitFlags', wintypes.DWORD),
+                ('MinimumWorkingSetSize', ctypes.c_size_t),
+                ('MaximumWorkingSetSize', ctypes.c_size_t),
+                ('ActiveProcessLimit', wintypes.DWORD),
+                ('Affinity', ctypes.c_size_t),
+                ('PriorityClass', wintypes.DWORD),
+                ('SchedulingClass', wintypes.DWORD),
+            ]
+
+        class JOBOBJECT_EXTENDED_LIMIT_INFORMATION(ctypes.Structure):
+            _fields_ = [
+                ('BasicLimitInformation', JOBOBJECT_BASIC_LIMIT_INFORMATION),
+                ('IoInfo', IO_COUNTERS),
+                ('ProcessMemoryLimit', ctypes.c_size_t),
+                ('JobMemoryLimit', ctypes.c_size_t),
+                ('PeakProcessMemoryUsed', ctypes.c_size_t),
+                ('PeakJobMemoryUsed', ctypes.c_size_t),
+            ]
+
+        JobObjectExtendedLimitInformation = 9
+        JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE = 0x2000
+        job = kernel32.CreateJobObjectW(None, None)
+        if not job:
+            return
+        info = JOBOBJECT_EXTENDED_LIMIT_INFORMATION()
+        info.BasicLimitInformation.LimitFlags = JOB_OBJECT_LIMIT_KILL_ON_JOB_CLOSE
+        if not kernel32.SetInformationJobObject(job, JobObjectExtendedLimitInformation,
+                                                ctypes.byref(info), ctypes.sizeof(info)):
+            kernel32.CloseHandle(job)
+            return
+        _kill_job = job
+    if not kernel32.AssignProcessToJobObject(_kill_job, int(process._handle)):
+        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Warning: could not tie process {process.pid} to this one's lifetime", file=sys.stderr)
+
+
+class StatusMonitor:
+    """Tracks pytest child processes and keeps the /status response in memory."""
+
+    def __init__(self, lanes=1, recent_limit=10):
+        self.lanes = lanes
+        self.recent_limit = recent_limit
+        self._children = {}  # lane -> {'process', 'tests', 'started'}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._snapshot = None
+        self._thread = None
+
+    def track(self, lane, process, test_names):
+        """Register a pytest child process started for a lane."""
+        with self._lock:
+            self._children[lane] = {'process': process, 'tests': list(test_names), 'started': time.time()}
+        self.poke()
+
+    def untrack(self, lane):
+        with self._lock:
+            self._children.pop(lane, None)
+        self.poke()
+
+    def poke(self):
+        """Rebuild the snapshot soon (the queue or a child process changed)."""
+        self._wake.set()
+
+    def snapshot(self) -> bytes:
+        """The current /status response body. Built here only if the monitor isn't running yet."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.refresh()
+        return snapshot
+
+    def _processes(self):
+        with self._lock:
+            children = dict(self._children)
+        processes = []
+        for lane, child in sorted(children.items()):
+            process = child['process']
+            exit_code = process.poll()
+            processes.append({
+                'lane': lane,
+                'pid': process.pid,
+                'alive': exit_code is None,
+                'exit_code': exit_code,
+                'tests': child['tests'],
+                'elapsed': round(time.time() - child['started'], 1),
+            })
+        return processes
+
+    def _eta(self, runs):
+        try:
+            return run_estimates.queue_eta(runs, self.lanes, test_resources.resources_for)
+        except Exception as e:
+            # Estimates are a nice-to-have; /status must keep working without them
+            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Error estimating queue ETA: {e}", file=sys.stderr)
+            return {'tests': {}, 'estimated_completion': None}
+
+    def refresh(self) -> bytes:
+        """Rebuild the snapshot from the queue database and the tracked children."""
+        runs = run_queue.active_runs()
+        running = [run['test_name'] for run in runs if run['status'] == 'running']
+        queued = [run['test_name'] for run in runs if run['status'] == 'queued']
+        snapshot = json.dumps({
+            # A queued test counts as busy too, so the dashboard knows it is being
+            # processed before it actually starts (avoids "Test Not Started")
+            'busy': bool(runs),
+            'queue_size': len(queued),
+            'running': running,
+            'queue': queued,
+            # Run IDs for /runs/<id>/tail (live output)
+            'run_ids': {run['test_name']: run['id'] for run in runs},
+            'lanes': self.lanes,
+            'order': run_estimates.QUEUE_ORDER,
+            # Per-test estimated start/finish (epoch seconds) from historical runtimes
+            'eta': self._eta(runs),
+            'processes': self._processes(),
+            'recent': [
+                {'test': run['test_name'], 'status': run['status'], 'finished_at': run['finished_at']}
+                for run in run_queue.recent_runs(self.recent_limit)
+            ],
+            'updated_at': time.time(),
+            'status': 'running',
+        }).encode('utf-8')
+        self._snapshot = snapshot
+        return snapshot
+
+    def _loop(self):
+        while True:
+            with self._lock:
+                has_children = bool(self._children)
+            self._wake.wait(MONITOR_INTERVAL if has_children else MONITOR_IDLE_INTERVAL)
+            self._wake.clear()
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Error refreshing status snapshot: {e}", file=sys.stderr)
+
+    def start(self):
+        """Start the background monitor thread (once)."""
+        if self._thread is None:
+            self.refresh()
+            self._thread = threading.Thread(target=self._loop, name='status-monitor', daemon=True)
+            self._thread.start()
+        return self
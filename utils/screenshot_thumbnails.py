@@ -0,0 +1,107 @@
+"""
+Screenshot Thumbnails - Small WebP/JPEG previews for failure screenshots.
+
+Full-page failure screenshots can be several megabytes each. The dashboard shows
+these thumbnails instead and only loads the full PNG when it is opened.
+Thumbnails are written to a thumbs/ folder next to the screenshot as
+thumbs/<name>.thumb.webp (or .thumb.jpg when WebP encoding is unavailable), so
+creating one doesn't change the screenshot folder itself: the dashboard caches
+its artifact index and render inputs on that folder's mtime. Thumbnails from
+older runs, stored next to the screenshot, are still used. Requires Pillow;
+without it no thumbnails are generated and the dashboard falls back to the full
+image.
+"""
+
+import os
+import threading
+from pathlib import Path
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+THUMBNAIL_MAX_WIDTH = int(os.getenv('THUMBNAIL_MAX_WIDTH', '480'))
+# Full-page screenshots are very tall; the thumbnail keeps the top of the page only
+THUMBNAIL_MAX_HEIGHT = int(os.getenv('THUMBNAIL_MAX_HEIGHT', '720'))
+THUMBNAIL_QUALITY = int(os.getenv('THUMBNAIL_QUALITY', '70'))
+THUMBNAIL_SUFFIXES = ('.thumb.webp', '.thumb.jpg')
+THUMBNAIL_DIR_NAME = 'thumbs'
+
+
+def thumbnail_candidates(screenshot_path) -> list:
+    """Paths a new thumbnail for a screenshot is written to, in order of preference."""
+    screenshot_path = Path(screenshot_path)
+    thumb_dir = screenshot_path.parent / THUMBNAIL_DIR_NAME
+    return [thumb_dir / (screenshot_path.stem + suffix) for suffix in THUMBNAIL_SUFFIXES]
+
+
+def _legacy_candidates(screenshot_path) -> list:
+    # Where thumbnails used to be written: next to the screenshot
+    screenshot_path = Path(screenshot_path)
+    return [screenshot_path.with_name(screenshot_path.stem + suffix) for suffix in THUMBNAIL_SUFFIXES]
+
+
+def find_thumbnail(screenshot_path):
+    """Return the existing, up-to-date thumbnail for a screenshot, or None."""
+    try:
+        source_mtime = os.stat(screenshot_path).st_mtime
+    except OSError:
+        return None
+    for candidate in thumbnail_candidates(screenshot_path) + _legacy_candidates(screenshot_path):
+        try:
+            if os.stat(candidate).st_mtime >= source_mtime:
+                return candidate
+        except OSError:
+            continue
+    return None
+
+
+def create_thumbnail(screenshot_path):
+    """Create (or reuse) the thumbnail for a screenshot.
+
+    Returns the thumbnail path, or None if Pillow is not installed or the image
+    could not be read.
+    """
+    existing = find_thumbnail(screenshot_path)
+    if existing:
+        return existing
+    if Image is None:
+        return None
+
+    webp_path, jpg_path = thumbnail_candidates(screenshot_path)
+    try:
+        with Image.open(screenshot_path) as img:
+            img = img.convert('RGB')
+            width, height = img.size
+            if width > THUMBNAIL_MAX_WIDTH:
+                height = max(1, round(height * THUMBNAIL_MAX_WIDTH / width))
+                width = THUMBNAIL_MAX_WIDTH
+                # Crop before resizing so tall pages aren't scaled in full
+                crop_height = min(img.size[1], round(THUMBNAIL_MAX_HEIGHT * img.size[0] / width))
+                img = img.crop((0, 0, img.size[0], crop_height)).resize(
+                    (width, min(height, THUMBNAIL_MAX_HEIGHT)), Image.LANCZOS
+                )
+            elif height > THUMBNAIL_MAX_HEIGHT:
+                img = img.crop((0, 0, width, THUMBNAIL_MAX_HEIGHT))
+
+            webp_path.parent.mkdir(exist_ok=True)
+            # Write to a temp file first so the dashboard never picks up a half-written thumbnail
+            for target, fmt in ((webp_path, 'WEBP'), (jpg_path, 'JPEG')):
+                # Own temp file: the conftest and a dashboard build may thumbnail the same screenshot at once
+                tmp_path = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                try:
+                    img.save(tmp_path, fmt, quality=THUMBNAIL_QUALITY)
+                except (KeyError, OSError):
+                    # Encoder not available in this Pillow build, try the next format
+                    try:
+                        tmp_path.unlink()
+                    except OSError:
+                        pass
+                    continue
+                os.replace(tmp_path, target)
+                return target
+    except Exception as e:
+        print(f"Warning: Could not create thumbnail for {screenshot_path}: {e}")
+    return None
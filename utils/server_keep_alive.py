@@ -1,30 +1,82 @@
 """
-Server Keep-Alive - Monitors and automatically restarts the test server if it stops.
-This ensures the server runs 24/7.
+Server Keep-Alive - Supervises the test server (and the log history API) with a hot standby.
+This ensures the servers run 24/7 and come back within about a second of a crash or hang.
+
+For every supervised server two processes are kept:
+    primary   serves the port
+    standby   the same script started with --standby: imports done and caches
+              warm (test index, history), blocked until it is promoted
+
+Liveness is a real HTTP request to the server's probe path, which must answer
+within PROBE_BUDGET seconds; an open port alone doesn't count. A crash (the
+primary exits) is noticed immediately, a hang after PROBE_FAILURES failed
+probes in a row. Then the primary is killed together with everything it
+started (pytest sessions and their browsers), the standby is told to bind the
+port and serve, and a new standby starts warming up in the background. Without
+a ready standby it falls back to a cold start. Once the old test server's
+processes are confirmed dead, its queued runs' leases are ended so they are
+requeued right away, and nothing of it still uses their lane's lock files.
+
+Every failover is timed from the moment the failure was detected to the first
+healthy probe of the new primary, logged, and written with probe latencies to
+logs/.keep_alive_status.json (print it with --status).
 
 Usage:
-    python utils/server_keep_alive.py
-    
+    python utils/server_keep_alive.py                 # test server (port 8766)
+    python utils/server_keep_alive.py runner history  # test server and log history API (port 5001)
+    python utils/server_keep_alive.py --status
+
 Or add to Windows startup for automatic monitoring.
 """
 
+import json
+import os
+import socket
 import subprocess
 import sys
-import os
+import threading
 import time
-import socket
-from pathlib import Path
+import urllib.error
+import urllib.request
+from collections import deque
 from datetime import datetime
+from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent.resolve()
-SERVER_SCRIPT = PROJECT_ROOT / 'utils' / 'always_on_server.py'
-SERVER_PID_FILE = PROJECT_ROOT / '.always_on_server.pid'
-SERVER_PORT = 8766
-CHECK_INTERVAL = 30  # Check every 30 seconds
-MAX_RESTART_ATTEMPTS = 5  # Max restarts per hour
+sys.path.insert(0, str(PROJECT_ROOT))
+from utils import run_queue
+from utils.run_status import kill_process_tree, pid_alive
+
+STATUS_FILE = PROJECT_ROOT / 'logs' / '.keep_alive_status.json'
+SERVICES = {
+    'runner': {
+        'script': PROJECT_ROOT / 'utils' / 'always_on_server.py',
+        'port': 8766,
+        'probe': '/status',
+        'pid_file': PROJECT_ROOT / '.always_on_server.pid',
+        'queue_worker': True,  # Claims runs from utils/run_queue.py
+    },
+    'history': {
+        'script': PROJECT_ROOT / 'utils' / 'log_history_api.py',
+        'port': 5001,
+        'probe': '/api/health',
+        'pid_file': None,
+    },
+}
+PROBE_INTERVAL = float(os.getenv('KEEP_ALIVE_PROBE_INTERVAL', '0.5'))
+PROBE_BUDGET = float(os.getenv('KEEP_ALIVE_PROBE_BUDGET', '1.0'))  # Max seconds for a healthy answer
+PROBE_FAILURES = int(os.getenv('KEEP_ALIVE_PROBE_FAILURES', '3'))  # Failed probes in a row = hung
+WARMUP_TIMEOUT = float(os.getenv('KEEP_ALIVE_WARMUP_TIMEOUT', '300'))  # Max wait for a standby to get ready
+PROMOTE_TIMEOUT = 15  # Max wait for a promoted standby to answer its probe
+RETRY_DELAY = 5  # Wait after a failed restart before trying again
+MAX_RESTART_ATTEMPTS = 10  # Max process starts per server per hour
 RESTART_WINDOW = 3600  # 1 hour window
 
-restart_times = []  # Track restart times to prevent infinite restart loops
+# Standby protocol (stdin/stdout of the standby process)
+READY_MARKER = 'KEEP-ALIVE STANDBY READY'
+PROMOTE_COMMAND = 'promote'
+
+_status_lock = threading.Lock()
 
 
 def log_message(msg):
@@ -50,203 +102,372 @@ def is_port_in_use(port):
         return False
 
 
-def is_server_running():
-    """Check if server is running by checking port and PID file."""
-    # Check port first (most reliable)
-    if is_port_in_use(SERVER_PORT):
-        return True
-    
-    # Check PID file
-    if SERVER_PID_FILE.exists():
+def probe(port, path, budget=PROBE_BUDGET):
+    """GET http://127.0.0.1:port/path. Returns (healthy, latency_seconds, error)."""
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(f'http://127.0.0.1:{port}{path}', timeout=budget) as response:
+            response.read()
+            healthy = 200 <= response.status < 300
+            error = None if healthy else f'HTTP {response.status}'
+    except urllib.error.HTTPError as e:
+        healthy, error = False, f'HTTP {e.code}'
+    except (OSError, ValueError) as e:
+        healthy, error = False, str(getattr(e, 'reason', e))
+    latency = time.perf_counter() - started
+    if healthy and latency > budget:
+        healthy, error = False, f'answered in {latency:.2f}s (budget {budget}s)'
+    return healthy, latency, error
+
+
+def wait_for_promotion():
+    """Standby side: report ready, then block until the keep-alive monitor promotes us.
+
+    Called by a server started with --standby once it has warmed up. Exits the
+    process if the monitor goes away first (stdin closed), so standbys never
+    outlive it. Once promoted, output goes to the null device: the server keeps
+    running if the monitor stops, and must not fail writing to a closed pipe.
+    """
+    print(READY_MARKER, flush=True)
+    for line in sys.stdin:
+        if line.strip() == PROMOTE_COMMAND:
+            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Promoted from standby - starting to serve", flush=True)
+            sys.stdout.flush()
+            sys.stderr.flush()
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, 1)
+            os.dup2(devnull, 2)
+            os.close(devnull)
+            return
+    sys.exit(0)
+
+
+def kill_pid(pid):
+    """Forcefully stop a process we only know by PID, with everything it started."""
+    try:
+        return kill_process_tree(pid)
+    except Exception as e:
+        log_message(f"Could not stop process {pid}: {e}")
+        return False
+
+
+def write_status(name, status):
+    """Merge one server's status into STATUS_FILE."""
+    with _status_lock:
         try:
-            pid = int(SERVER_PID_FILE.read_text().strip())
-            if sys.platform == 'win32':
-                result = subprocess.run(
-                    ['tasklist', '/FI', f'PID eq {pid}'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if str(pid) in result.stdout and 'python' in result.stdout.lower():
-                    return True
-            else:
-                try:
-                    os.kill(pid, 0)  # Signal 0 just checks if process exists
-                    return True
-                except OSError:
-                    pass
-        except Exception:
-            pass
-    
-    return False
-
-
-def cleanup_stale_pid():
-    """Remove stale PID file if process is not running."""
-    if SERVER_PID_FILE.exists():
+            data = json.loads(STATUS_FILE.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            data = {}
+        data[name] = status
         try:
-            pid = int(SERVER_PID_FILE.read_text().strip())
-            if sys.platform == 'win32':
-                result = subprocess.run(
-                    ['tasklist', '/FI', f'PID eq {pid}'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if str(pid) not in result.stdout:
-                    log_message(f"Removing stale PID file (process {pid} not running)")
-                    SERVER_PID_FILE.unlink()
-                    return True
-            else:
-                try:
-                    os.kill(pid, 0)
-                except OSError:
-                    log_message(f"Removing stale PID file (process {pid} not running)")
-                    SERVER_PID_FILE.unlink()
-                    return True
-        except Exception as e:
-            log_message(f"Error checking PID file: {e}")
-            try:
-                SERVER_PID_FILE.unlink()
-                return True
-            except:
-                pass
-    return False
-
-
-def can_restart():
-    """Check if we can restart (prevent infinite restart loops)."""
-    global restart_times
-    
-    # Remove old restart times (outside the window)
-    current_time = time.time()
-    restart_times = [t for t in restart_times if current_time - t < RESTART_WINDOW]
-    
-    # Check if we've exceeded max restarts
-    if len(restart_times) >= MAX_RESTART_ATTEMPTS:
-        log_message(f"WARNING: Too many restarts ({len(restart_times)}) in the last hour. Waiting before next restart attempt.")
-        return False
-    
-    return True
+            STATUS_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp = STATUS_FILE.with_suffix('.tmp')
+            tmp.write_text(json.dumps(data, indent=2), encoding='utf-8')
+            os.replace(tmp, STATUS_FILE)
+        except OSError as e:
+            log_message(f"Could not write {STATUS_FILE.name}: {e}")
 
 
-def start_server():
-    """Start the server in background."""
-    try:
-        # Clean up stale PID first
-        cleanup_stale_pid()
-        
-        # Check if already running
-        if is_server_running():
-            log_message("Server is already running")
-            return True
-        
-        log_message("Starting server...")
-        os.chdir(PROJECT_ROOT)
-        
+class _Process:
+    """A server process started with --standby, and whether it has warmed up."""
+
+    def __init__(self, popen):
+        self.popen = popen
+        self.ready = threading.Event()
+        self.last_lines = deque(maxlen=20)  # Shown if it dies before serving
+        threading.Thread(target=self._read_output, daemon=True).start()
+
+    @property
+    def pid(self):
+        return self.popen.pid
+
+    def alive(self):
+        return self.popen.poll() is None
+
+    def _read_output(self):
+        # Keep the pipe drained until promotion; the tail shows why a start failed
+        for line in self.popen.stdout:
+            line = line.rstrip()
+            if line == READY_MARKER:
+                self.ready.set()
+            elif line:
+                self.last_lines.append(line)
+
+    def promote(self):
+        self.popen.stdin.write(PROMOTE_COMMAND + '\n')
+        self.popen.stdin.flush()
+
+    def kill(self):
+        """Kill the process and what it started. Returns True once all of them have exited."""
+        if self.alive() or sys.platform != 'win32':
+            # Also after a crash: its pytest children are still in the process group it led
+            stopped = kill_pid(self.pid)
+        else:
+            # Windows reuses PIDs quickly; children of a dead server ended with it (job object)
+            stopped = True
+        try:
+            self.popen.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            log_message(f"Process {self.pid} did not exit after kill")
+            return False
+        return stopped
+
+
+class Supervisor:
+    """Keeps one server up: probes the primary and swaps in the warm standby."""
+
+    def __init__(self, name, script, port, probe, pid_file=None, queue_worker=False):
+        self.name = name
+        self.script = script
+        self.port = port
+        self.probe_path = probe
+        self.pid_file = pid_file
+        self.queue_worker = queue_worker
+        self.primary = None  # _Process, or None for a server we didn't start
+        self.standby = None
+        self.restart_times = []
+        self.failovers = []  # Recent {'at', 'reason', 'seconds', 'standby'}
+        self.last_probe_ms = None
+        self._wake = threading.Event()
+
+    def can_restart(self):
+        """Check if we can start another process (prevent infinite restart loops)."""
+        current_time = time.time()
+        self.restart_times = [t for t in self.restart_times if current_time - t < RESTART_WINDOW]
+        if len(self.restart_times) >= MAX_RESTART_ATTEMPTS:
+            return False
+        self.restart_times.append(current_time)
+        return True
+
+    def spawn(self):
+        """Start the server script in standby mode."""
+        kwargs = {}
         if sys.platform == 'win32':
-            # Use pythonw for background execution (no console window)
-            # Or use python with CREATE_NO_WINDOW for silent background
-            CREATE_NO_WINDOW = 0x08000000
-            DETACHED_PROCESS = 0x00000008
-            
-            process = subprocess.Popen(
-                [sys.executable, str(SERVER_SCRIPT)],
-                cwd=PROJECT_ROOT,
-                creationflags=CREATE_NO_WINDOW | DETACHED_PROCESS,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
+            kwargs['creationflags'] = 0x08000000  # CREATE_NO_WINDOW
         else:
-            # Unix-like systems
-            process = subprocess.Popen(
-                [sys.executable, str(SERVER_SCRIPT)],
-                cwd=PROJECT_ROOT,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                start_new_session=True
-            )
-        
-        # Wait a bit for server to start
-        time.sleep(3)
-        
-        # Verify it started
-        if is_server_running():
-            log_message("✅ Server started successfully!")
-            restart_times.append(time.time())
-            return True
+            kwargs['start_new_session'] = True
+        env = os.environ.copy()
+        env['PYTHONUNBUFFERED'] = '1'
+        popen = subprocess.Popen(
+            [sys.executable, str(self.script), '--standby'],
+            cwd=PROJECT_ROOT,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            **kwargs
+        )
+        return _Process(popen)
+
+    def start_standby(self):
+        if not self.can_restart():
+            log_message(f"WARNING: [{self.name}] Too many process starts in the last hour - no standby for now")
+            return
+        self.standby = self.spawn()
+        log_message(f"[{self.name}] Standby warming up (PID {self.standby.pid})")
+        standby = self.standby
+
+        def announce():
+            if standby.ready.wait(WARMUP_TIMEOUT) and standby.alive():
+                log_message(f"[{self.name}] Standby ready (PID {standby.pid})")
+                self.write_status()
+        threading.Thread(target=announce, daemon=True).start()
+
+    def watch_exit(self, process):
+        """Wake the monitor loop as soon as the primary exits."""
+        def wait():
+            process.popen.wait()
+            self._wake.set()
+        threading.Thread(target=wait, daemon=True).start()
+
+    def stop_primary(self):
+        """Kill the primary and everything it started. Returns True once the port is free."""
+        stopped = False
+        if self.primary is not None:
+            pid = self.primary.pid
+            stopped = self.primary.kill()
         else:
-            log_message("❌ Server failed to start (port not responding)")
+            # Started outside the keep-alive monitor: stop it by its PID file if it has one
+            try:
+                pid = int(self.pid_file.read_text().strip()) if self.pid_file else None
+            except (OSError, ValueError):
+                pid = None
+            if pid and pid != os.getpid() and pid_alive(pid):
+                stopped = kill_pid(pid)
+            else:
+                pid = None
+        if pid and self.queue_worker:
+            self.release_runs(pid, stopped)
+        deadline = time.time() + 5
+        while is_port_in_use(self.port) and time.time() < deadline:
+            time.sleep(0.05)
+        return not is_port_in_use(self.port)
+
+    def release_runs(self, pid, stopped):
+        """Requeue the runs a stopped test server had claimed, once nothing of it is running them."""
+        if not stopped:
+            log_message(f"WARNING: [{self.name}] Processes started by PID {pid} may still be running - "
+                        f"its runs are requeued only when their leases expire")
+            return
+        try:
+            released = run_queue.expire_worker_leases(pid)
+        except Exception as e:
+            log_message(f"[{self.name}] Could not release the runs of PID {pid}: {e}")
+            return
+        if released:
+            log_message(f"[{self.name}] Requeued {released} run(s) of the stopped server (PID {pid})")
+
+    def failover(self, reason):
+        """Replace the primary with the standby (or a cold start). Returns True if serving again."""
+        detected = time.perf_counter()
+        log_message(f"⚠️ [{self.name}] {reason}")
+        if not self.stop_primary():
+            log_message(f"❌ [{self.name}] Port {self.port} is still held by a process this monitor didn't start - can't replace it")
             return False
-            
-    except Exception as e:
-        log_message(f"❌ Error starting server: {e}")
-        import traceback
-        log_message(traceback.format_exc())
-        return False
+        process, from_standby = self.standby, True
+        self.standby = None
+        if process is None or not process.alive() or not process.ready.is_set():
+            if process is not None:
+                process.kill()
+            if not self.can_restart():
+                log_message(f"WARNING: [{self.name}] Too many restarts in the last hour. Waiting before next restart attempt.")
+                return False
+            log_message(f"[{self.name}] No warm standby - cold start")
+            process, from_standby = self.spawn(), False
+            if not process.ready.wait(WARMUP_TIMEOUT) or not process.alive():
+                log_message(f"❌ [{self.name}] Server failed to start")
+                process.kill()
+                return False
+        process.promote()
+        deadline = time.time() + PROMOTE_TIMEOUT
+        healthy = False
+        while process.alive() and time.time() < deadline:
+            healthy, latency, _ = probe(self.port, self.probe_path)
+            if healthy:
+                break
+            time.sleep(0.02)
+        if not healthy:
+            log_message(f"❌ [{self.name}] Promoted process {process.pid} is not answering {self.probe_path}")
+            if not process.alive() and process.last_lines:
+                log_message(f"[{self.name}] Last output:\n    " + '\n    '.join(process.last_lines))
+            process.kill()
+            return False
+        seconds = time.perf_counter() - detected
+        self.primary = process
+        self.watch_exit(process)
+        self.failovers = (self.failovers + [{
+            'at': datetime.now().isoformat(timespec='seconds'),
+            'reason': reason,
+            'seconds': round(seconds, 3),
+            'standby': from_standby,
+        }])[-20:]
+        log_message(f"✅ [{self.name}] Serving again on port {self.port} after {seconds:.2f}s "
+                    f"({'warm standby' if from_standby else 'cold start'}, PID {process.pid})")
+        self.start_standby()
+        self.write_status()
+        return True
+
+    def write_status(self):
+        write_status(self.name, {
+            'port': self.port,
+            'primary_pid': self.primary.pid if self.primary else None,
+            'standby_pid': self.standby.pid if self.standby else None,
+            'standby_ready': bool(self.standby and self.standby.ready.is_set() and self.standby.alive()),
+            'last_probe_ms': self.last_probe_ms,
+            'probe_budget_ms': round(PROBE_BUDGET * 1000),
+            'failovers': self.failovers,
+            'updated_at': datetime.now().isoformat(timespec='seconds'),
+        })
+
+    def run(self):
+        """Monitor loop for this server (runs forever)."""
+        healthy, latency, _ = probe(self.port, self.probe_path)
+        if healthy:
+            log_message(f"[{self.name}] Already running on port {self.port} - monitoring it")
+            self.start_standby()
+        elif not self.failover('Server not running, starting it now...'):
+            self.start_standby()
+        self.write_status()
+        failures = 0
+        while True:
+            self._wake.wait(PROBE_INTERVAL)
+            self._wake.clear()
+            try:
+                if self.primary is not None and not self.primary.alive():
+                    failures = 0
+                    if not self.failover(f"Server process exited (code {self.primary.popen.returncode})"):
+                        time.sleep(RETRY_DELAY)
+                    continue
+                healthy, latency, error = probe(self.port, self.probe_path)
+                self.last_probe_ms = round(latency * 1000, 1)
+                if healthy:
+                    failures = 0
+                else:
+                    failures += 1
+                    # Nothing listening is not a slow moment: no need to wait for more probes
+                    if failures >= PROBE_FAILURES or not is_port_in_use(self.port):
+                        reason = f"Server not healthy: {self.probe_path} failed {failures}x ({error})"
+                        failures = 0
+                        if not self.failover(reason):
+                            time.sleep(RETRY_DELAY)
+                        continue
+                if self.standby is None or not self.standby.alive():
+                    if self.standby is not None:
+                        log_message(f"⚠️ [{self.name}] Standby exited (code {self.standby.popen.returncode})")
+                    self.start_standby()
+            except Exception as e:
+                log_message(f"Error in monitor loop: {e}")
+                import traceback
+                log_message(traceback.format_exc())
+                time.sleep(PROBE_INTERVAL)
 
 
-def monitor_loop():
-    """Main monitoring loop."""
+def monitor_loop(names=('runner',)):
+    """Main monitoring loop: one supervisor thread per server."""
     log_message("=" * 60)
     log_message("Server Keep-Alive Monitor Started")
     log_message("=" * 60)
-    log_message(f"Monitoring server on port {SERVER_PORT}")
-    log_message(f"Check interval: {CHECK_INTERVAL} seconds")
-    log_message(f"Max restarts per hour: {MAX_RESTART_ATTEMPTS}")
+    for name in names:
+        service = SERVICES[name]
+        log_message(f"Monitoring {name} on port {service['port']} (probe {service['probe']})")
+    log_message(f"Probe: every {PROBE_INTERVAL}s, budget {PROBE_BUDGET}s, hung after {PROBE_FAILURES} failures")
+    log_message(f"Max process starts per hour: {MAX_RESTART_ATTEMPTS}")
     log_message("=" * 60)
-    
-    consecutive_failures = 0
-    last_status = None
-    
-    while True:
-        try:
-            is_running = is_server_running()
-            
-            if is_running:
-                if last_status != 'running':
-                    log_message("✅ Server is running")
-                    consecutive_failures = 0
-                last_status = 'running'
-            else:
-                consecutive_failures += 1
-                if last_status != 'stopped':
-                    log_message(f"⚠️ Server is not running (failure count: {consecutive_failures})")
-                last_status = 'stopped'
-                
-                # Wait a bit before restarting (in case it's just starting up)
-                if consecutive_failures >= 2:  # Wait 2 checks (60 seconds) before restarting
-                    if can_restart():
-                        log_message("Attempting to restart server...")
-                        if start_server():
-                            consecutive_failures = 0
-                            last_status = 'running'
-                        else:
-                            log_message("Restart failed, will retry later")
-                    else:
-                        log_message("Restart limit reached, waiting before next attempt")
-            
-            time.sleep(CHECK_INTERVAL)
-            
-        except KeyboardInterrupt:
-            log_message("Monitor stopped by user")
-            break
-        except Exception as e:
-            log_message(f"Error in monitor loop: {e}")
-            import traceback
-            log_message(traceback.format_exc())
-            time.sleep(CHECK_INTERVAL)
+
+    supervisors = [Supervisor(name, **SERVICES[name]) for name in names]
+    threads = [threading.Thread(target=s.run, name=f'keep-alive-{s.name}', daemon=True) for s in supervisors]
+    for thread in threads:
+        thread.start()
+    try:
+        while any(thread.is_alive() for thread in threads):
+            time.sleep(1)
+    finally:
+        # Standbys exit on their own once stdin closes; don't leave them warming up
+        for supervisor in supervisors:
+            if supervisor.standby is not None:
+                supervisor.standby.kill()
 
 
 if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='Keep the test server (and log history API) running')
+    parser.add_argument('servers', nargs='*', help=f"Servers to supervise: {', '.join(SERVICES)} (default: runner)")
+    parser.add_argument('--status', action='store_true', help=f'Print {STATUS_FILE.name} and exit')
+    args = parser.parse_args()
+    unknown = [name for name in args.servers if name not in SERVICES]
+    if unknown:
+        parser.error(f"unknown server(s): {', '.join(unknown)} (choose from {', '.join(SERVICES)})")
+    if args.status:
+        try:
+            print(STATUS_FILE.read_text(encoding='utf-8'))
+        except OSError:
+            print("No keep-alive status yet")
+        sys.exit(0)
     try:
-        # Try to start server if not running
-        if not is_server_running():
-            log_message("Server not running, starting it now...")
-            start_server()
-        
-        # Start monitoring loop
-        monitor_loop()
+        monitor_loop(args.servers or ['runner'])
     except KeyboardInterrupt:
         log_message("Keep-alive monitor stopped by user")
         sys.exit(0)
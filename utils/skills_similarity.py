@@ -0,0 +1,50 @@
+"""
+Skills Similarity - How close the DB and Solr ai_skills lists of a job are.
+
+The DB/Solr sync test (tests/jobseeker/test_t1_09_db_solr_sync.py) stores an
+is_false_positive verdict on each ai_skills mismatch. The dashboards
+(log_history_api.py, unified_log_viewer.py) recompute it from the failure
+message for older reports that don't have one. Both sides use these functions on
+the same strings (the ones shown in the message), so they reach the same verdict.
+"""
+
+import re
+from typing import List
+
+# Mismatches at or above this similarity are reported as false positives
+FALSE_POSITIVE_SIMILARITY = 70.0
+DISPLAY_CHARS = 100  # Skills longer than this are truncated in failure messages
+
+
+def display(skills_str: str) -> str:
+    """The skills as shown in a failure message."""
+    skills_str = str(skills_str or '')
+    return skills_str[:DISPLAY_CHARS] + '...' if len(skills_str) > DISPLAY_CHARS else skills_str
+
+
+def normalize_skills(skills_str: str) -> List[str]:
+    """Lowercased comma-separated skills without punctuation (except - + #)."""
+    if not skills_str:
+        return []
+    cleaned = re.sub(r"[^\w\s\-\+#,]", "", str(skills_str)).lower()
+    return [s.strip() for s in cleaned.split(",") if s.strip()]
+
+
+def list_similarity(list1: List[str], list2: List[str]) -> float:
+    """Percentage (0-100) of shared skills, relative to the longer list."""
+    if not list1 and not list2:
+        return 100.0
+    if not list1 or not list2:
+        return 0.0
+    set1 = set(list1)
+    set2 = set(list2)
+    return len(set1 & set2) / max(len(set1), len(set2)) * 100.0
+
+
+def skills_similarity(db_skills: str, solr_skills: str) -> float:
+    """Similarity (0-100) between two comma-separated skill strings."""
+    return list_similarity(normalize_skills(db_skills), normalize_skills(solr_skills))
+
+
+def is_false_positive(db_skills: str, solr_skills: str) -> bool:
+    return skills_similarity(db_skills, solr_skills) >= FALSE_POSITIVE_SIMILARITY
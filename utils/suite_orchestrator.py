@@ -0,0 +1,288 @@
+"""
+Suite Orchestrator - Runs whole test suites as parallel pytest processes, in order only where they conflict.
+
+The suites test different products with different accounts, so most of them
+can run at the same time, each in its own pytest process with its own browser,
+lock files (PYTEST_LANE) and log file. SUITES declares what must not overlap:
+
+    after      suites that must have finished first (BenchSale Recruiter works
+               on the recruiters and candidates the Admin suite sets up)
+    resources  things only one suite may use at a time: shared data and accounts
+               (logging an account in elsewhere ends its other session)
+
+Each suite also holds the accounts, module logs and other resources inferred for
+its tests (see utils/test_resources.py). Ready suites start longest-chain-first, using runtime
+history (utils/run_estimates.py), so the wall time approaches the longest
+chain of conflicting suites instead of the sum of all suites.
+
+With more than one suite running, each suite's console output goes to
+reports/suites/<suite>/output.log (its JUnit, HTML and JSON reports are next to
+it). With max_parallel=1, or when the selected suites all conflict, suites run
+one at a time in the declared order with live output, as before.
+"""
+
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, str(PROJECT_ROOT))
+from utils import run_estimates, test_discovery, test_resources
+
+REPORTS_DIR = PROJECT_ROOT / 'reports' / 'suites'
+MAX_PARALLEL = int(os.getenv('SUITE_MAX_PARALLEL', '0'))  # 0 = as many as the conflict graph allows
+
+SUITES = {
+    'benchsale_admin': {
+        'name': 'BENCHSALE ADMIN TESTS',
+        'path': 'tests/benchsale/test_benchsale_admin_test_cases.py',
+        'resources': ['data:benchsale'],
+    },
+    'benchsale_recruiter': {
+        'name': 'BENCHSALE RECRUITER TESTS',
+        'path': 'tests/benchsale/test_benchsale_recruiter_test_cases.py',
+        'after': ['benchsale_admin'],
+        'resources': ['data:benchsale'],
+    },
+    'employer': {
+        'name': 'EMPLOYER TESTS',
+        'path': 'tests/employer/test_employer_test_cases.py',
+        # T2.02 and the JS dashboard checks sign in as the job seeker account
+        'resources': ['account:jobseeker'],
+    },
+    'jobseeker': {
+        'name': 'JOBSEEKER TESTS',
+        'path': 'tests/jobseeker/',  # All test files in the jobseeker directory
+        'resources': ['account:jobseeker'],
+    },
+}
+
+
+def _timestamp():
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _duration(seconds):
+    return f"{int(seconds // 60)}m {int(seconds % 60):02d}s"
+
+
+def suite_tests(key):
+    """Names of the tests a suite runs."""
+    path = (PROJECT_ROOT / SUITES[key]['path']).resolve()
+    names = []
+    for name, node_ids in test_discovery.node_index().items():
+        for node_id in node_ids:
+            test_file = (PROJECT_ROOT / node_id.split('::', 1)[0]).resolve()
+            if test_file == path or path in test_file.parents:
+                names.append(name)
+                break
+    return names
+
+
+def suite_resources(key):
+    """Declared resources plus those inferred for the suite's tests (browsers aside)."""
+    resources = set(SUITES[key].get('resources', []))
+    for name in suite_tests(key):
+        resources.update(r for r in test_resources.resources_for(name) if r != test_resources.BROWSER)
+    return resources
+
+
+def estimate_seconds(key):
+    """Expected suite runtime: the sum of its tests' historical runtimes."""
+    stats = run_estimates.history_stats()
+    return sum(run_estimates.estimate_seconds(name, stats) - run_estimates.SESSION_OVERHEAD_SECONDS
+               for name in suite_tests(key)) + run_estimates.SESSION_OVERHEAD_SECONDS
+
+
+def critical_path_seconds(keys, estimates):
+    """{suite: its estimate plus the longest chain of suites that must run after it}."""
+    chains = {}
+
+    def chain(key, seen=()):
+        if key not in chains:
+            dependents = [other for other in keys if key in SUITES[other].get('after', []) and other not in seen]
+            chains[key] = estimates[key] + max((chain(other, seen + (key,)) for other in dependents), default=0)
+        return chains[key]
+
+    for key in keys:
+        chain(key)
+    return chains
+
+
+def _ancestors(key, keys):
+    """Suites that must finish before `key` starts, directly or through other suites."""
+    found = set()
+    stack = [dep for dep in SUITES[key].get('after', []) if dep in keys]
+    while stack:
+        dep = stack.pop()
+        if dep not in found:
+            found.add(dep)
+            stack.extend(other for other in SUITES[dep].get('after', []) if other in keys)
+    return found
+
+
+def can_overlap(first, second, keys, resources):
+    """True if the two suites may run at the same time."""
+    return not (resources[first] & resources[second]
+                or first in _ancestors(second, keys) or second in _ancestors(first, keys))
+
+
+def read_junit_counts(report_file):
+    """{'tests', 'failures', 'errors', 'skipped'} summed over a JUnit XML report, or None."""
+    try:
+        root = ET.parse(report_file).getroot()
+    except (OSError, ET.ParseError):
+        return None
+    suites = [root] if root.tag == 'testsuite' else list(root.iter('testsuite'))
+    counts = {'tests': 0, 'failures': 0, 'errors': 0, 'skipped': 0}
+    for suite in suites:
+        for field in counts:
+            counts[field] += int(suite.get(field, 0) or 0)
+    return counts
+
+
+def start_suite(key, live):
+    """Start one suite's pytest process. Returns (process, report_dir, output file or None)."""
+    suite = SUITES[key]
+    report_dir = REPORTS_DIR / key
+    report_dir.mkdir(parents=True, exist_ok=True)
+    cmd = [
+        sys.executable, '-m', 'pytest',
+        suite['path'],
+        '-v',
+        '--tb=short',
+        '--maxfail=0',
+        '--continue-on-collection-errors',
+        # Per-suite reports, so parallel suites don't overwrite pytest.ini's shared ones
+        f"--junitxml={report_dir / 'junit.xml'}",
+        f"--html={report_dir / 'report.html'}",
+        f"--json-report-file={report_dir / 'report.json'}",
+        f"--log-file={report_dir / 'pytest.log'}",
+    ]
+    env = os.environ.copy()
+    # Own lock files and browser, like the always-on server's lanes
+    env['PYTEST_LANE'] = f'suite-{key}'
+    try:
+        (report_dir / 'junit.xml').unlink()
+    except OSError:
+        pass
+    if live:
+        return subprocess.Popen(cmd, cwd=PROJECT_ROOT, env=env), report_dir, None
+    output = open(report_dir / 'output.log', 'w', encoding='utf-8')
+    process = subprocess.Popen(cmd, cwd=PROJECT_ROOT, env=env, stdout=output, stderr=subprocess.STDOUT)
+    return process, report_dir, output
+
+
+def run_suites(keys=None, max_parallel=MAX_PARALLEL):
+    """Run suites as their dependencies and conflicts allow. Returns {suite: result dict} in suite order.
+
+    A suite runs even if a suite it comes after failed (the runs are continuous);
+    results have 'status' (PASSED / FAILED / NOT RUN), 'exit_code', 'seconds',
+    'counts' (from its JUnit report) and 'output'.
+    """
+    keys = list(keys or SUITES)
+    resources = {key: suite_resources(key) for key in keys}
+    # Live console output whenever only one suite can run at a time anyway
+    live = max_parallel == 1 or not any(
+        can_overlap(first, second, keys, resources)
+        for i, first in enumerate(keys) for second in keys[i + 1:]
+    )
+    estimates = {key: estimate_seconds(key) for key in keys}
+    if live:
+        pending = list(keys)
+    else:
+        chains = critical_path_seconds(keys, estimates)
+        pending = sorted(keys, key=lambda key: -chains[key])
+    running = {}  # key -> (process, report_dir, output, started)
+    results = {}
+    finished = queue.Queue()
+
+    def wait(key, process):
+        process.wait()
+        finished.put(key)
+
+    while pending or running:
+        for key in list(pending):
+            if max_parallel and len(running) >= max_parallel:
+                break
+            if any(dep in pending or dep in running for dep in SUITES[key].get('after', [])):
+                continue
+            held = set().union(*(resources[other] for other in running))
+            if resources[key] & held:
+                continue
+            pending.remove(key)
+            process, report_dir, output = start_suite(key, live)
+            running[key] = (process, report_dir, output, time.time())
+            threading.Thread(target=wait, args=(key, process), daemon=True).start()
+            where = '' if live else f" -> {(report_dir / 'output.log').relative_to(PROJECT_ROOT)}"
+            print(f"[{_timestamp()}] ▶ {SUITES[key]['name']} started "
+                  f"(~{_duration(estimates[key])} expected, PID {process.pid}){where}")
+        if not running:
+            # Nothing can start and nothing will finish: an 'after' cycle or unknown suite
+            for key in pending:
+                print(f"[{_timestamp()}] ERROR: {SUITES[key]['name']} can't start (check 'after' in SUITES)")
+                results[key] = {'status': 'NOT RUN', 'exit_code': None, 'seconds': 0.0, 'counts': None, 'output': None}
+            break
+        key = finished.get()
+        process, report_dir, output, started = running.pop(key)
+        if output:
+            output.close()
+        seconds = time.time() - started
+        results[key] = {
+            'status': 'PASSED' if process.returncode == 0 else 'FAILED',
+            'exit_code': process.returncode,
+            'seconds': seconds,
+            'counts': read_junit_counts(report_dir / 'junit.xml'),
+            'output': None if live else report_dir / 'output.log',
+        }
+        print(f"[{_timestamp()}] {'✅' if process.returncode == 0 else '❌'} {SUITES[key]['name']} "
+              f"finished in {_duration(seconds)} (exit code {process.returncode})")
+    return {key: results[key] for key in keys if key in results}
+
+
+def print_summary(results, wall_seconds):
+    """Combined summary of all suites."""
+    print("\n\n" + "=" * 80)
+    print("TEST EXECUTION SUMMARY".center(80))
+    print("=" * 80)
+    print(f"{'Suite':<30} {'Status':<8} {'Passed':>7} {'Failed':>7} {'Skipped':>8} {'Time':>10}")
+    print("-" * 80)
+    totals = {'tests': 0, 'failures': 0, 'errors': 0, 'skipped': 0}
+    for key, result in results.items():
+        counts = result['counts']
+        if counts:
+            for field in totals:
+                totals[field] += counts[field]
+            failed = counts['failures'] + counts['errors']
+            passed = counts['tests'] - failed - counts['skipped']
+            columns = f"{passed:>7} {failed:>7} {counts['skipped']:>8}"
+        else:
+            columns = f"{'-':>7} {'-':>7} {'-':>8}"
+        print(f"{SUITES[key]['name']:<30} {result['status']:<8} {columns} {_duration(result['seconds']):>10}")
+    print("-" * 80)
+    failed = totals['failures'] + totals['errors']
+    passed = totals['tests'] - failed - totals['skipped']
+    suite_seconds = sum(result['seconds'] for result in results.values())
+    print(f"{'TOTAL':<30} {'':<8} {passed:>7} {failed:>7} {totals['skipped']:>8} {_duration(wall_seconds):>10}")
+    if wall_seconds > 0:
+        print(f"\nWall time {_duration(wall_seconds)} for {_duration(suite_seconds)} of suites "
+              f"({suite_seconds / wall_seconds:.1f}x)")
+    outputs = [result['output'] for result in results.values() if result['output']]
+    if outputs:
+        print(f"Suite output: {REPORTS_DIR.relative_to(PROJECT_ROOT)}/<suite>/output.log")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    # Show the plan without running anything
+    estimates = {key: estimate_seconds(key) for key in SUITES}
+    chains = critical_path_seconds(list(SUITES), estimates)
+    for key in sorted(SUITES, key=lambda key: -chains[key]):
+        print(f"{SUITES[key]['name']:<30} ~{_duration(estimates[key]):>8}  after={SUITES[key].get('after', [])}  "
+              f"resources={sorted(suite_resources(key))}")
@@ -0,0 +1,259 @@
+"""
+Test Discovery - Shared, cached discovery of pytest test functions.
+
+Parses test files with `ast` (no imports, no pytest collection) and caches the
+result per file keyed by (mtime_ns, size), so the dashboard and the log history
+API don't re-read multi-thousand-line test modules on every call. The cache is
+persisted to logs/.test_discovery_cache.json for cold starts.
+
+node_index() maps every test name to its pytest node ID(s) so runners can select
+a test exactly (`pytest tests/x.py::test_y`) instead of with `-k`.
+
+Each discovered test is a dict:
+    {'name': 'test_t1_01_home_page', 'line': 370, 'class': None,
+     'markers': ['T1_01_EMP', 'employer'], 'fixtures': ['employer1_page', ...],
+     'resources': [],  # from @pytest.mark.resources("prod_db", ...), see utils/test_resources.py
+     'title': 'T1.01 Home Page - Verify home page elements'}
+"""
+
+import ast
+import json
+import os
+import threading
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+TESTS_DIR = PROJECT_ROOT / 'tests'  # pytest.ini testpaths
+DISCOVERY_CACHE_FILE = PROJECT_ROOT / 'logs' / '.test_discovery_cache.json'
+DISCOVERY_CACHE_VERSION = 2
+
+# path -> {'signature': [size, mtime_ns], 'tests': [...]}
+_DISCOVERY_CACHE = {}
+_DISCOVERY_LOCK = threading.Lock()
+_persisted_loaded = False
+
+# tests dir -> {'signature': [(path, size, mtime_ns), ...], 'index': {name: [test, ...]}}
+_NODE_INDEX = {}
+_NODE_INDEX_LOCK = threading.Lock()
+
+
+def _marker_name(decorator):
+    """Return 'name' for @pytest.mark.name / @pytest.mark.name(...), else None."""
+    if isinstance(decorator, ast.Call):
+        decorator = decorator.func
+    if not isinstance(decorator, ast.Attribute):
+        return None
+    owner = decorator.value
+    if isinstance(owner, ast.Attribute) and owner.attr == 'mark':
+        return decorator.attr
+    if isinstance(owner, ast.Name) and owner.id == 'mark':
+        return decorator.attr
+    return None
+
+
+def _markers_of(decorators):
+    return [name for name in (_marker_name(d) for d in decorators) if name]
+
+
+def _declared_resources(decorators):
+    """String arguments of @pytest.mark.resources(...)."""
+    return [
+        arg.value
+        for decorator in decorators
+        if isinstance(decorator, ast.Call) and _marker_name(decorator) == 'resources'
+        for arg in decorator.args
+        if isinstance(arg, ast.Constant) and isinstance(arg.value, str)
+    ]
+
+
+def _pytestmark(tree):
+    """Marks applied to every test via a module-level `pytestmark = ...`."""
+    marks = []
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == 'pytestmark' for target in node.targets
+        ):
+            marks.extend(node.value.elts if isinstance(node.value, (ast.List, ast.Tuple)) else [node.value])
+    return marks
+
+
+def _test_entry(func, class_name, inherited_markers, inherited_resources):
+    fixtures = [arg.arg for arg in func.args.posonlyargs + func.args.args + func.args.kwonlyargs]
+    if class_name and fixtures and fixtures[0] == 'self':
+        fixtures = fixtures[1:]
+    docstring = ast.get_docstring(func)
+    title = docstring.strip().splitlines()[0].strip() if docstring and docstring.strip() else ''
+    return {
+        'name': func.name,
+        'line': func.lineno,
+        'class': class_name,
+        'markers': inherited_markers + _markers_of(func.decorator_list),
+        'fixtures': fixtures,
+        'resources': inherited_resources + _declared_resources(func.decorator_list),
+        'title': title,
+    }
+
+
+def parse_test_file(path):
+    """Parse one test file and return its tests (module-level test_* functions and Test* class methods)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    tree = ast.parse(source, filename=str(path))
+    module_marks = _pytestmark(tree)
+    module_markers = _markers_of(module_marks)
+    module_resources = _declared_resources(module_marks)
+    tests = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith('test_'):
+            tests.append(_test_entry(node, None, module_markers, module_resources))
+        elif isinstance(node, ast.ClassDef) and node.name.startswith('Test'):
+            class_markers = module_markers + _markers_of(node.decorator_list)
+            class_resources = module_resources + _declared_resources(node.decorator_list)
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) and item.name.startswith('test_'):
+                    tests.append(_test_entry(item, node.name, class_markers, class_resources))
+    return tests
+
+
+def _load_persisted_cache():
+    global _persisted_loaded
+    _persisted_loaded = True
+    try:
+        with open(DISCOVERY_CACHE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict) and data.get('version') == DISCOVERY_CACHE_VERSION:
+            _DISCOVERY_CACHE.update(data.get('files', {}))
+    except (OSError, ValueError):
+        pass
+
+
+def _save_persisted_cache():
+    try:
+        DISCOVERY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # Own temp file per writer: servers, dashboards and pytest sessions share this cache
+        tmp_path = DISCOVERY_CACHE_FILE.with_name(
+            f"{DISCOVERY_CACHE_FILE.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': DISCOVERY_CACHE_VERSION, 'files': _DISCOVERY_CACHE}, f)
+            os.replace(tmp_path, DISCOVERY_CACHE_FILE)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise
+    except OSError as e:
+        print(f"Warning: Could not save test discovery cache: {e}")
+
+
+def discover_tests(path):
+    """Return the tests defined in a test file, re-parsing only when it changed.
+
+    Returns [] if the file doesn't exist or can't be parsed.
+    """
+    key = str(Path(path).resolve())
+    try:
+        stat = os.stat(key)
+    except OSError:
+        return []
+    signature = [stat.st_size, stat.st_mtime_ns]
+
+    with _DISCOVERY_LOCK:
+        if not _persisted_loaded:
+            _load_persisted_cache()
+        cached = _DISCOVERY_CACHE.get(key)
+        if cached and cached.get('signature') == signature:
+            return cached['tests']
+        try:
+            tests = parse_test_file(key)
+        except (OSError, SyntaxError, ValueError) as e:
+            print(f"Warning: Could not discover tests in {path}: {e}")
+            return []
+        _DISCOVERY_CACHE[key] = {'signature': signature, 'tests': tests}
+        _save_persisted_cache()
+        return tests
+
+
+def discover_test_names(path):
+    """Return just the test function names defined in a test file."""
+    return [test['name'] for test in discover_tests(path)]
+
+
+def node_id(path, test):
+    """pytest node ID for a discovered test, relative to the project root."""
+    try:
+        relative = Path(path).resolve().relative_to(PROJECT_ROOT.resolve()).as_posix()
+    except ValueError:
+        relative = Path(path).as_posix()
+    return '::'.join(part for part in (relative, test['class'], test['name']) if part)
+
+
+def _test_files(tests_dir):
+    return sorted(Path(tests_dir).rglob('test_*.py'))
+
+
+def _test_index(tests_dir):
+    """{test_name: [test, ...]} for every test under tests_dir, each test with its 'node_id'.
+
+    Rebuilt only when a test file is added, removed or changed (checked with one
+    stat per file); unchanged files come from the discovery cache.
+    """
+    files = _test_files(tests_dir)
+    signature = []
+    for path in files:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        signature.append((str(path), stat.st_size, stat.st_mtime_ns))
+    key = str(Path(tests_dir).resolve())
+    with _NODE_INDEX_LOCK:
+        cached = _NODE_INDEX.get(key)
+        if cached and cached['signature'] == signature:
+            return cached['index']
+    index = {}
+    for path in files:
+        for test in discover_tests(path):
+            index.setdefault(test['name'], []).append(dict(test, node_id=node_id(path, test)))
+    with _NODE_INDEX_LOCK:
+        _NODE_INDEX[key] = {'signature': signature, 'index': index}
+    return index
+
+
+def node_index(tests_dir=TESTS_DIR):
+    """{test_name: [node_id, ...]} for every test under tests_dir."""
+    return {name: [test['node_id'] for test in tests] for name, tests in _test_index(tests_dir).items()}
+
+
+def find_tests(test_name, tests_dir=TESTS_DIR):
+    """Discovered tests called test_name under tests_dir (usually one), each with its 'node_id'."""
+    return list(_test_index(tests_dir).get(test_name, []))
+
+
+def find_node_ids(test_name, tests_dir=TESTS_DIR):
+    """Node IDs of the tests called test_name under tests_dir (usually one)."""
+    return [test['node_id'] for test in find_tests(test_name, tests_dir)]
+
+
+def pytest_selection(test_names, tests_dir=TESTS_DIR):
+    """pytest arguments that select exactly these tests.
+
+    Node IDs make pytest collect only the files involved, instead of the whole
+    tests/ tree that `-k` has to collect to filter, and can't substring-match
+    other tests. Names that aren't found fall back to `-k`.
+    """
+    if isinstance(test_names, str):
+        test_names = [test_names]
+    node_ids = [find_node_ids(name, tests_dir) for name in test_names]
+    if all(node_ids):
+        return [node_id for ids in node_ids for node_id in ids]
+    missing = [name for name, ids in zip(test_names, node_ids) if not ids]
+    print(f"Warning: No test file defines {missing}; selecting with -k instead of node IDs")
+    return ['-k', ' or '.join(test_names)]
+
+
+if __name__ == '__main__':
+    import sys
+    for name in sys.argv[1:]:
+        print(f"{name}: {find_node_ids(name) or 'not found'}")
@@ -2,13 +2,96 @@
 Enhanced Test Logger - Robot Framework style logging
 Provides clear, structured logging similar to Robot Framework
 """
+import json
 import logging
+import os
 import time
 from datetime import datetime
 from functools import wraps
+from pathlib import Path
 from typing import Optional, Dict, List
 
 
+# "Result committed" handshake: once a TEST result line is written, the module
+# log files are flushed + fsynced and the lane's commit file is atomically
+# replaced with the next sequence number. Dashboard/runner code checks (or waits
+# for) the sequence instead of sleeping and hoping the log is on disk.
+# Each lane (PYTEST_LANE: always-on server lanes, parallel suites) has its own
+# file: a lane runs one pytest session at a time, so its sequence has a single
+# writer, and a runner can't mistake another lane's commit for its own.
+RESULT_COMMIT_FILE = Path(__file__).resolve().parent.parent / 'logs' / '.result_commit.json'
+
+
+def result_commit_file(lane=None) -> Path:
+    """The commit file of a lane (default: this process's PYTEST_LANE; lane 1 keeps the original name)."""
+    lane = str(lane if lane is not None else os.getenv('PYTEST_LANE', '1'))
+    if lane == '1':
+        return RESULT_COMMIT_FILE
+    return RESULT_COMMIT_FILE.with_name(f".result_commit.lane{lane}.json")
+
+
+def read_result_commit(lane=None) -> Dict:
+    """Return the lane's latest result commit record ({'seq': 0} if nothing was committed yet)."""
+    try:
+        with open(result_commit_file(lane), 'r', encoding='utf-8') as f:
+            record = json.load(f)
+        if isinstance(record, dict) and isinstance(record.get('seq'), int):
+            return record
+    except (OSError, ValueError):
+        pass
+    return {'seq': 0}
+
+
+def wait_for_result_commit(after_seq: int, timeout: float = 5.0, poll_interval: float = 0.05,
+                           lane=None) -> Optional[Dict]:
+    """Wait until a result newer than `after_seq` is committed in the lane.
+
+    Returns the commit record, or None if nothing was committed within `timeout`.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        record = read_result_commit(lane)
+        if record['seq'] > after_seq:
+            return record
+        if time.monotonic() >= deadline:
+            return None
+        time.sleep(poll_interval)
+
+
+def commit_log_results(logger: logging.Logger, test_name: str = None, status: str = None) -> Dict:
+    """Flush + fsync every file handler on `logger`, then publish a new commit record for this lane."""
+    log_files = []
+    for handler in logger.handlers:
+        try:
+            handler.flush()
+            stream = getattr(handler, 'stream', None)
+            if isinstance(handler, logging.FileHandler) and stream is not None:
+                os.fsync(stream.fileno())
+                log_files.append(handler.baseFilename)
+        except (OSError, ValueError):
+            pass
+
+    record = {
+        'seq': read_result_commit()['seq'] + 1,
+        'test': test_name,
+        'status': status,
+        'logs': log_files,
+        'pid': os.getpid(),
+        'lane': os.getenv('PYTEST_LANE', '1'),
+        'committed_at': datetime.now().isoformat(),
+    }
+    commit_file = result_commit_file()
+    try:
+        commit_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = commit_file.with_name(f"{commit_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(record, f)
+        os.replace(tmp_file, commit_file)
+    except OSError:
+        pass
+    return record
+
+
 class TestLogger:
     """Enhanced logger with Robot Framework-style formatting"""
     
@@ -72,6 +155,9 @@ class TestLogger:
             if message:
                 self.logger.info(f"Message: {message}")
             
+            # Make the result durable and signal readers waiting on it
+            commit_log_results(self.logger, test_name, status_upper)
+            
             # Update statistics
             self.current_test['status'] = status_upper
             self.current_test['elapsed'] = elapsed_time
@@ -189,6 +275,7 @@ class TestLogger:
         
         # Log test statistics table
         self.log_test_statistics()
+        commit_log_results(self.logger)
     
     def log_test_statistics(self):
         """Log test statistics in table format"""
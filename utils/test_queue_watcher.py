@@ -2,8 +2,8 @@
 Test Queue Watcher - Watches for test execution requests from dashboard
 and runs them automatically without needing an HTTP server.
 
-This script runs in the background and watches a queue file.
-When the dashboard writes a test name to the queue, this script runs it.
+This script runs in the background and claims tests from the run queue
+(utils/run_queue.py). When the dashboard queues a test, this script runs it.
 
 Usage:
     python utils/test_queue_watcher.py
@@ -14,74 +14,20 @@ Or run it in the background:
 The script will keep running and watching for test requests.
 """
 
-import json
 import subprocess
 import sys
-import time
 import os
 from pathlib import Path
 from datetime import datetime
 
 # Get the project root directory
 PROJECT_ROOT = Path(__file__).parent.parent.resolve()
-QUEUE_FILE = PROJECT_ROOT / '.test_queue.json'
-LOCK_FILE = PROJECT_ROOT / '.test_queue.lock'
 
+sys.path.insert(0, str(PROJECT_ROOT))
+from utils import run_queue, test_discovery
 
-def read_queue():
-    """Read test queue from file."""
-    if not QUEUE_FILE.exists():
-        return []
-    
-    try:
-        with open(QUEUE_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data.get('queue', [])
-    except (json.JSONDecodeError, IOError):
-        return []
-
-
-def write_queue(queue):
-    """Write test queue to file."""
-    try:
-        with open(QUEUE_FILE, 'w', encoding='utf-8') as f:
-            json.dump({'queue': queue, 'last_updated': datetime.now().isoformat()}, f, indent=2)
-    except IOError as e:
-        print(f"Error writing queue: {e}", file=sys.stderr)
-
-
-def is_locked():
-    """Check if queue is currently being processed."""
-    if not LOCK_FILE.exists():
-        return False
-    
-    try:
-        # Check if lock file is stale (older than 5 minutes)
-        lock_age = time.time() - LOCK_FILE.stat().st_mtime
-        if lock_age > 300:  # 5 minutes
-            # Remove stale lock
-            LOCK_FILE.unlink()
-            return False
-        return True
-    except OSError:
-        return False
-
-
-def set_lock():
-    """Set lock file."""
-    try:
-        LOCK_FILE.touch()
-    except OSError:
-        pass
-
-
-def remove_lock():
-    """Remove lock file."""
-    try:
-        if LOCK_FILE.exists():
-            LOCK_FILE.unlink()
-    except OSError:
-        pass
+QUEUE_FILE = run_queue.QUEUE_FILE
+WORKER_ID = run_queue.worker_id('watcher')
 
 
 def run_test(test_name):
@@ -94,11 +40,11 @@ def run_test(test_name):
         # Change to project root
         os.chdir(PROJECT_ROOT)
         
-        # Build pytest command
+        # Build pytest command (exact node IDs, so only the test's own file is collected)
         cmd = [
             sys.executable,
             '-m', 'pytest',
-            '-k', test_name,
+            *test_discovery.pytest_selection(test_name),
             '-s', '-vv'
         ]
         
@@ -121,31 +67,18 @@ def run_test(test_name):
 
 
 def process_queue():
-    """Process test queue."""
-    if is_locked():
-        return
-    
-    queue = read_queue()
-    if not queue:
-        return
-    
-    set_lock()
-    
-    try:
-        # Process all queued tests
-        while queue:
-            test_name = queue.pop(0)
-            if test_name:
-                run_test(test_name)
-            
-            # Update queue file after each test
-            write_queue(queue)
-            
-            # Small delay between tests
-            if queue:
-                time.sleep(1)
-    finally:
-        remove_lock()
+    """Claim and run queued tests until none can be claimed. Returns how many ran."""
+    run_queue.import_queue_file()
+    count = 0
+    while True:
+        run = run_queue.claim(WORKER_ID)
+        if not run:
+            return count
+        try:
+            run_queue.execute(run, WORKER_ID, run_test)
+        except Exception as e:
+            print(f"Error running test '{run['test_name']}': {e}", file=sys.stderr)
+        count += 1
 
 
 def main():
@@ -155,7 +88,7 @@ def main():
 Test Queue Watcher
 {'='*60}
 Watching for test execution requests...
-Queue file: {QUEUE_FILE}
+Queue database: {run_queue.QUEUE_DB}
 Project root: {PROJECT_ROOT}
 
 The watcher will automatically run tests when requested from the dashboard.
@@ -163,13 +96,14 @@ Press Ctrl+C to stop.
 {'='*60}
 """)
     
+    run_queue.listen_for_changes()  # Wake-ups from other processes, if no server listens already
     try:
         while True:
-            process_queue()
-            time.sleep(0.5)  # Check queue every 0.5 seconds
+            seen = run_queue.change_count()
+            if not process_queue():
+                run_queue.wait_for_change(seen)  # Idle until a test is queued or a run finishes
     except KeyboardInterrupt:
         print("\n\nShutting down watcher...")
-        remove_lock()
         print("Watcher stopped.")
 
 
@@ -0,0 +1,134 @@
+"""
+Test Resources - What a queued test needs while it runs, for parallel execution lanes.
+
+The always-on server runs up to RUN_LANES pytest sessions at once. Two tests may
+only run side by side if they don't fight over something shared: the same login
+(logging an account in elsewhere can end its other session), the production
+database, or the same module log. Each test's resources are inferred from its
+fixtures, markers and file (via utils/test_discovery.py, no imports):
+
+    employer1_page / 'employer' marker   -> account:employer1
+    employer2_page                       -> account:employer2
+    admin_page / 'admin' marker          -> account:benchsale_admin
+    recruiter_page / 'recruiter' marker  -> account:benchsale_recruiter
+    'jobseeker' marker                   -> account:jobseeker
+    any browser fixture                  -> browser
+    'async_solr_check' marker            -> prod_db
+    its file                             -> log:<module log> (MODULE_LOGS)
+
+Account markers only count for tests that use a browser (the DB/Solr sync test is
+marked 'jobseeker' but never logs in). A test can also declare resources itself:
+
+    @pytest.mark.resources("prod_db", "account:employer2")
+
+Every resource is exclusive except 'browser', of which up to RUN_MAX_BROWSERS
+(default: one per lane) may be in use. A test that can't be found in tests/ (run
+with -k) gets '*' and runs alone.
+"""
+
+import os
+import sys
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.resolve()))
+from utils import test_discovery
+
+BROWSER = 'browser'
+EXCLUSIVE = '*'
+
+BROWSER_FIXTURES = {
+    'page', 'pw_browser', 'driver', 'admin_page', 'recruiter_page',
+    'employer1_page', 'employer2_page', 'jobseeker_page',
+}
+FIXTURE_RESOURCES = {
+    'admin_page': 'account:benchsale_admin',
+    'recruiter_page': 'account:benchsale_recruiter',
+    'employer1_page': 'account:employer1',
+    'employer2_page': 'account:employer2',
+    'jobseeker_page': 'account:jobseeker',
+}
+ACCOUNT_MARKERS = {
+    'admin': 'account:benchsale_admin',
+    'recruiter': 'account:benchsale_recruiter',
+    'employer': 'account:employer1',
+    'jobseeker': 'account:jobseeker',
+}
+MARKER_RESOURCES = {
+    'async_solr_check': 'prod_db',
+}
+# Logs a test file's session writes, by path: BenchSale_Conftest.py picks the admin,
+# recruiter or employer log from the command line, anything else goes to its combined
+# benchsale_test.log, and the jobseeker directory also writes jobseeker.log
+MODULE_LOGS = {
+    'tests/benchsale/test_benchsale_admin_test_cases.py': ['benchsale_admin.log'],
+    'tests/benchsale/test_benchsale_recruiter_test_cases.py': ['benchsale_recruiter.log'],
+    'tests/employer/': ['employer.log'],
+    'tests/jobseeker/': ['jobseeker.log', 'benchsale_test.log'],
+}
+DEFAULT_LOGS = ['benchsale_test.log']
+
+
+def browser_capacity(lanes):
+    """How many lanes may have a browser open at once."""
+    return int(os.getenv('RUN_MAX_BROWSERS', str(lanes)))
+
+
+def module_logs(test_file):
+    """Log files written while tests from test_file (a path relative to the project) run."""
+    test_file = test_file.replace('\\', '/')
+    for path, logs in MODULE_LOGS.items():
+        if test_file == path or (path.endswith('/') and test_file.startswith(path)):
+            return logs
+    return DEFAULT_LOGS
+
+
+def resources_for(test_name):
+    """Set of resources a queued test holds while it runs."""
+    tests = test_discovery.find_tests(test_name)
+    if not tests:
+        return {EXCLUSIVE}
+    resources = set()
+    for test in tests:
+        fixtures = set(test['fixtures'])
+        markers = set(test['markers'])
+        resources.update('log:' + log for log in module_logs(test['node_id'].split('::', 1)[0]))
+        resources.update(test.get('resources', []))
+        resources.update(FIXTURE_RESOURCES[f] for f in fixtures if f in FIXTURE_RESOURCES)
+        resources.update(MARKER_RESOURCES[m] for m in markers if m in MARKER_RESOURCES)
+        if fixtures & BROWSER_FIXTURES:
+            resources.add(BROWSER)
+            if not fixtures & set(FIXTURE_RESOURCES):
+                resources.update(ACCOUNT_MARKERS[m] for m in markers if m in ACCOUNT_MARKERS)
+    return resources
+
+
+def conflicts(test_name, running_sessions, max_browsers=1):
+    """Resources that keep test_name from starting next to the running sessions.
+
+    running_sessions is a list of test-name lists, one per running pytest session
+    (a batch shares one browser). Returns an empty set if the test can start.
+    """
+    wanted = resources_for(test_name)
+    in_use = Counter()
+    for session in running_sessions:
+        in_use.update(set().union(*(resources_for(name) for name in session)))
+    if not in_use:
+        return set()
+    if EXCLUSIVE in wanted or EXCLUSIVE in in_use:
+        return {EXCLUSIVE}
+    blocked = {resource for resource in wanted if resource != BROWSER and in_use[resource]}
+    if BROWSER in wanted and in_use[BROWSER] >= max_browsers:
+        blocked.add(BROWSER)
+    return blocked
+
+
+def admission(lanes):
+    """admit(test_name, running_sessions) rule for run_queue.claim_batch."""
+    max_browsers = browser_capacity(lanes)
+    return lambda test_name, running_sessions: not conflicts(test_name, running_sessions, max_browsers)
+
+
+if __name__ == '__main__':
+    for name in sys.argv[1:]:
+        print(f"{name}: {sorted(resources_for(name))}")
@@ -7,7 +7,7 @@ Usage:
 
 The server will:
 1. Accept HTTP POST requests to /run-test
-2. Watch for test requests in .test_queue.json file
+2. Claim test requests from the run queue (utils/run_queue.py; .test_queue.json is still read as an inbox)
 3. Run tests automatically when requested
 
 Then open the dashboard HTML file in a browser and click "Run Test" buttons.
@@ -26,79 +26,36 @@ from datetime import datetime
 
 # Get the project root directory
 PROJECT_ROOT = Path(__file__).parent.parent.resolve()
-QUEUE_FILE = PROJECT_ROOT / '.test_queue.json'
-LOCK_FILE = PROJECT_ROOT / '.test_queue.lock'
 
+sys.path.insert(0, str(PROJECT_ROOT))
+from utils import run_queue, test_discovery, warm_pytest_worker
 
-def read_queue():
-    """Read test queue from file."""
-    if not QUEUE_FILE.exists():
-        return []
-    
-    try:
-        with open(QUEUE_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data.get('queue', [])
-    except (json.JSONDecodeError, IOError):
-        return []
-
-
-def write_queue(queue):
-    """Write test queue to file."""
-    try:
-        with open(QUEUE_FILE, 'w', encoding='utf-8') as f:
-            json.dump({'queue': queue, 'last_updated': datetime.now().isoformat()}, f, indent=2)
-    except IOError:
-        pass
-
-
-def add_to_queue(test_name):
-    """Add test to queue file."""
-    queue = read_queue()
-    if test_name not in queue:
-        queue.append(test_name)
-        write_queue(queue)
-
-
-def is_locked():
-    """Check if queue is currently being processed."""
-    if not LOCK_FILE.exists():
-        return False
-    try:
-        lock_age = time.time() - LOCK_FILE.stat().st_mtime
-        if lock_age > 300:  # 5 minutes - stale lock
-            LOCK_FILE.unlink()
-            return False
-        return True
-    except OSError:
-        return False
-
-
-def set_lock():
-    """Set lock file."""
-    try:
-        LOCK_FILE.touch()
-    except OSError:
-        pass
-
-
-def remove_lock():
-    """Remove lock file."""
-    try:
-        if LOCK_FILE.exists():
-            LOCK_FILE.unlink()
-    except OSError:
-        pass
+QUEUE_FILE = run_queue.QUEUE_FILE
+WORKER_ID = run_queue.worker_id('runner')
 
 
 def run_test_command(test_name):
     """Run a pytest test command."""
+    # Use the warm pytest worker when it is running and the test resolves to exact node IDs
+    selection = test_discovery.pytest_selection(test_name)
+    node_ids = selection if selection[0] != '-k' else []
+    if node_ids and warm_pytest_worker.is_available():
+        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Running test in warm worker: {node_ids}")
+        response = warm_pytest_worker.run_tests(node_ids)
+        if response is not None:
+            # After a mid-session drop the test may have run: report it failed instead of running it again
+            if response.get('error'):
+                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Lost the warm worker during test '{test_name}': {response['error']}")
+            else:
+                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Test '{test_name}' completed with exit code: {response['exit_code']}")
+            return response['outcomes'].get(test_name) == 'passed'
+    
     try:
         os.chdir(PROJECT_ROOT)
         cmd = [
             sys.executable,
             '-m', 'pytest',
-            '-k', test_name,
+            *selection,
             '-s', '-vv'
         ]
         
@@ -142,26 +99,18 @@ def run_test_command(test_name):
 
 
 def process_queue():
-    """Process test queue from file."""
-    if is_locked():
-        return
-    
-    queue = read_queue()
-    if not queue:
-        return
-    
-    set_lock()
-    
-    try:
-        while queue:
-            test_name = queue.pop(0)
-            if test_name:
-                run_test_command(test_name)
-            write_queue(queue)
-            if queue:
-                time.sleep(1)
-    finally:
-        remove_lock()
+    """Claim and run queued tests until none can be claimed. Returns how many ran."""
+    run_queue.import_queue_file()
+    count = 0
+    while True:
+        run = run_queue.claim(WORKER_ID)
+        if not run:
+            return count
+        try:
+            run_queue.execute(run, WORKER_ID, run_test_command)
+        except Exception as e:
+            print(f"Error running test '{run['test_name']}': {e}", file=sys.stderr)
+        count += 1
 
 
 class TestRunnerHandler(BaseHTTPRequestHandler):
@@ -189,15 +138,10 @@ class TestRunnerHandler(BaseHTTPRequestHandler):
                     self.send_error_response(400, 'Test name is required')
                     return
                 
-                # Add to queue and run in background thread
-                add_to_queue(test_name)
-                
-                def run_test():
-                    run_test_command(test_name)
-                
-                # Start test in background thread
-                thread = threading.Thread(target=run_test, daemon=True)
-                thread.start()
+                # Only enqueue; the queue watcher thread runs it (so it runs exactly once)
+                run_id, created = run_queue.enqueue(test_name, source='http')
+                message = (f'Test "{test_name}" added to queue and will run shortly' if created
+                           else f'Test "{test_name}" is already queued or running')
                 
                 # Send success response
                 self.send_response(200)
@@ -206,7 +150,7 @@ class TestRunnerHandler(BaseHTTPRequestHandler):
                 self.end_headers()
                 response = json.dumps({
                     'success': True,
-                    'message': f'Test "{test_name}" is running in the background'
+                    'message': message
                 })
                 self.wfile.write(response.encode('utf-8'))
                 
@@ -258,11 +202,12 @@ class TestRunnerHandler(BaseHTTPRequestHandler):
 
 
 def watch_queue_loop():
-    """Background thread to watch file queue."""
+    """Background thread that runs queued tests, woken by run_queue change notifications."""
     while True:
         try:
-            process_queue()
-            time.sleep(0.5)  # Check queue every 0.5 seconds
+            seen = run_queue.change_count()
+            if not process_queue():
+                run_queue.wait_for_change(seen)  # Idle until a test is queued or a run finishes
         except Exception as e:
             print(f"Error in queue watcher: {e}", file=sys.stderr)
             time.sleep(1)
@@ -274,6 +219,7 @@ def run_server(port=8765):
     httpd = HTTPServer(server_address, TestRunnerHandler)
     
     # Start file queue watcher in background thread
+    run_queue.listen_for_changes()  # Wake-ups from other processes, if no other server listens already
     queue_watcher = threading.Thread(target=watch_queue_loop, daemon=True)
     queue_watcher.start()
     
@@ -283,14 +229,14 @@ Test Runner Server
 {'='*60}
 Server running on http://localhost:{port}
 File queue watcher: Active
-Queue file: {QUEUE_FILE}
+Queue database: {run_queue.QUEUE_DB}
 
 Open your dashboard HTML file in a browser.
 Click "Run Test" buttons to execute tests.
 
 The server supports both:
 - HTTP requests (via dashboard)
-- File queue (via .test_queue.json)
+- File queue (via {QUEUE_FILE.name} or python utils/run_queue.py add <test>)
 
 Press Ctrl+C to stop the server.
 {'='*60}
@@ -301,7 +247,6 @@ Press Ctrl+C to stop the server.
     except KeyboardInterrupt:
         print("\n\nShutting down server...")
         httpd.shutdown()
-        remove_lock()
         print("Server stopped.")
 
 
@@ -0,0 +1,100 @@
+"""
+Warm Browser - Playwright browser kept open across pytest sessions by the warm worker.
+
+utils/warm_pytest_worker.py runs many pytest sessions in one process. Normally the
+pw_browser fixture in BenchSale_Conftest.py launches Chrome at the start of a
+session and closes it at the end; inside the worker it uses the browser held here
+instead, and hands a browser it had to launch itself over to this module rather
+than closing it. Every test still gets its own browser context, so tests stay
+isolated from each other.
+
+Outside the worker (PYTEST_WARM_WORKER unset) nothing is held here and the
+fixture behaves as before.
+"""
+
+import os
+
+WARM_WORKER_ENV = 'PYTEST_WARM_WORKER'
+
+_playwright = None
+_browser = None
+
+
+def enabled() -> bool:
+    """True inside the warm pytest worker process."""
+    return os.getenv(WARM_WORKER_ENV) == '1'
+
+
+def launch_options(maximize: bool = None, window_size: str = None, window_pos: str = None) -> dict:
+    """chromium.launch() options shared by the pw_browser fixture and the worker."""
+    if maximize is None:
+        maximize = os.getenv("MAXIMIZE_BROWSER", "1").strip().lower() in ("1", "true", "yes", "on")
+    if window_size is None:
+        window_size = os.getenv("PW_WINDOW_SIZE", "").strip()
+    if window_pos is None:
+        window_pos = os.getenv("PW_WINDOW_POS", "").strip()
+    args = []
+    if maximize:
+        args.append("--start-maximized")
+    else:
+        # If size/pos are provided, apply them; otherwise keep a normal window
+        # so Windows Snap (Win+Left/Right) can dock it beside the editor.
+        if window_size:
+            args.append(f"--window-size={window_size}")
+        if window_pos:
+            args.append(f"--window-position={window_pos}")
+    # Use Chrome channel instead of Chromium for better compatibility
+    return {'channel': 'chrome', 'headless': False, 'args': args}
+
+
+def current():
+    """The held browser if it is still connected, else None."""
+    global _browser
+    if _browser is None:
+        return None
+    try:
+        if _browser.is_connected():
+            return _browser
+    except Exception:
+        pass
+    _browser = None
+    return None
+
+
+def playwright():
+    """The worker's Playwright instance, started on first use and kept running."""
+    global _playwright
+    if _playwright is None:
+        from playwright.sync_api import sync_playwright
+        _playwright = sync_playwright().start()
+    return _playwright
+
+
+def adopt(browser):
+    """Keep a browser open for later sessions."""
+    global _browser
+    _browser = browser
+
+
+def launch():
+    """Launch the browser now, so the first test doesn't wait for it."""
+    if current() is None:
+        adopt(playwright().chromium.launch(**launch_options()))
+    return _browser
+
+
+def close():
+    """Close the held browser and stop Playwright (worker shutdown)."""
+    global _playwright, _browser
+    if _browser is not None:
+        try:
+            _browser.close()
+        except Exception:
+            pass
+        _browser = None
+    if _playwright is not None:
+        try:
+            _playwright.stop()
+        except Exception:
+            pass
+        _playwright = None
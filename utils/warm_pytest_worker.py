@@ -0,0 +1,322 @@
+"""
+Warm Pytest Worker - Long-lived process that runs queued tests in-process.
+
+A cold `python -m pytest` for one dashboard-triggered test spends most of its
+time before the first browser action: process spawn, importing pytest,
+Selenium and Playwright, collection, starting Playwright and launching Chrome.
+This worker pays that once. It keeps the third-party imports loaded and the
+browser open (see utils/warm_browser.py), and runs each request as a fresh
+pytest session with pytest.main() in the same process.
+
+Project modules (conftests, test modules, utils) are dropped from sys.modules
+before every session, so each session imports them fresh - log routing, the
+TestLogger statistics and test-file edits behave exactly as in a new process.
+Each test still gets its own browser context.
+
+always_on_server.py and test_runner_server.py send node IDs here when the worker
+is running and fall back to a pytest subprocess when it isn't. If the connection
+drops mid-session, the tests are reported as failed rather than run again.
+
+Protocol (127.0.0.1:WARM_WORKER_PORT, one request per connection):
+    request:   {"node_ids": ["tests/x.py::test_y", ...]}\\n   or   {"ping": true}\\n
+    response:  one JSON object per line, streamed as tests finish:
+               {"event": "result", "nodeid": ..., "test": ..., "outcome": "passed", "duration": 1.2}
+               {"event": "done", "exit_code": 0, "outcomes": {"test_y": "passed"}}
+
+Usage:
+    python utils/warm_pytest_worker.py [--port 8768] [--no-browser]
+"""
+
+import json
+import os
+import socket
+import socketserver
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+WORKER_HOST = '127.0.0.1'
+WORKER_PORT = int(os.getenv('WARM_WORKER_PORT', '8768'))
+PING_TIMEOUT = float(os.getenv('WARM_WORKER_PING_TIMEOUT', '0.5'))
+
+# Modules that must survive between sessions: the worker itself and the browser holder
+_KEEP_MODULES = {'__main__', 'utils', 'utils.warm_browser', 'utils.warm_pytest_worker'}
+
+
+def _timestamp():
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _outcome_rank(outcome):
+    return {'skipped': 0, 'passed': 1, 'failed': 2}.get(outcome, -1)
+
+
+def _test_name(nodeid):
+    """'tests/x.py::TestK::test_y[param]' -> 'test_y'"""
+    return nodeid.split('::')[-1].split('[', 1)[0]
+
+
+# -----------------------------
+# Client side (used by the runner servers)
+# -----------------------------
+
+def _request(payload, timeout):
+    conn = socket.create_connection((WORKER_HOST, WORKER_PORT), timeout=timeout)
+    conn.sendall((json.dumps(payload) + '\n').encode('utf-8'))
+    return conn
+
+
+def worker_pid():
+    """PID of the warm worker if one is listening (and idle enough to answer a ping), else None."""
+    try:
+        with _request({'ping': True}, PING_TIMEOUT) as conn:
+            line = conn.makefile('r', encoding='utf-8').readline()
+        event = json.loads(line)
+    except (OSError, ValueError):
+        return None
+    return event.get('pid') if event.get('event') == 'pong' else None
+
+
+def is_available() -> bool:
+    """True if a warm worker is listening (and idle enough to answer a ping)."""
+    return worker_pid() is not None
+
+
+class WarmSession:
+    """A pytest session sent to the warm worker.
+
+    Has the pid, poll() and returncode of a Popen (the pid is the worker's), so
+    the runners can track it and stop it like a pytest child process.
+    """
+
+    def __init__(self, conn, pid):
+        self.conn = conn
+        self.pid = pid
+        self.returncode = None
+        self.outcomes = {}
+        self.error = None
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, on_event=None):
+        """Read the streamed results until the session ends.
+
+        on_event(event) is called for every result. Returns {'exit_code': int,
+        'outcomes': {test_name: outcome}}. If the connection drops first, the
+        tests may have run (partly), so they must not simply be run again: the
+        result then has the outcomes streamed so far, exit code 3 (pytest's
+        INTERNAL_ERROR) and an 'error'.
+        """
+        try:
+            with self.conn:
+                for line in self.conn.makefile('r', encoding='utf-8'):
+                    event = json.loads(line)
+                    if event.get('event') == 'done':
+                        self.outcomes = event.get('outcomes', {})
+                        self.returncode = event['exit_code']
+                        return {'exit_code': self.returncode, 'outcomes': self.outcomes}
+                    if event.get('event') == 'error':
+                        raise ValueError(event.get('error'))
+                    name = event.get('test')
+                    if _outcome_rank(event.get('outcome')) >= _outcome_rank(self.outcomes.get(name)):
+                        self.outcomes[name] = event.get('outcome')
+                    if on_event:
+                        on_event(event)
+            raise ConnectionError('the worker closed the connection before the session ended')
+        except (OSError, ValueError, KeyError) as e:
+            self.error = str(e) or type(e).__name__
+            print(f"[{_timestamp()}] Warm worker session lost: {self.error}", file=sys.stderr)
+        self.returncode = 3
+        return {'exit_code': self.returncode, 'outcomes': self.outcomes, 'error': self.error}
+
+
+def start_session(node_ids):
+    """Send node IDs to the warm worker. Returns a WarmSession, or None if no
+    worker took the request - then nothing ran and the caller can run the tests itself."""
+    pid = worker_pid()
+    if pid is None:
+        return None
+    try:
+        conn = _request({'node_ids': list(node_ids)}, PING_TIMEOUT)
+    except OSError as e:
+        print(f"[{_timestamp()}] Warm worker request failed: {e}", file=sys.stderr)
+        return None
+    conn.settimeout(None)  # A session takes as long as its tests
+    return WarmSession(conn, pid)
+
+
+def run_tests(node_ids, on_event=None):
+    """Run node IDs in the warm worker and wait for the session to finish.
+
+    Returns WarmSession.wait()'s result, or None if the worker could not be
+    reached (nothing was run).
+    """
+    session = start_session(node_ids)
+    if session is None:
+        return None
+    return session.wait(on_event)
+
+
+# -----------------------------
+# Worker side
+# -----------------------------
+
+class _ResultStream:
+    """pytest plugin that reports each test's outcome as soon as it is known."""
+
+    def __init__(self, send):
+        self.send = send
+        self.outcomes = {}
+
+    def pytest_runtest_logreport(self, report):
+        # The call phase decides the outcome; setup/teardown only when they fail or skip
+        if report.when != 'call' and report.passed:
+            return
+        outcome = 'failed' if report.failed else report.outcome
+        name = _test_name(report.nodeid)
+        if _outcome_rank(outcome) >= _outcome_rank(self.outcomes.get(name)):
+            self.outcomes[name] = outcome
+        self.send({'event': 'result', 'nodeid': report.nodeid, 'test': name,
+                   'when': report.when, 'outcome': outcome, 'duration': round(report.duration, 3)})
+
+
+def _is_project_module(module):
+    path = getattr(module, '__file__', None)
+    if not path:
+        return False
+    try:
+        path = Path(path).resolve()
+        path.relative_to(PROJECT_ROOT)
+    except (ValueError, OSError):
+        return False
+    return 'site-packages' not in path.parts  # e.g. a .venv inside the project stays loaded
+
+
+def reset_project_modules():
+    """Forget project modules so the next session imports conftests and tests fresh."""
+    removed = [name for name, module in list(sys.modules.items())
+               if name not in _KEEP_MODULES and _is_project_module(module)]
+    for name in removed:
+        del sys.modules[name]
+    return removed
+
+
+def run_session(node_ids, send):
+    """Run one pytest session in-process. Returns (exit_code, outcomes)."""
+    import pytest
+    reset_project_modules()
+    os.chdir(PROJECT_ROOT)
+    args = list(node_ids) + ['-s', '-vv', '--tb=short']
+    # The conftests pick their log file from the command line
+    saved_argv = sys.argv
+    sys.argv = ['pytest'] + args
+    stream = _ResultStream(send)
+    try:
+        exit_code = int(pytest.main(args, plugins=[stream]))
+    finally:
+        sys.argv = saved_argv
+    return exit_code, stream.outcomes
+
+
+class _WorkerHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        def send(event):
+            try:
+                self.wfile.write((json.dumps(event) + '\n').encode('utf-8'))
+                self.wfile.flush()
+            except OSError:
+                pass  # Client went away; keep running the session
+
+        try:
+            request = json.loads(self.rfile.readline().decode('utf-8') or '{}')
+        except ValueError:
+            send({'event': 'error', 'error': 'invalid request'})
+            return
+        if request.get('ping'):
+            send({'event': 'pong', 'pid': os.getpid(), 'sessions': self.server.sessions})
+            return
+        node_ids = request.get('node_ids') or []
+        if not node_ids:
+            send({'event': 'error', 'error': 'node_ids is required'})
+            return
+
+        started = time.time()
+        print(f"[{_timestamp()}] Running {len(node_ids)} test(s): {node_ids}")
+        try:
+            exit_code, outcomes = run_session(node_ids, send)
+        except Exception as e:
+            print(f"[{_timestamp()}] ERROR in pytest session: {e}", file=sys.stderr)
+            exit_code, outcomes = 3, {}  # pytest's INTERNAL_ERROR
+        self.server.sessions += 1
+        print(f"[{_timestamp()}] Session finished in {time.time() - started:.1f}s (exit code {exit_code}): {outcomes}")
+        send({'event': 'done', 'exit_code': exit_code, 'outcomes': outcomes})
+
+
+class WarmWorkerServer(socketserver.TCPServer):
+    """Single-threaded on purpose: Playwright's sync API must stay on one thread,
+    and only one session runs at a time (pings wait for a running session)."""
+    allow_reuse_address = True
+
+    def __init__(self, address):
+        super().__init__(address, _WorkerHandler)
+        self.sessions = 0
+
+
+def warm_up(launch_browser=True):
+    """Import the heavy dependencies (and launch the browser) before the first request."""
+    started = time.time()
+    os.environ['PYTEST_WARM_WORKER'] = '1'
+    # Same browser environment the always-on server gives its pytest subprocesses
+    os.environ['HEADLESS'] = '0'
+    os.environ.setdefault('MAXIMIZE_BROWSER', '1')
+    sys.path.insert(0, str(PROJECT_ROOT))
+    os.chdir(PROJECT_ROOT)
+    import pytest  # noqa: F401
+    for module in ('selenium.webdriver', 'playwright.sync_api', 'requests', 'webdriver_manager.chrome'):
+        try:
+            __import__(module)
+        except ImportError as e:
+            print(f"[{_timestamp()}] Warning: Could not pre-import {module}: {e}")
+    if launch_browser:
+        from utils import warm_browser
+        try:
+            warm_browser.launch()
+        except Exception as e:
+            print(f"[{_timestamp()}] Warning: Could not launch browser (tests will launch it): {e}")
+    print(f"[{_timestamp()}] Warm-up finished in {time.time() - started:.1f}s")
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description='Run the warm pytest worker')
+    parser.add_argument('--port', type=int, default=WORKER_PORT, help=f'Port to listen on (default: {WORKER_PORT})')
+    parser.add_argument('--no-browser', action='store_true', help='Do not launch the browser at startup')
+    args = parser.parse_args()
+
+    warm_up(launch_browser=not args.no_browser)
+    server = WarmWorkerServer((WORKER_HOST, args.port))
+    print(f"""
+{'='*60}
+Warm Pytest Worker
+{'='*60}
+Listening on {WORKER_HOST}:{args.port} (PID {os.getpid()})
+The always-on server sends queued tests here while this is running.
+Press Ctrl+C to stop.
+{'='*60}
+""")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n\nShutting down worker...")
+    finally:
+        server.server_close()
+        from utils import warm_browser
+        warm_browser.close()
+        print("Worker stopped.")
+
+
+if __name__ == '__main__':
+    main()